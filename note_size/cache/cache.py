@@ -2,10 +2,12 @@ import logging
 from abc import ABC, abstractmethod
 from logging import Logger
 from threading import RLock
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 log: Logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class Cache(ABC):
     def __init__(self):
@@ -29,6 +31,10 @@ class Cache(ABC):
         with self._lock:
             self.__initialized = initialized
 
+    def process_dict_list(self, processor: Callable[[list[dict[Any, Any]]], T]) -> T:
+        with self._lock:
+            return processor(self.as_dict_list())
+
     @abstractmethod
     def invalidate_cache(self) -> None:
         pass
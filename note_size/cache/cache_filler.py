@@ -0,0 +1,99 @@
+import logging
+from datetime import datetime
+from logging import Logger
+from typing import Optional
+
+from anki.collection import Collection
+from aqt.deckbrowser import DeckBrowser
+from aqt.operations import QueryOp
+from aqt.progress import ProgressManager
+from aqt.qt import QWidget
+from aqt.taskman import TaskManager
+
+from .cache_initializer_background import CacheInitializerBackground
+from .cache_manager import CacheManager
+from .cache_storage import CacheStorage
+from ..config.config import Config
+
+log: Logger = logging.getLogger(__name__)
+
+
+class CacheFiller:
+    __deck_browser_refresh_interval_sec: int = 5
+
+    def __init__(self, task_manager: TaskManager, progress_manager: ProgressManager, cache_storage: CacheStorage,
+                 cache_manager: CacheManager, deck_browser: DeckBrowser, parent: QWidget, config: Config):
+        self.__task_manager: TaskManager = task_manager
+        self.__progress_manager: ProgressManager = progress_manager
+        self.__cache_storage: CacheStorage = cache_storage
+        self.__cache_manager: CacheManager = cache_manager
+        self.__deck_browser: DeckBrowser = deck_browser
+        self.__parent: QWidget = parent
+        self.__config: Config = config
+        self.__cache_initializer_background: Optional[CacheInitializerBackground] = None
+        self.__generation: int = 0
+        self.__last_deck_browser_refresh: datetime = datetime.now()
+        log.debug(f"{self.__class__.__name__} was instantiated")
+
+    def start(self) -> None:
+        self.stop()
+        generation: int = self.__generation
+        log.info("Start filling cache in background")
+        self.__cache_initializer_background = CacheInitializerBackground(
+            self.__cache_storage, self.__cache_manager, self.__deck_browser, self.__task_manager, self.__config,
+            lambda label, value, max_value: None)
+        query_op: QueryOp[bool] = QueryOp(parent=self.__parent,
+                                          op=self.__cache_initializer_background.start_filling_caches,
+                                          success=lambda finished: self.__on_slice_done(generation, finished))
+        query_op.failure(self.__on_failure).run_in_background()
+
+    def stop(self) -> None:
+        self.__generation += 1
+        if self.__cache_initializer_background:
+            self.__cache_initializer_background.cancel()
+            self.__cache_initializer_background = None
+            log.info("Stop filling cache in background")
+
+    def __fill_next_slice(self, generation: int) -> None:
+        if generation != self.__generation:
+            log.debug("Skip outdated cache filling slice")
+            return
+        slice_millis: int = max(1, self.__config.get_cache_lazy_fill_slice_millis())
+        query_op: QueryOp[bool] = QueryOp(
+            parent=self.__parent,
+            op=lambda col: self.__fill_caches_slice(col, generation, slice_millis),
+            success=lambda finished: self.__on_slice_done(generation, finished))
+        query_op.failure(self.__on_failure).run_in_background()
+
+    def __fill_caches_slice(self, col: Collection, generation: int, slice_millis: int) -> bool:
+        cache_initializer_background: Optional[CacheInitializerBackground] = self.__cache_initializer_background
+        if generation != self.__generation or not cache_initializer_background:
+            return False
+        return cache_initializer_background.fill_caches_slice(col, slice_millis)
+
+    def __on_slice_done(self, generation: int, finished: bool) -> None:
+        if generation != self.__generation:
+            return
+        if finished:
+            self.__cache_initializer_background = None
+            self.__refresh_deck_browser()
+            return
+        now: datetime = datetime.now()
+        if (now - self.__last_deck_browser_refresh).total_seconds() >= self.__deck_browser_refresh_interval_sec:
+            self.__last_deck_browser_refresh = now
+            self.__refresh_deck_browser()
+        pause_millis: int = max(0, self.__config.get_cache_lazy_fill_pause_millis())
+        self.__progress_manager.single_shot(pause_millis, lambda: self.__fill_next_slice(generation),
+                                            requires_collection=False)
+
+    def __refresh_deck_browser(self) -> None:
+        # Deck Browser is rendered anyway when it is shown next time
+        if self.__deck_browser.mw.state == "deckBrowser":
+            self.__deck_browser.refresh()
+
+    def __on_failure(self, e: Exception) -> None:
+        log.error("Error during filling cache in background", exc_info=e)
+        self.__cache_initializer_background = None
+
+    def __del__(self):
+        log.debug(f"{self.__class__.__name__} was deleted")
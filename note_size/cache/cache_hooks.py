@@ -1,10 +1,10 @@
 import logging
 from datetime import datetime
 from logging import Logger
-from typing import Sequence, Callable
+from typing import Sequence, Callable, Optional
 
 from anki import hooks
-from anki.collection import Collection
+from anki.collection import Collection, OpChanges
 from anki.notes import NoteId, Note
 from aqt import gui_hooks
 
@@ -29,6 +29,8 @@ class CacheHooks:
         self.__hook_note_will_flush: Callable[[Note], None] = self.__on_note_will_flush
         self.__hook_profile_did_open: Callable[[], None] = self.__initialize_cache_on_profile_opening
         self.__hook_profile_will_close: Callable[[], None] = self.__save_cache_to_file
+        self.__hook_operation_did_execute: Callable[[OpChanges, Optional[object]], None] = \
+            self.__on_operation_did_execute
         log.debug(f"{self.__class__.__name__} was instantiated")
 
     def setup_hooks(self) -> None:
@@ -38,6 +40,7 @@ class CacheHooks:
         hooks.note_will_flush.append(self.__hook_note_will_flush)
         gui_hooks.profile_did_open.append(self.__hook_profile_did_open)
         gui_hooks.profile_will_close.append(self.__hook_profile_will_close)
+        gui_hooks.operation_did_execute.append(self.__hook_operation_did_execute)
         log.info(f"{self.__class__.__name__} are set")
 
     def remove_hooks(self) -> None:
@@ -47,14 +50,18 @@ class CacheHooks:
         hooks.note_will_flush.remove(self.__hook_note_will_flush)
         gui_hooks.profile_did_open.remove(self.__hook_profile_did_open)
         gui_hooks.profile_will_close.remove(self.__hook_profile_will_close)
+        gui_hooks.operation_did_execute.remove(self.__hook_operation_did_execute)
         log.info(f"{self.__class__.__name__} was removed")
 
     def __initialize_cache_on_profile_opening(self) -> None:
         self.__cache_manager.invalidate_caches()
         self.__cache_manager.set_caches_initialized(False)
         self.__cache_initializer.warmup_caches()
+        self.__cache_initializer.start_periodic_saving()
 
     def __save_cache_to_file(self) -> None:
+        self.__cache_initializer.stop_filling()
+        self.__cache_initializer.stop_periodic_saving()
         self.__cache_initializer.save_cache_to_file()
 
     def __on_note_will_flush(self, note: Note) -> None:
@@ -70,6 +77,13 @@ class CacheHooks:
         for note_id in note_ids:
             self.__cache_manager.evict_note(note_id)
 
+    def __on_operation_did_execute(self, changes: OpChanges, _: Optional[object]) -> None:
+        # Deck renames and template changes regroup notes without touching them
+        if changes.deck or changes.notetype:
+            self.__cache_manager.get_group_size_cache().mark_changed(groups_changed=True)
+        elif changes.card or changes.note or changes.tag or changes.note_text:
+            self.__cache_manager.get_group_size_cache().mark_changed(groups_changed=False)
+
     def __media_sync_did_start_or_stop(self, running: bool) -> None:
         log.info(f"MediaSyncDidStartOrStop: running={running}")
         if not running:
@@ -1,11 +1,14 @@
 import logging
+from concurrent.futures import Future
 from logging import Logger
+from typing import Optional
 
 from aqt.deckbrowser import DeckBrowser
 from aqt.progress import ProgressManager
-from aqt.qt import QWidget
+from aqt.qt import QWidget, QTimer
 from aqt.taskman import TaskManager
 
+from .cache_filler import CacheFiller
 from .cache_initializer_op import CacheInitializerOp
 from .cache_manager import CacheManager
 from .cache_storage import CacheStorage
@@ -25,24 +28,35 @@ class CacheInitializer:
         self.__task_manager: TaskManager = task_manager
         self.__progress_manager: ProgressManager = progress_manager
         self.__config: Config = config
+        self.__periodic_save_timer: Optional[QTimer] = None
+        self.__periodic_save_generation: int = 0
+        self.__cache_filler: CacheFiller = CacheFiller(task_manager, progress_manager, cache_storage, cache_manager,
+                                                       deck_browser, parent, config)
         log.debug(f"{self.__class__.__name__} was instantiated")
 
     def warmup_caches(self) -> None:
         log.info("Warmup caches if enabled")
         if self.__config.get_cache_warmup_enabled():
-            self.__initialize_caches(self.__parent, False)
+            if self.__config.get_cache_lazy_mode_enabled():
+                self.__cache_filler.start()
+            else:
+                self.__initialize_caches(self.__parent, False)
         else:
             log.info("Cache initialization is disabled")
 
     def refresh_caches(self, parent: QWidget) -> None:
         log.info("Refresh caches")
+        self.__cache_filler.stop()
         self.__cache_manager.invalidate_caches()
         self.__cache_storage.delete_cache_file()
         self.__initialize_caches(parent, True)
 
+    def stop_filling(self) -> None:
+        self.__cache_filler.stop()
+
     def save_cache_to_file(self) -> None:
         enabled: bool = self.__config.get_store_cache_in_file_enabled()
-        initialized: bool = self.__cache_manager.get_caches_initialized()
+        initialized: bool = self.__is_cache_saveable()
         if enabled and initialized:
             self.__cache_storage.save_caches_to_file(self.__cache_manager.get_caches())
         else:
@@ -50,6 +64,49 @@ class CacheInitializer:
                      f"store_cache_in_file_enabled={enabled}, caches_initialized={initialized}")
             self.__cache_storage.delete_cache_file()
 
+    def start_periodic_saving(self) -> None:
+        self.stop_periodic_saving()
+        interval_minutes: int = self.__config.get_store_cache_in_file_interval_minutes()
+        if self.__config.get_store_cache_in_file_enabled() and interval_minutes > 0:
+            log.info(f"Start saving cache file periodically: interval_minutes={interval_minutes}")
+            self.__periodic_save_timer = self.__progress_manager.timer(
+                interval_minutes * 60 * 1000, self.__save_cache_to_file_in_background, repeat=True,
+                requiresCollection=False, parent=self.__parent)
+        else:
+            log.info("Periodic saving of cache file is disabled")
+
+    def stop_periodic_saving(self) -> None:
+        self.__periodic_save_generation += 1
+        if self.__periodic_save_timer:
+            self.__periodic_save_timer.stop()
+            self.__periodic_save_timer.deleteLater()
+            self.__periodic_save_timer = None
+            log.info("Stop saving cache file periodically")
+
+    def __save_cache_to_file_in_background(self) -> None:
+        generation: int = self.__periodic_save_generation
+        if self.__is_cache_saveable():
+            self.__task_manager.run_in_background(lambda: self.__save_cache_to_file_periodically(generation),
+                                                  self.__on_periodic_save_done, uses_collection=False)
+        else:
+            log.debug("Skip periodic saving of cache file because caches are not initialized")
+
+    def __save_cache_to_file_periodically(self, generation: int) -> None:
+        if generation == self.__periodic_save_generation and self.__is_cache_saveable():
+            self.__cache_storage.save_caches_to_file(self.__cache_manager.get_caches())
+        else:
+            log.debug("Skip outdated periodic saving of cache file")
+
+    def __is_cache_saveable(self) -> bool:
+        # Partially filled caches are stamped with the collection state and are completed after reading
+        partially_filled: bool = len(self.__cache_manager.get_size_calculator().get_collection_stamps()) > 0
+        return self.__cache_manager.get_caches_initialized() or partially_filled
+
+    @staticmethod
+    def __on_periodic_save_done(future: Future) -> None:
+        if future.exception():
+            log.warning("Periodic saving of cache file failed", exc_info=future.exception())
+
     def __initialize_caches(self, parent: QWidget, show_success_info: bool) -> None:
         cache_initializer_op: CacheInitializerOp = CacheInitializerOp(
             self.__task_manager, self.__progress_manager, self.__cache_storage, self.__cache_manager,
@@ -1,15 +1,21 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from logging import Logger
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterator
 
 from anki.collection import Collection
+from anki.models import NotetypeId
+from anki.notes import NoteId
+from anki.utils import ids2str
 from aqt.deckbrowser import DeckBrowser
 from aqt.taskman import TaskManager
 
 from .cache_manager import CacheManager
 from .cache_storage import CacheStorage
 from .item_id_cache import ItemIdCache
+from .media_cache import MediaCache
 from .size_str_cache import SizeStrCache
 from ..calculator.size_calculator import SizeCalculator
 from ..config.config import Config
@@ -21,6 +27,9 @@ log: Logger = logging.getLogger(__name__)
 
 
 class CacheInitializerBackground:
+    __min_note_id: int = -2 ** 63
+    __racy_note_mod_window_ns: int = 2_000_000_000
+    __fill_chunk_size: int = 100
 
     def __init__(self, cache_storage: CacheStorage, cache_manager: CacheManager, deck_browser: DeckBrowser,
                  task_manager: TaskManager, config: Config,
@@ -34,18 +43,56 @@ class CacheInitializerBackground:
         self.__config: Config = config
         self.__update_progress_callback: Callable[[str, Optional[int], Optional[int]], None] = update_progress_callback
         self.__update_progress_step: int = update_progress_step
+        self.__fill_last_note_id: int = CacheInitializerBackground.__min_note_id
         log.debug(f"{self.__class__.__name__} was instantiated")
 
     def initialize_caches(self, col: Collection) -> int:
         self.__cache_manager.set_caches_initialized(False)
         result: int = 0
-        read_from_file_success: bool = self.__read_cache_from_file()
-        if not read_from_file_success:
+        complete_caches_read: bool = self.__read_cache_from_file() and self.__validate_caches(col)
+        if complete_caches_read:
+            self.__cache_manager.set_caches_initialized(True)
+        else:
             result = self.__initialize_caches(col)
         self.__task_manager.run_on_main(self.__deck_browser.refresh)
         return result
 
+    def start_filling_caches(self, col: Collection) -> bool:
+        self.__cache_manager.set_caches_initialized(False)
+        complete_caches_read: bool = self.__read_cache_from_file() and self.__validate_caches(col)
+        if complete_caches_read:
+            self.__cache_manager.set_caches_initialized(True)
+            return True
+        size_calculator: SizeCalculator = self.__cache_manager.get_size_calculator()
+        size_calculator.set_collection_stamps(*CacheInitializerBackground.__read_collection_stamps(col))
+        self.__cache_manager.get_media_cache().take_snapshot()
+        self.__fill_last_note_id = CacheInitializerBackground.__min_note_id
+        log.info(f"Cache filling started: cached_notes={size_calculator.get_cached_note_number()}")
+        return False
+
+    def fill_caches_slice(self, col: Collection, slice_millis: int) -> bool:
+        size_calculator: SizeCalculator = self.__cache_manager.get_size_calculator()
+        deadline: float = time.monotonic() + slice_millis / 1000
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="NoteSizeFiller") as executor:
+            while time.monotonic() < deadline:
+                if self.__wants_cancel:
+                    log.info(f"Cache filling was cancelled after note {self.__fill_last_note_id}")
+                    return False
+                notes: list[tuple[NoteId, NotetypeId, str, int]] = CacheInitializerBackground.__read_notes_chunk(
+                    col, self.__fill_last_note_id, self.__fill_chunk_size)
+                if not notes:
+                    self.__cache_manager.get_item_id_cache().initialize_cache()
+                    size_calculator.set_collection_stamps(*CacheInitializerBackground.__read_collection_stamps(col))
+                    self.__cache_manager.set_caches_initialized(True)
+                    log.info(f"Cache filling finished: cached_notes={size_calculator.get_cached_note_number()}")
+                    return True
+                self.__fill_last_note_id = notes[-1][0]
+                size_calculator.initialize_notes_in_caches(
+                    [note for note in notes if not size_calculator.is_note_cached(note[0])], executor)
+        return False
+
     def __initialize_caches(self, col) -> int:
+        media_cache: MediaCache = self.__cache_manager.get_media_cache()
         item_id_cache: ItemIdCache = self.__cache_manager.get_item_id_cache()
         size_calculator: SizeCalculator = self.__cache_manager.get_size_calculator()
         file_type_helper: FileTypeHelper = self.__cache_manager.get_file_type_helper()
@@ -56,25 +103,39 @@ class CacheInitializerBackground:
         note_number: int = col.note_count()
         processed_notes: int = 0
         self.__update_progress("Cache initializing", processed_notes, note_number)
-        for note_id, note_type_id, fields in col.db.execute("select id, mid, flds from notes"):
-            if self.__wants_cancel:
-                log.info(f"User cancelled notes cache initialization at {processed_notes}")
-                return processed_notes
-            self.__update_progress("Caching note sizes", processed_notes, note_number)
-            size_calculator.initialize_note_in_caches(note_id, note_type_id, fields)
-            for size_type in SizeType:
-                deck_browser_significant_digits: SignificantDigits = self.__config.get_deck_browser_significant_digits()
-                browser_significant_digits: SignificantDigits = self.__config.get_browser_significant_digits()
-                editor_significant_digits: SignificantDigits = self.__config.get_size_button_significant_digits()
-                size_str_cache.get_note_size_str(note_id, size_type, deck_browser_significant_digits, use_cache=True)
-                size_str_cache.get_note_size_str(note_id, size_type, browser_significant_digits, use_cache=True)
-                size_str_cache.get_note_size_str(note_id, size_type, editor_significant_digits, use_cache=True)
-                note_files: set[MediaFile] = size_calculator.get_note_files(note_id, use_cache=True)
-                for note_file in note_files:
-                    file_type_helper.get_file_type(note_file, use_cache=True)
-            processed_notes += 1
+        media_cache.take_snapshot()
+        chunk_size: int = max(1, self.__config.get_cache_warmup_chunk_size())
+        workers: int = max(1, self.__config.get_cache_warmup_workers())
+        log.info(f"Warming up caches in chunks: chunk_size={chunk_size}, workers={workers}")
+        deck_browser_significant_digits: SignificantDigits = self.__config.get_deck_browser_significant_digits()
+        browser_significant_digits: SignificantDigits = self.__config.get_browser_significant_digits()
+        editor_significant_digits: SignificantDigits = self.__config.get_size_button_significant_digits()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="NoteSizeWarmup") as executor:
+            for notes in self.__read_notes_in_chunks(col, chunk_size):
+                if self.__wants_cancel:
+                    log.info(f"User cancelled notes cache initialization at {processed_notes}")
+                    return processed_notes
+                size_calculator.initialize_notes_in_caches(
+                    [note for note in notes if not size_calculator.is_note_cached(note[0])], executor)
+                for note_id, _, _, _ in notes:
+                    if self.__wants_cancel:
+                        log.info(f"User cancelled notes cache initialization at {processed_notes}")
+                        return processed_notes
+                    self.__update_progress("Caching note sizes", processed_notes, note_number)
+                    for size_type in SizeType:
+                        size_str_cache.get_note_size_str(note_id, size_type, deck_browser_significant_digits,
+                                                         use_cache=True)
+                        size_str_cache.get_note_size_str(note_id, size_type, browser_significant_digits,
+                                                         use_cache=True)
+                        size_str_cache.get_note_size_str(note_id, size_type, editor_significant_digits,
+                                                         use_cache=True)
+                    note_files: set[MediaFile] = size_calculator.get_note_files(note_id, use_cache=True)
+                    for note_file in note_files:
+                        file_type_helper.get_file_type(note_file, use_cache=True)
+                    processed_notes += 1
         self.__update_progress("Caching card ids...", None, None)
         item_id_cache.initialize_cache()
+        size_calculator.set_collection_stamps(*CacheInitializerBackground.__read_collection_stamps(col))
         self.__cache_manager.set_caches_initialized(True)
         end_time: datetime = datetime.now()
         duration_sec: int = round((end_time - start_time).total_seconds())
@@ -91,11 +152,83 @@ class CacheInitializerBackground:
             read_from_file_success = self.__cache_storage.read_caches_from_file(self.__cache_manager.get_caches())
         else:
             log.info("Reading cache file is disabled")
-        if read_from_file_success:
-            self.__cache_manager.set_caches_initialized(True)
-        self.__cache_storage.delete_cache_file()
+            self.__cache_storage.delete_cache_file()
         return read_from_file_success
 
+    def __validate_caches(self, col: Collection) -> bool:
+        size_calculator: SizeCalculator = self.__cache_manager.get_size_calculator()
+        collection_stamps: dict[str, int] = size_calculator.get_collection_stamps()
+        schema, mod = CacheInitializerBackground.__read_collection_stamps(col)
+        if collection_stamps.get(SizeCalculator.collection_schema_key) != schema:
+            log.info("Collection schema was changed since caches were saved. Ignoring saved caches.")
+            self.__cache_manager.invalidate_caches()
+            self.__cache_manager.set_caches_initialized(False)
+            return False
+        media_cache: MediaCache = self.__cache_manager.get_media_cache()
+        updated_note_ids: set[NoteId] = set()
+        for updated_file in media_cache.get_updated_files():
+            updated_note_ids.update(size_calculator.get_file_note_ids(updated_file))
+        deleted_note_ids: set[NoteId] = set()
+        uncached_note_number: int = 0
+        if collection_stamps.get(SizeCalculator.collection_mod_key) != mod:
+            cached_note_mods: dict[NoteId, int] = size_calculator.get_note_mods()
+            actual_note_mods: dict[NoteId, int] = dict(col.db.all("select id, mod from notes"))
+            # Note mod has a one-second resolution: edits made within the same second as saving can keep it unchanged
+            cache_file_mtime_ns: Optional[int] = self.__cache_storage.get_cache_file_mtime_ns()
+            racy_note_mod: int = (cache_file_mtime_ns - self.__racy_note_mod_window_ns) // 1_000_000_000 \
+                if cache_file_mtime_ns is not None else 0
+            for note_id, note_mod in actual_note_mods.items():
+                cached_note_mod: Optional[int] = cached_note_mods.get(note_id)
+                if cached_note_mod is None:
+                    uncached_note_number += 1
+                elif cached_note_mod != note_mod or note_mod >= racy_note_mod:
+                    updated_note_ids.add(note_id)
+            deleted_note_ids = cached_note_mods.keys() - actual_note_mods.keys()
+        else:
+            log.info("Collection was not modified since caches were saved")
+            uncached_note_number = col.note_count() - size_calculator.get_cached_note_number()
+        log.info(f"Validating caches: updated_notes={len(updated_note_ids)}, deleted_notes={len(deleted_note_ids)}, "
+                 f"uncached_notes={uncached_note_number}")
+        for note_id in updated_note_ids | deleted_note_ids:
+            self.__cache_manager.evict_note(note_id)
+        if updated_note_ids:
+            chunk_size: int = max(1, self.__config.get_cache_warmup_chunk_size())
+            workers: int = max(1, self.__config.get_cache_warmup_workers())
+            updated_note_id_list: list[NoteId] = sorted(updated_note_ids)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="NoteSizeWarmup") as executor:
+                for start in range(0, len(updated_note_id_list), chunk_size):
+                    chunk: list[NoteId] = updated_note_id_list[start:start + chunk_size]
+                    notes: list[tuple[NoteId, NotetypeId, str, int]] = col.db.all(
+                        f"select id, mid, flds, mod from notes where id in {ids2str(chunk)}")
+                    size_calculator.initialize_notes_in_caches(notes, executor)
+        if updated_note_ids or deleted_note_ids:
+            self.__cache_manager.get_item_id_cache().initialize_cache()
+        size_calculator.set_collection_stamps(schema, mod)
+        return uncached_note_number == 0
+
+    @staticmethod
+    def __read_collection_stamps(col: Collection) -> tuple[int, int]:
+        schema, mod = col.db.first("select scm, mod from col")
+        return schema, mod
+
+    @staticmethod
+    def __read_notes_in_chunks(col: Collection,
+                               chunk_size: int) -> Iterator[list[tuple[NoteId, NotetypeId, str, int]]]:
+        last_note_id: int = CacheInitializerBackground.__min_note_id
+        while True:
+            notes: list[tuple[NoteId, NotetypeId, str, int]] = CacheInitializerBackground.__read_notes_chunk(
+                col, last_note_id, chunk_size)
+            if not notes:
+                return
+            yield notes
+            last_note_id = notes[-1][0]
+
+    @staticmethod
+    def __read_notes_chunk(col: Collection, last_note_id: int,
+                           chunk_size: int) -> list[tuple[NoteId, NotetypeId, str, int]]:
+        return col.db.all("select id, mid, flds, mod from notes where id > ? order by id limit ?",
+                          last_note_id, chunk_size)
+
     def __update_progress(self, label: str, value: Optional[int], max_value: Optional[int]) -> None:
         if value and value % self.__update_progress_step == 0:
             value_str: str = NumberFormatter.with_thousands_separator(value)
@@ -4,8 +4,11 @@ from logging import Logger
 from anki.notes import NoteId
 
 from .cache import Cache
+from .group_size_cache import GroupSizeCache
 from .item_id_cache import ItemIdCache
 from .media_cache import MediaCache
+from .search_aggregate_cache import SearchAggregateCache
+from .size_index import SizeIndex
 from .size_str_cache import SizeStrCache
 from ..calculator.size_calculator import SizeCalculator
 from ..calculator.size_formatter import SizeFormatter
@@ -18,7 +21,8 @@ log: Logger = logging.getLogger(__name__)
 class CacheManager:
     def __init__(self, media_cache: MediaCache, item_id_cache: ItemIdCache, size_calculator: SizeCalculator,
                  size_formatter: SizeFormatter, file_type_helper: FileTypeHelper, size_str_cache: SizeStrCache,
-                 updated_files_calculator: UpdatedFilesCalculator) -> None:
+                 updated_files_calculator: UpdatedFilesCalculator, size_index: SizeIndex,
+                 group_size_cache: GroupSizeCache, search_aggregate_cache: SearchAggregateCache) -> None:
         self.__media_cache: MediaCache = media_cache
         self.__item_id_cache: ItemIdCache = item_id_cache
         self.__size_calculator: SizeCalculator = size_calculator
@@ -26,6 +30,9 @@ class CacheManager:
         self.__file_type_helper: FileTypeHelper = file_type_helper
         self.__size_str_cache: SizeStrCache = size_str_cache
         self.__updated_files_calculator: UpdatedFilesCalculator = updated_files_calculator
+        self.__size_index: SizeIndex = size_index
+        self.__group_size_cache: GroupSizeCache = group_size_cache
+        self.__search_aggregate_cache: SearchAggregateCache = search_aggregate_cache
         self.__caches: list[Cache] = [self.__media_cache, self.__item_id_cache, self.__size_formatter,
                                       self.__size_calculator, self.__file_type_helper, self.__size_str_cache,
                                       self.__updated_files_calculator]
@@ -51,12 +58,20 @@ class CacheManager:
         log.debug("Invalidate caches")
         for cache in self.__caches:
             cache.invalidate_cache()
+        self.__size_index.invalidate()
+        self.__group_size_cache.invalidate()
+        self.__search_aggregate_cache.invalidate()
 
     def evict_note(self, note_id: NoteId) -> None:
         self.__item_id_cache.evict_note(note_id)
         self.__size_calculator.evict_note(note_id)
         self.__size_str_cache.evict_note(note_id)
-        self.__updated_files_calculator.evict_note(note_id)
+        self.__size_index.evict_note(note_id)
+        self.__group_size_cache.evict_note(note_id)
+        self.__search_aggregate_cache.evict_note(note_id)
+
+    def get_media_cache(self) -> MediaCache:
+        return self.__media_cache
 
     def get_item_id_cache(self) -> ItemIdCache:
         return self.__item_id_cache
@@ -76,5 +91,14 @@ class CacheManager:
     def get_updated_files_calculator(self) -> UpdatedFilesCalculator:
         return self.__updated_files_calculator
 
+    def get_size_index(self) -> SizeIndex:
+        return self.__size_index
+
+    def get_group_size_cache(self) -> GroupSizeCache:
+        return self.__group_size_cache
+
+    def get_search_aggregate_cache(self) -> SearchAggregateCache:
+        return self.__search_aggregate_cache
+
     def __del__(self):
         log.debug(f"{self.__class__.__name__} was deleted")
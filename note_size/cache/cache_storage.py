@@ -1,11 +1,14 @@
 import logging
+import mmap
 import os
 import pickle
 from logging import Logger
 from pathlib import Path
 from threading import RLock
+from typing import Any, Optional
 
 from .cache import Cache
+from .columnar_codec import ColumnarCodec
 from ..config.settings import Settings
 
 log: Logger = logging.getLogger(__name__)
@@ -19,6 +22,7 @@ class CacheStorage:
         self.__lock: RLock = RLock()
         self.__current_cache_version: int = current_cache_version
         self.__settings: Settings = settings
+        self.__codec: ColumnarCodec = ColumnarCodec()
         log.debug(f"{self.__class__.__name__} was instantiated")
 
     def save_caches_to_file(self, caches: list[Cache]) -> None:
@@ -26,11 +30,11 @@ class CacheStorage:
             cache_file: Path = self.__settings.get_cache_file()
             try:
                 log.info(f"Saving cache file: {cache_file}")
-                dict_of_caches: dict[str, list[dict]] = {cache.cache_id(): cache.as_dict_list() for cache in caches}
-                dict_of_caches[self.cache_metadata_key] = [{self.version_key: self.__current_cache_version}]
-                with cache_file.open("wb") as io:
-                    # noinspection PyTypeChecker
-                    pickle.dump(dict_of_caches, io)
+                encoded_caches: dict[str, bytes] = {cache.cache_id(): cache.process_dict_list(self.__codec.encode)
+                                                    for cache in caches}
+                encoded_caches[self.cache_metadata_key] = self.__codec.encode(
+                    [{self.version_key: self.__current_cache_version}])
+                CacheStorage.__write_atomically(cache_file, self.__codec.encode(encoded_caches))
                 log.info(f"Caches were saved to file: {cache_file}")
             except Exception:
                 log.warning(f"Cannot save cache file: {cache_file}", exc_info=True)
@@ -41,7 +45,7 @@ class CacheStorage:
             log.info(f"Reading cache file: {cache_file}")
             with self.__lock:
                 try:
-                    dict_of_caches: dict[str, list[dict]] = pickle.load(open(cache_file, 'rb'))
+                    dict_of_caches: dict[str, list[dict]] = self.__load_file(cache_file)
                     cache_version: int = dict_of_caches[self.cache_metadata_key][0][self.version_key]
                     if cache_version != self.__current_cache_version:
                         log.warning(f"Saved cache version differs: saved={cache_version}, "
@@ -59,12 +63,45 @@ class CacheStorage:
             log.info(f"Skip reading absent cache file: {cache_file}")
         return False
 
+    def get_cache_file_mtime_ns(self) -> Optional[int]:
+        cache_file: Path = self.__settings.get_cache_file()
+        return cache_file.stat().st_mtime_ns if cache_file.exists() else None
+
     def delete_cache_file(self) -> None:
         cache_file: Path = self.__settings.get_cache_file()
         if cache_file.exists():
             os.remove(cache_file)
             log.info(f"Cache file was deleted: {cache_file}")
 
+    def __load_file(self, cache_file: Path) -> dict[str, Any]:
+        with cache_file.open("rb") as io:
+            if not self.__codec.is_columnar(io.read(len(self.__codec.magic))):
+                # Pickle cache files of previous releases are still read until the next release
+                log.info(f"Reading legacy pickle cache file: {cache_file}")
+                io.seek(0)
+                return pickle.load(io)
+            with mmap.mmap(io.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                encoded_caches: dict[str, memoryview] = self.__codec.decode(mapped_file)
+                try:
+                    return {cache_id: self.__codec.decode(encoded_cache)
+                            for cache_id, encoded_cache in encoded_caches.items()}
+                finally:
+                    for encoded_cache in encoded_caches.values():
+                        encoded_cache.release()
+
+    @staticmethod
+    def __write_atomically(cache_file: Path, content: bytes) -> None:
+        temp_file: Path = cache_file.with_name(f"{cache_file.name}.partial")
+        try:
+            with temp_file.open("wb") as io:
+                io.write(content)
+                io.flush()
+                os.fsync(io.fileno())
+            os.replace(temp_file, cache_file)
+        finally:
+            if temp_file.exists():
+                os.remove(temp_file)
+
     def __invalidate_and_delete_caches(self, caches: list[Cache]) -> None:
         for cache in caches:
             cache.invalidate_cache()
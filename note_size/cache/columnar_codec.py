@@ -0,0 +1,235 @@
+import logging
+import struct
+import sys
+import zlib
+from array import array
+from enum import Enum
+from logging import Logger
+from typing import Any, Callable
+
+from ..common.types import FileSize, SizeBytes, SizeType, FileType
+
+log: Logger = logging.getLogger(__name__)
+
+
+class ColumnarCodec:
+    magic: bytes = b"NSCC"
+    format_version: int = 1
+    __header: struct.Struct = struct.Struct("<4sHBQI")
+    __byte_order: int = 0 if sys.byteorder == "little" else 1
+    __enums: dict[str, type[Enum]] = {enum_class.__name__: enum_class for enum_class in [SizeType, FileType]}
+
+    def encode(self, obj: Any) -> bytes:
+        encoder: _Encoder = _Encoder()
+        encoder.write_value(obj)
+        string_table: bytes = "\0".join(encoder.strings).encode()
+        content: bytes = bytes(encoder.out) + struct.pack("<I", len(encoder.strings)) + string_table
+        header: bytes = self.__header.pack(self.magic, self.format_version, self.__byte_order,
+                                           self.__header.size + len(encoder.out), zlib.crc32(content))
+        return header + content
+
+    def decode(self, buffer: Any) -> Any:
+        magic, format_version, byte_order, string_table_offset, checksum = self.__header.unpack_from(buffer, 0)
+        if magic != self.magic:
+            raise ValueError(f"Not a columnar cache: magic={magic}")
+        if format_version != self.format_version:
+            raise ValueError(f"Unsupported columnar cache version: {format_version}")
+        if byte_order != self.__byte_order:
+            raise ValueError("Columnar cache was written with a different byte order")
+        # Columns and nested byte strings are read through memoryview slices, so a mapped file is not copied
+        with memoryview(buffer) as view:
+            if zlib.crc32(view[self.__header.size:]) != checksum:
+                raise ValueError("Columnar cache checksum mismatch")
+            string_number: int = struct.unpack_from("<I", view, string_table_offset)[0]
+            strings: list[str] = str(view[string_table_offset + 4:], "utf-8").split("\0") \
+                if string_number > 0 else []
+            decoder: _Decoder = _Decoder(view, self.__header.size, strings, self.__enums)
+            return decoder.read_value()
+
+    @staticmethod
+    def is_columnar(prefix: bytes) -> bool:
+        return prefix.startswith(ColumnarCodec.magic)
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.out: bytearray = bytearray()
+        self.strings: list[str] = []
+        self.__string_ids: dict[str, int] = {}
+
+    def write_value(self, value: Any) -> None:
+        value_type: type = type(value)
+        if value is None:
+            self.out += b"N"
+        elif value_type is bool:
+            self.out += b"T" if value else b"F"
+        elif value_type is int:
+            self.out += b"I" + struct.pack("<q", value)
+        elif value_type is str:
+            self.out += b"S" + struct.pack("<I", self.__string_id(value))
+        elif value_type is bytes:
+            self.out += b"Y" + struct.pack("<Q", len(value)) + value
+        elif value_type is FileSize:
+            self.out += b"Z" + struct.pack("<q?", value.size, value.exists)
+        elif isinstance(value, Enum):
+            self.out += b"M" + struct.pack("<I", self.__string_id(value_type.__name__))
+            self.write_value(value.value)
+        elif value_type in (list, tuple, set):
+            self.out += {list: b"L", tuple: b"U", set: b"E"}[value_type] + struct.pack("<I", len(value))
+            for item in value:
+                self.write_value(item)
+        elif value_type is dict:
+            self.__write_dict(value)
+        else:
+            raise TypeError(f"Unsupported type in cache: {value_type}")
+
+    def __write_dict(self, value: dict[Any, Any]) -> None:
+        if len(value) > 0 and all(type(key) is int for key in value.keys()):
+            value = dict(sorted(value.items()))
+            values: Any = value.values()
+            if all(type(item) is int for item in values):
+                self.out += b"A" + struct.pack("<I", len(value))
+                self.__write_array("q", value.keys())
+                self.__write_array("q", values)
+                return
+            if all(type(item) is list and all(type(element) is int for element in item) for item in values):
+                self.out += b"B"
+                self.__write_grouped(value, lambda flat: self.__write_array("q", flat))
+                return
+            if all(type(item) is set and all(type(element) is str for element in item) for item in values):
+                self.out += b"G"
+                self.__write_grouped(value, lambda flat: self.__write_array("I", map(self.__string_id, flat)))
+                return
+            if all(type(item) is dict and _Encoder.__is_file_sizes(item) for item in values):
+                self.out += b"H"
+                self.__write_grouped(value, self.__write_file_sizes)
+                return
+        if len(value) > 0 and _Encoder.__is_file_sizes(value):
+            self.out += b"C" + struct.pack("<I", len(value))
+            self.__write_file_sizes(list(value.items()))
+            return
+        self.out += b"D" + struct.pack("<I", len(value))
+        for key, item in value.items():
+            self.write_value(key)
+            self.write_value(item)
+
+    def __write_grouped(self, value: dict[int, Any], write_flat: Callable[[list[Any]], None]) -> None:
+        self.out += struct.pack("<I", len(value))
+        self.__write_array("q", value.keys())
+        self.__write_array("I", [len(item) for item in value.values()])
+        flat: list[Any] = [element for item in value.values()
+                           for element in (item.items() if type(item) is dict else item)]
+        self.out += struct.pack("<I", len(flat))
+        write_flat(flat)
+
+    def __write_file_sizes(self, file_sizes: list[tuple[str, FileSize]]) -> None:
+        self.__write_array("I", [self.__string_id(media_file) for media_file, _ in file_sizes])
+        self.__write_array("q", [file_size.size for _, file_size in file_sizes])
+        self.__write_array("B", [file_size.exists for _, file_size in file_sizes])
+
+    def __write_array(self, type_code: str, values: Any) -> None:
+        self.out += array(type_code, values).tobytes()
+
+    def __string_id(self, string: str) -> int:
+        string_id: int = self.__string_ids.get(string, -1)
+        if string_id < 0:
+            string_id = len(self.strings)
+            self.__string_ids[string] = string_id
+            self.strings.append(string)
+        return string_id
+
+    @staticmethod
+    def __is_file_sizes(value: dict[Any, Any]) -> bool:
+        return all(type(key) is str and type(item) is FileSize for key, item in value.items())
+
+
+class _Decoder:
+    def __init__(self, buffer: memoryview, position: int, strings: list[str], enums: dict[str, type[Enum]]) -> None:
+        self.__buffer: memoryview = buffer
+        self.__position: int = position
+        self.__strings: list[str] = strings
+        self.__enums: dict[str, type[Enum]] = enums
+
+    def read_value(self) -> Any:
+        tag: bytes = self.__read_bytes(1).tobytes()
+        if tag == b"N":
+            return None
+        if tag == b"T":
+            return True
+        if tag == b"F":
+            return False
+        if tag == b"I":
+            return self.__read_struct("<q")
+        if tag == b"S":
+            return self.__strings[self.__read_struct("<I")]
+        if tag == b"Y":
+            return self.__read_bytes(self.__read_struct("<Q"))
+        if tag == b"Z":
+            size, exists = self.__read_struct("<q?", 2)
+            return FileSize(SizeBytes(size), exists)
+        if tag == b"M":
+            enum_class: type[Enum] = self.__enums[self.__strings[self.__read_struct("<I")]]
+            return enum_class(self.read_value())
+        if tag in (b"L", b"U", b"E"):
+            items: list[Any] = [self.read_value() for _ in range(self.__read_struct("<I"))]
+            return items if tag == b"L" else tuple(items) if tag == b"U" else set(items)
+        if tag == b"D":
+            result: dict[Any, Any] = {}
+            for _ in range(self.__read_struct("<I")):
+                key: Any = self.read_value()
+                result[key] = self.read_value()
+            return result
+        if tag == b"A":
+            number: int = self.__read_struct("<I")
+            return dict(zip(self.__read_array("q", number), self.__read_array("q", number)))
+        if tag == b"C":
+            return dict(self.__read_file_sizes(self.__read_struct("<I")))
+        if tag in (b"B", b"G", b"H"):
+            return self.__read_grouped(tag)
+        raise ValueError(f"Unknown tag in columnar cache: {tag}")
+
+    def __read_grouped(self, tag: bytes) -> dict[int, Any]:
+        number: int = self.__read_struct("<I")
+        keys: memoryview = self.__read_array("q", number)
+        counts: memoryview = self.__read_array("I", number)
+        flat_number: int = self.__read_struct("<I")
+        if tag == b"B":
+            flat: list[Any] = self.__read_array("q", flat_number).tolist()
+        elif tag == b"G":
+            flat: list[Any] = self.__read_strings(flat_number)
+        else:
+            flat: list[Any] = self.__read_file_sizes(flat_number)
+        group_factory: Callable[[list[Any]], Any] = {b"B": list, b"G": set, b"H": dict}[tag]
+        result: dict[int, Any] = {}
+        start: int = 0
+        for key, count in zip(keys, counts):
+            result[key] = group_factory(flat[start:start + count])
+            start += count
+        return result
+
+    def __read_file_sizes(self, number: int) -> list[tuple[str, FileSize]]:
+        names: list[str] = self.__read_strings(number)
+        size_pairs: list[tuple[int, int]] = list(zip(self.__read_array("q", number), self.__read_array("B", number)))
+        unique_file_sizes: dict[tuple[int, int], FileSize] = {
+            size_pair: FileSize(SizeBytes(size_pair[0]), bool(size_pair[1])) for size_pair in set(size_pairs)}
+        return list(zip(names, map(unique_file_sizes.__getitem__, size_pairs)))
+
+    def __read_strings(self, number: int) -> list[str]:
+        return list(map(self.__strings.__getitem__, self.__read_array("I", number)))
+
+    def __read_struct(self, struct_format: str, number: int = 1) -> Any:
+        values: tuple[Any, ...] = struct.unpack_from(struct_format, self.__buffer, self.__position)
+        self.__position += struct.calcsize(struct_format)
+        return values[0] if number == 1 else values
+
+    def __read_array(self, type_code: str, number: int) -> memoryview:
+        end: int = self.__position + number * array(type_code).itemsize
+        values: memoryview = self.__buffer[self.__position:end].cast(type_code)
+        self.__position = end
+        return values
+
+    def __read_bytes(self, number: int) -> memoryview:
+        end: int = self.__position + number
+        value: memoryview = self.__buffer[self.__position:end]
+        self.__position = end
+        return value
@@ -0,0 +1,245 @@
+import logging
+import time
+from array import array
+from logging import Logger
+from threading import RLock, Lock
+from typing import Optional, Union, Sequence
+
+from anki.collection import Collection
+from anki.decks import DeckId
+from anki.models import NotetypeId
+from anki.notes import NoteId
+from anki.utils import ids2str
+
+from ..calculator.file_refcounts import FileRefcounts
+from ..calculator.size_calculator import SizeCalculator
+from ..common.collection_holder import CollectionHolder
+from ..common.types import SizeType, SizeBytes, MediaFile, FileSize, GroupType
+
+log: Logger = logging.getLogger(__name__)
+
+GroupKey = Union[DeckId, NotetypeId, str]
+
+
+class GroupSize:
+    def __init__(self) -> None:
+        self.notes_number: int = 0
+        self.texts_size: SizeBytes = SizeBytes(0)
+        self.files: FileRefcounts = FileRefcounts()
+
+    def get_total_size(self) -> SizeBytes:
+        return SizeBytes(self.texts_size + self.files.get_total_size())
+
+    def add_note(self, texts_size: SizeBytes, file_sizes: dict[MediaFile, FileSize]) -> None:
+        self.notes_number += 1
+        self.texts_size += texts_size
+        self.files.add_files(file_sizes)
+
+    def remove_note(self, texts_size: SizeBytes, files: Sequence[MediaFile]) -> None:
+        self.notes_number -= 1
+        self.texts_size -= texts_size
+        self.files.remove_files(files)
+
+
+class _NoteGroups:
+    def __init__(self, groups: list[tuple[GroupType, GroupKey]], texts_size: SizeBytes,
+                 files: list[MediaFile]) -> None:
+        self.groups: list[tuple[GroupType, GroupKey]] = groups
+        self.texts_size: SizeBytes = texts_size
+        self.files: list[MediaFile] = files
+
+
+class GroupSizeCache:
+    __deck_separator: str = "::"
+    __tag_separator: str = "::"
+    __refresh_chunk_size: int = 1000
+
+    def __init__(self, collection_holder: CollectionHolder, size_calculator: SizeCalculator) -> None:
+        self.__lock: RLock = RLock()
+        self.__refresh_lock: Lock = Lock()
+        self.__collection_holder: CollectionHolder = collection_holder
+        self.__size_calculator: SizeCalculator = size_calculator
+        self.__group_sizes: dict[GroupType, dict[GroupKey, GroupSize]] = {group_type: {} for group_type in GroupType}
+        self.__note_groups: dict[NoteId, _NoteGroups] = {}
+        self.__outdated_note_ids: set[NoteId] = set()
+        self.__built: bool = False
+        self.__building: bool = False
+        self.__rebuild_needed: bool = False
+        self.__notes_changed: bool = False
+        self.__mod_stamp: int = 0
+        self.__generation: int = 0
+        log.debug(f"{self.__class__.__name__} was instantiated")
+
+    def get_group_sizes(self, group_type: GroupType) -> dict[GroupKey, GroupSize]:
+        self.refresh()
+        with self.__lock:
+            return dict(self.__group_sizes[group_type])
+
+    def get_group_size(self, group_type: GroupType, group_key: GroupKey) -> Optional[GroupSize]:
+        self.refresh()
+        with self.__lock:
+            return self.__group_sizes[group_type].get(group_key)
+
+    def get_built_group_sizes(self, group_type: GroupType) -> Optional[dict[GroupKey, GroupSize]]:
+        with self.__lock:
+            return dict(self.__group_sizes[group_type]) if self.__built else None
+
+    def is_up_to_date(self) -> bool:
+        with self.__lock:
+            return (self.__built and not self.__rebuild_needed and not self.__notes_changed
+                    and len(self.__outdated_note_ids) == 0)
+
+    def evict_note(self, note_id: NoteId) -> None:
+        with self.__lock:
+            if self.__built or self.__building:
+                self.__remove_note(note_id)
+                self.__outdated_note_ids.add(note_id)
+
+    def mark_changed(self, groups_changed: bool) -> None:
+        with self.__lock:
+            if self.__built or self.__building:
+                log.debug(f"Group sizes were marked changed: groups_changed={groups_changed}")
+                self.__notes_changed = True
+                self.__rebuild_needed = self.__rebuild_needed or groups_changed
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__generation += 1
+            if self.__built or self.__building:
+                log.debug("Invalidate group sizes")
+                self.__group_sizes = {group_type: {} for group_type in GroupType}
+                self.__note_groups = {}
+                self.__outdated_note_ids.clear()
+                self.__built = False
+                self.__building = False
+                self.__rebuild_needed = False
+                self.__notes_changed = False
+
+    def refresh(self) -> bool:
+        with self.__refresh_lock:
+            try:
+                return self.__refresh()
+            except Exception:
+                # Changes taken for processing are lost, so the next refresh rebuilds everything
+                self.invalidate()
+                raise
+
+    def __refresh(self) -> bool:
+        with self.__lock:
+            generation: int = self.__generation
+            rebuild: bool = not self.__built or self.__rebuild_needed
+            notes_changed: bool = self.__notes_changed
+            mod_stamp: int = self.__mod_stamp
+            self.__building = self.__building or rebuild
+            self.__rebuild_needed = False
+            self.__notes_changed = False
+        new_mod_stamp: int = int(time.time())
+        col: Collection = self.__collection_holder.col()
+        if rebuild:
+            # Groups are built aside, so the previous sizes stay available while the collection is scanned
+            group_sizes: dict[GroupType, dict[GroupKey, GroupSize]] = {group_type: {} for group_type in GroupType}
+            note_groups: dict[NoteId, _NoteGroups] = {}
+            GroupSizeCache.__apply_notes(self.__read_notes(col, col.db.all(self.__notes_query(""))),
+                                         group_sizes, note_groups)
+            with self.__lock:
+                if generation != self.__generation:
+                    return False
+                self.__group_sizes = group_sizes
+                self.__note_groups = note_groups
+                self.__built = True
+                self.__building = False
+                self.__mod_stamp = new_mod_stamp
+            log.debug(f"Group sizes were built: notes={len(note_groups)}")
+        elif notes_changed:
+            # Card and note modification times cover deck moves, tag edits, text edits and generated cards
+            changed_note_ids: list[NoteId] = col.db.list(
+                "select id from notes where mod >= ? union select nid from cards where mod >= ?",
+                mod_stamp, mod_stamp)
+            with self.__lock:
+                if generation != self.__generation:
+                    return False
+                self.__outdated_note_ids.update(changed_note_ids)
+                self.__mod_stamp = new_mod_stamp
+        with self.__lock:
+            outdated_note_ids: list[NoteId] = list(self.__outdated_note_ids)
+            self.__outdated_note_ids.clear()
+        for start in range(0, len(outdated_note_ids), self.__refresh_chunk_size):
+            chunk: list[NoteId] = outdated_note_ids[start:start + self.__refresh_chunk_size]
+            notes: list[tuple[NoteId, _NoteGroups, dict[MediaFile, FileSize]]] = self.__read_notes(
+                col, col.db.all(self.__notes_query(f"where n.id in {ids2str(chunk)}")))
+            with self.__lock:
+                if generation != self.__generation:
+                    return False
+                for note_id in chunk:
+                    self.__remove_note(note_id)
+                GroupSizeCache.__apply_notes(notes, self.__group_sizes, self.__note_groups)
+        if len(outdated_note_ids) > 0:
+            log.debug(f"Group sizes were refreshed: notes={len(outdated_note_ids)}")
+        return rebuild or len(outdated_note_ids) > 0
+
+    @staticmethod
+    def __notes_query(where: str) -> str:
+        return (f"select n.id, n.mid, n.tags, (select group_concat(distinct c.did) from cards c where c.nid = n.id) "
+                f"from notes n {where}")
+
+    def __read_notes(self, col: Collection, notes: list[tuple[NoteId, NotetypeId, str, Optional[str]]]
+                     ) -> list[tuple[NoteId, _NoteGroups, dict[MediaFile, FileSize]]]:
+        if len(notes) == 0:
+            return []
+        deck_ancestors: dict[DeckId, list[DeckId]] = self.__get_deck_ancestors(col)
+        note_ids: list[NoteId] = [note[0] for note in notes]
+        texts_sizes: array = self.__size_calculator.get_note_sizes(note_ids, SizeType.TEXTS, use_cache=True)
+        read_notes: list[tuple[NoteId, _NoteGroups, dict[MediaFile, FileSize]]] = []
+        for (note_id, note_type_id, tags, deck_ids), texts_size in zip(notes, texts_sizes):
+            groups: list[tuple[GroupType, GroupKey]] = [(GroupType.NOTE_TYPE, note_type_id)]
+            note_deck_ids: set[DeckId] = set()
+            for deck_id in str(deck_ids or "").split(","):
+                if deck_id:
+                    note_deck_ids.update(deck_ancestors.get(DeckId(int(deck_id)), [DeckId(int(deck_id))]))
+            groups.extend((GroupType.DECK, deck_id) for deck_id in note_deck_ids)
+            groups.extend((GroupType.TAG, tag) for tag in self.__get_tag_ancestors(tags))
+            file_sizes: dict[MediaFile, FileSize] = self.__size_calculator.get_note_file_sizes(note_id, use_cache=True)
+            read_notes.append((note_id, _NoteGroups(groups, SizeBytes(texts_size), list(file_sizes.keys())),
+                               file_sizes))
+        return read_notes
+
+    @staticmethod
+    def __apply_notes(notes: list[tuple[NoteId, _NoteGroups, dict[MediaFile, FileSize]]],
+                      group_sizes: dict[GroupType, dict[GroupKey, GroupSize]],
+                      note_groups: dict[NoteId, _NoteGroups]) -> None:
+        for note_id, groups, file_sizes in notes:
+            for group_type, group_key in groups.groups:
+                group_size: Optional[GroupSize] = group_sizes[group_type].get(group_key)
+                if group_size is None:
+                    group_size = GroupSize()
+                    group_sizes[group_type][group_key] = group_size
+                group_size.add_note(groups.texts_size, file_sizes)
+            note_groups[note_id] = groups
+
+    def __remove_note(self, note_id: NoteId) -> None:
+        note_groups: Optional[_NoteGroups] = self.__note_groups.pop(note_id, None)
+        if note_groups:
+            for group_type, group_key in note_groups.groups:
+                group_size: GroupSize = self.__group_sizes[group_type][group_key]
+                group_size.remove_note(note_groups.texts_size, note_groups.files)
+                if group_size.notes_number == 0:
+                    del self.__group_sizes[group_type][group_key]
+
+    def __get_deck_ancestors(self, col: Collection) -> dict[DeckId, list[DeckId]]:
+        deck_ids: dict[str, DeckId] = {deck.name: DeckId(deck.id) for deck in col.decks.all_names_and_ids()}
+        deck_ancestors: dict[DeckId, list[DeckId]] = {}
+        for deck_name, deck_id in deck_ids.items():
+            parts: list[str] = deck_name.split(self.__deck_separator)
+            ancestor_names: list[str] = [self.__deck_separator.join(parts[:index]) for index in range(1, len(parts))]
+            deck_ancestors[deck_id] = [deck_ids[name] for name in ancestor_names if name in deck_ids] + [deck_id]
+        return deck_ancestors
+
+    def __get_tag_ancestors(self, tags: str) -> set[str]:
+        tag_ancestors: set[str] = set()
+        for tag in tags.split():
+            parts: list[str] = tag.split(self.__tag_separator)
+            tag_ancestors.update(self.__tag_separator.join(parts[:index]) for index in range(1, len(parts) + 1))
+        return tag_ancestors
+
+    def __del__(self):
+        log.debug(f"{self.__class__.__name__} was deleted")
@@ -1,9 +1,10 @@
 import logging
 from logging import Logger
-from typing import Sequence, Any
+from typing import Sequence, Any, Optional
 
 from anki.cards import CardId, Card
 from anki.notes import NoteId
+from anki.utils import ids2str
 
 from .cache import Cache
 from ..common.collection_holder import CollectionHolder
@@ -12,11 +13,13 @@ log: Logger = logging.getLogger(__name__)
 
 
 class ItemIdCache(Cache):
+    __fetch_chunk_size: int = 10_000
 
     def __init__(self, collection_holder: CollectionHolder) -> None:
         super().__init__()
         self.__collection_holder: CollectionHolder = collection_holder
         self.__id_cache: dict[CardId, NoteId] = {}
+        self.__note_card_ids_cache: dict[NoteId, list[CardId]] = {}
         self.invalidate_cache()
         log.debug(f"{self.__class__.__name__} was instantiated")
 
@@ -24,42 +27,87 @@ class ItemIdCache(Cache):
         log.debug(f"Initializing ItemIdCache: size={len(self.__id_cache)}")
         with self._lock:
             for cid, nid in self.__collection_holder.col().db.execute("select id, nid from cards"):
-                self.__id_cache[cid] = nid
+                self.__put_card(cid, nid)
         log.debug(f"Initialized ItemIdCache: size={len(self.__id_cache)}")
 
     def get_note_id_by_card_id(self, card_id: CardId) -> NoteId:
         with self._lock:
             if card_id not in self.__id_cache:
                 card: Card = self.__collection_holder.col().get_card(card_id)
-                self.__id_cache[card_id] = card.nid
+                self.__put_card(card_id, card.nid)
             return self.__id_cache[card_id]
 
     def get_note_ids_by_card_ids(self, card_ids: Sequence[CardId]) -> Sequence[NoteId]:
         with self._lock:
-            return list({self.get_note_id_by_card_id(card_id) for card_id in card_ids})
+            missing_card_ids: list[CardId] = list(dict.fromkeys(
+                card_id for card_id in card_ids if card_id not in self.__id_cache))
+            if missing_card_ids:
+                self.__fetch_note_ids(missing_card_ids)
+            note_ids: dict[NoteId, None] = {self.__id_cache[card_id]: None for card_id in card_ids
+                                            if card_id in self.__id_cache}
+            return list(note_ids.keys())
+
+    def map_card_ids_to_note_ids(self, card_ids: Sequence[CardId]) -> list[NoteId]:
+        with self._lock:
+            missing_card_ids: list[CardId] = list(dict.fromkeys(
+                card_id for card_id in card_ids if card_id not in self.__id_cache))
+            if missing_card_ids:
+                self.__fetch_note_ids(missing_card_ids)
+            return [self.__id_cache[card_id] for card_id in card_ids]
+
+    def get_cached_card_ids_by_note_id(self, note_id: NoteId) -> list[CardId]:
+        with self._lock:
+            return list(self.__note_card_ids_cache.get(note_id, []))
 
     def evict_note(self, note_id: NoteId) -> None:
         with self._lock:
-            for cid, nid in list(self.__id_cache.items()):
-                if nid == note_id and note_id in self.__id_cache:
-                    del self.__id_cache[cid]
+            for card_id in self.__note_card_ids_cache.pop(note_id, []):
+                self.__id_cache.pop(card_id, None)
 
     def as_dict_list(self) -> list[dict[Any, Any]]:
         with self._lock:
-            return [self.__id_cache]
+            return [self.__id_cache, self.__note_card_ids_cache]
 
     def read_from_dict_list(self, caches: list[dict[Any, Any]]) -> None:
         with self._lock:
             self.__id_cache = caches[0]
+            self.__note_card_ids_cache = caches[1]
             log.info("Cache was read from dict list")
 
     def invalidate_cache(self) -> None:
         with self._lock:
             self.__id_cache.clear()
+            self.__note_card_ids_cache.clear()
 
     def get_cache_size(self) -> int:
         with self._lock:
             return len(self.__id_cache.keys())
 
+    def __fetch_note_ids(self, card_ids: list[CardId]) -> None:
+        log.debug(f"Fetching note ids of cards: {len(card_ids)}")
+        fetched_rows: list[tuple[CardId, NoteId]] = []
+        for start in range(0, len(card_ids), self.__fetch_chunk_size):
+            chunk: list[CardId] = card_ids[start:start + self.__fetch_chunk_size]
+            fetched_rows.extend(self.__collection_holder.col().db.all(
+                f"select id, nid from cards where id in {ids2str(chunk)}"))
+        for card_id, note_id in fetched_rows:
+            self.__put_card(card_id, note_id)
+        if len(fetched_rows) < len(card_ids):
+            log.warning(f"Cards not found: {len(card_ids) - len(fetched_rows)}")
+
+    def __put_card(self, card_id: CardId, note_id: NoteId) -> None:
+        old_note_id: Optional[NoteId] = self.__id_cache.get(card_id)
+        if old_note_id == note_id:
+            return
+        if old_note_id is not None:
+            self.__note_card_ids_cache[old_note_id].remove(card_id)
+            if not self.__note_card_ids_cache[old_note_id]:
+                del self.__note_card_ids_cache[old_note_id]
+        self.__id_cache[card_id] = note_id
+        if note_id in self.__note_card_ids_cache:
+            self.__note_card_ids_cache[note_id].append(card_id)
+        else:
+            self.__note_card_ids_cache[note_id] = [card_id]
+
     def __del__(self):
         log.debug(f"{self.__class__.__name__} was deleted")
@@ -1,8 +1,11 @@
+import heapq
 import logging
 import os
+import time
+from concurrent.futures import Executor
 from logging import Logger
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Iterable
 
 from anki.media_pb2 import CheckMediaResponse
 
@@ -15,26 +18,63 @@ log: Logger = logging.getLogger(__name__)
 
 
 class MediaCache(Cache):
+    file_index_key: str = "file_index"
+    media_dir_mtime_key: str = "media_dir_mtime_ns"
+    __racy_mtime_window_ns: int = 2_000_000_000
 
     def __init__(self, collection_holder: CollectionHolder, config: Config) -> None:
         super().__init__()
         self.__config: Config = config
         self.__collection_holder: CollectionHolder = collection_holder
         self.__file_sizes_cache: dict[MediaFile, FileSize] = {}
+        self.__snapshot_taken: bool = False
+        self.__file_index: Optional[dict[MediaFile, tuple[SizeBytes, int, int]]] = None
+        self.__media_dir_mtime_ns: Optional[int] = None
         log.debug(f"{self.__class__.__name__} was instantiated")
 
     def get_file_size(self, media_file: MediaFile, use_cache: bool) -> FileSize:
         with self._lock:
             if not use_cache or media_file not in self.__file_sizes_cache:
-                full_path: Path = self.__collection_holder.media_dir().joinpath(media_file)
-                if os.path.exists(full_path):
-                    new_size: FileSize = FileSize(SizeBytes(os.path.getsize(full_path)), exists=True)
-                else:
-                    log.warning(f"File absents: {full_path}")
-                    new_size: FileSize = FileSize(SizeBytes(0), exists=False)
-                self.__file_sizes_cache[media_file] = new_size
+                # A snapshot miss is stat-ed too: the file could be added to media folder after the snapshot
+                media_dir: Path = self.__collection_holder.media_dir()
+                self.__file_sizes_cache[media_file] = MediaCache.__read_file_size(media_dir, media_file)
             return self.__file_sizes_cache[media_file]
 
+    def get_file_sizes(self, media_files: set[MediaFile], executor: Executor) -> dict[MediaFile, FileSize]:
+        with self._lock:
+            file_sizes: dict[MediaFile, FileSize] = {media_file: self.__file_sizes_cache[media_file]
+                                                     for media_file in media_files
+                                                     if media_file in self.__file_sizes_cache}
+        uncached_files: list[MediaFile] = [media_file for media_file in media_files if media_file not in file_sizes]
+        if uncached_files:
+            media_dir: Path = self.__collection_holder.media_dir()
+            uncached_file_sizes: dict[MediaFile, FileSize] = dict(zip(uncached_files, executor.map(
+                lambda media_file: MediaCache.__read_file_size(media_dir, media_file), uncached_files)))
+            with self._lock:
+                self.__file_sizes_cache.update(uncached_file_sizes)
+            file_sizes.update(uncached_file_sizes)
+        return file_sizes
+
+    def get_largest_file_sizes(self, media_files: Iterable[MediaFile], number: int) -> list[tuple[MediaFile, FileSize]]:
+        with self._lock:
+            file_sizes: dict[MediaFile, FileSize] = {media_file: self.get_file_size(media_file, use_cache=True)
+                                                     for media_file in media_files}
+        largest_files: list[MediaFile] = heapq.nlargest(number, file_sizes,
+                                                        key=lambda media_file: file_sizes[media_file].size)
+        return [(media_file, file_sizes[media_file]) for media_file in largest_files]
+
+    def take_snapshot(self) -> None:
+        media_dir: Path = self.__collection_holder.media_dir()
+        log.debug(f"Taking media folder snapshot: {media_dir}")
+        with self._lock:
+            self.__update_file_index(media_dir)
+            self.__snapshot_taken = True
+            log.debug(f"Media folder snapshot was taken: files={len(self.__file_sizes_cache)}")
+
+    def is_snapshot_taken(self) -> bool:
+        with self._lock:
+            return self.__snapshot_taken
+
     def get_missing_files_number(self, files: set[MediaFile], use_cache: bool) -> (FilesNumber, FilesNumber):
         with self._lock:
             exist_counter: int = 0
@@ -49,16 +89,21 @@ class MediaCache(Cache):
     def invalidate_cache(self) -> None:
         with self._lock:
             self.__file_sizes_cache.clear()
+            self.__snapshot_taken = False
+            self.__file_index = None
+            self.__media_dir_mtime_ns = None
 
     def get_unused_files_size(self, use_cache: bool) -> (FileSize, FilesNumber):
         with self._lock:
             log.debug("Calculating unused files size...")
             check_result: CheckMediaResponse = self.__collection_holder.col().media.check()
             unused_files: list[str] = list(check_result.unused)
+            if not use_cache or not self.__snapshot_taken:
+                self.take_snapshot()
             total_size: SizeBytes = SizeBytes(0)
             for unused_file in unused_files:
                 media_file: MediaFile = MediaFile(unused_file)
-                file_size: FileSize = self.get_file_size(media_file, use_cache)
+                file_size: FileSize = self.get_file_size(media_file, use_cache=True)
                 total_size += file_size.size
             files_number: FilesNumber = FilesNumber(len(unused_files))
             log.debug(f"Calculated unused: total_size={total_size}, files_number={files_number}")
@@ -66,29 +111,69 @@ class MediaCache(Cache):
 
     def get_updated_files(self) -> set[MediaFile]:
         with self._lock:
-            updated_files: set[MediaFile] = set()
-            for file in self.__collection_holder.media_dir().iterdir():
-                if file.is_file():
-                    media_file: MediaFile = MediaFile(file.name)
-                    cached_file_size: FileSize = self.get_file_size(media_file, use_cache=True)
-                    actual_file_size: FileSize = self.get_file_size(media_file, use_cache=False)
-                    if cached_file_size != actual_file_size:
-                        updated_files.add(media_file)
+            media_dir: Path = self.__collection_holder.media_dir()
+            if self.__file_index is not None and self.__media_dir_mtime_ns == os.stat(media_dir).st_mtime_ns:
+                log.debug("Media folder was not modified since last scan")
+                return set()
+            old_file_index: Optional[dict[MediaFile, tuple[SizeBytes, int, int]]] = self.__file_index
+            old_file_sizes: dict[MediaFile, FileSize] = self.__file_sizes_cache
+            self.__update_file_index(media_dir)
+            self.__snapshot_taken = True
+            if old_file_index is not None:
+                updated_files: set[MediaFile] = {media_file for media_file, file_stat in self.__file_index.items()
+                                                 if old_file_index.get(media_file) != file_stat}
+                updated_files.update(old_file_index.keys() - self.__file_index.keys())
+            else:
+                updated_files: set[MediaFile] = {media_file for media_file, file_size in self.__file_sizes_cache.items()
+                                                 if media_file in old_file_sizes
+                                                 and old_file_sizes[media_file] != file_size}
             log.debug(f"Found updated files: {len(updated_files)}")
             return updated_files
 
     def as_dict_list(self) -> list[dict[Any, Any]]:
         with self._lock:
-            return [self.__file_sizes_cache]
+            return [self.__file_sizes_cache, {self.file_index_key: self.__file_index,
+                                              self.media_dir_mtime_key: self.__media_dir_mtime_ns}]
 
     def read_from_dict_list(self, caches: list[dict[Any, Any]]):
         with self._lock:
             self.__file_sizes_cache = caches[0]
+            self.__file_index = caches[1][self.file_index_key]
+            self.__media_dir_mtime_ns = caches[1][self.media_dir_mtime_key]
             log.info("Cache was read from dict list")
 
     def get_cache_size(self) -> int:
         with self._lock:
             return len(self.__file_sizes_cache)
 
+    @staticmethod
+    def __read_file_size(media_dir: Path, media_file: MediaFile) -> FileSize:
+        full_path: Path = media_dir.joinpath(media_file)
+        try:
+            return FileSize(SizeBytes(os.path.getsize(full_path)), exists=True)
+        except OSError:
+            log.warning(f"File absents: {full_path}")
+            return FileSize(SizeBytes(0), exists=False)
+
+    def __update_file_index(self, media_dir: Path) -> None:
+        scan_start_ns: int = time.time_ns()
+        media_dir_mtime_ns: int = os.stat(media_dir).st_mtime_ns
+        file_index: dict[MediaFile, tuple[SizeBytes, int, int]] = MediaCache.__scan_media_dir(media_dir)
+        self.__file_index = file_index
+        self.__file_sizes_cache = {media_file: FileSize(file_stat[0]) for media_file, file_stat in file_index.items()}
+        # Folder mtime that is too close to the scan time can miss later changes on coarse-grained file systems
+        is_racy: bool = scan_start_ns - media_dir_mtime_ns < self.__racy_mtime_window_ns
+        self.__media_dir_mtime_ns = media_dir_mtime_ns if not is_racy else None
+
+    @staticmethod
+    def __scan_media_dir(media_dir: Path) -> dict[MediaFile, tuple[SizeBytes, int, int]]:
+        file_index: dict[MediaFile, tuple[SizeBytes, int, int]] = {}
+        with os.scandir(media_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat: os.stat_result = entry.stat()
+                    file_index[MediaFile(entry.name)] = (SizeBytes(stat.st_size), stat.st_mtime_ns, stat.st_ino)
+        return file_index
+
     def __del__(self):
         log.debug(f"{self.__class__.__name__} was deleted")
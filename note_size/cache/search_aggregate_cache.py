@@ -0,0 +1,109 @@
+import logging
+from collections import OrderedDict
+from logging import Logger
+from threading import RLock
+from typing import Optional, Sequence, Callable
+
+from anki.notes import NoteId
+
+from ..calculator.notes_selection import NotesSelection
+from ..common.types import SizeBytes, SizeType, FilesNumber, MediaFile, FileSize
+
+log: Logger = logging.getLogger(__name__)
+
+
+class SearchAggregate:
+    def __init__(self, notes_number: int, texts_size: SizeBytes, files_size: SizeBytes, files_number: FilesNumber,
+                 missing_files_number: FilesNumber) -> None:
+        self.notes_number: int = notes_number
+        self.texts_size: SizeBytes = texts_size
+        self.files_size: SizeBytes = files_size
+        self.files_number: FilesNumber = files_number
+        self.missing_files_number: FilesNumber = missing_files_number
+
+    def get_total_size(self) -> SizeBytes:
+        return SizeBytes(self.texts_size + self.files_size)
+
+    def get_existing_files_number(self) -> FilesNumber:
+        return FilesNumber(self.files_number - self.missing_files_number)
+
+    def get_size(self, size_type: SizeType) -> SizeBytes:
+        if size_type == SizeType.TOTAL:
+            return self.get_total_size()
+        elif size_type == SizeType.TEXTS:
+            return self.texts_size
+        elif size_type == SizeType.FILES:
+            return self.files_size
+        else:
+            raise ValueError(f"Size type is not supported: {size_type}")
+
+
+class SearchAggregateCache:
+    __max_entries: int = 32
+
+    def __init__(self, notes_selection: NotesSelection) -> None:
+        self.__lock: RLock = RLock()
+        self.__notes_selection: NotesSelection = notes_selection
+        self.__aggregates: OrderedDict[tuple[int, int, int], SearchAggregate] = OrderedDict()
+        self.__generation: int = 0
+        log.debug(f"{self.__class__.__name__} was instantiated")
+
+    def get_aggregate(self, note_ids: Sequence[NoteId]) -> SearchAggregate:
+        with self.__lock:
+            key: tuple[int, int, int] = self.__key(note_ids)
+            aggregate: Optional[SearchAggregate] = self.__aggregates.get(key)
+            if aggregate:
+                self.__aggregates.move_to_end(key)
+                return aggregate
+            self.__notes_selection.set_note_ids(note_ids)
+            return self.__put_aggregate(key)
+
+    def get_aggregate_with_file_sizes(
+            self, note_ids: Sequence[NoteId],
+            on_files_added: Optional[Callable[[dict[MediaFile, FileSize]], None]] = None
+    ) -> tuple[SearchAggregate, dict[MediaFile, FileSize]]:
+        with self.__lock:
+            key: tuple[int, int, int] = self.__key(note_ids)
+            self.__notes_selection.set_note_ids(note_ids, on_files_added)
+            aggregate: Optional[SearchAggregate] = self.__aggregates.get(key)
+            if aggregate:
+                self.__aggregates.move_to_end(key)
+            else:
+                aggregate = self.__put_aggregate(key)
+            return aggregate, self.__notes_selection.get_file_sizes()
+
+    def evict_note(self, note_id: NoteId) -> None:
+        with self.__lock:
+            self.__notes_selection.evict_note(note_id)
+            self.__reset()
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__notes_selection.clear()
+            self.__reset()
+
+    def get_cache_size(self) -> int:
+        with self.__lock:
+            return len(self.__aggregates)
+
+    def __key(self, note_ids: Sequence[NoteId]) -> tuple[int, int, int]:
+        unique_note_ids: list[NoteId] = sorted(set(note_ids))
+        return self.__generation, len(unique_note_ids), hash(tuple(unique_note_ids))
+
+    def __put_aggregate(self, key: tuple[int, int, int]) -> SearchAggregate:
+        aggregate: SearchAggregate = SearchAggregate(self.__notes_selection.get_notes_number(),
+                                                     self.__notes_selection.get_size(SizeType.TEXTS),
+                                                     self.__notes_selection.get_size(SizeType.FILES),
+                                                     self.__notes_selection.get_files_number(),
+                                                     self.__notes_selection.get_missing_files_number())
+        self.__aggregates[key] = aggregate
+        if len(self.__aggregates) > self.__max_entries:
+            self.__aggregates.popitem(last=False)
+        return aggregate
+
+    def __reset(self) -> None:
+        self.__generation += 1
+        self.__aggregates.clear()
+
+    def __del__(self):
+        log.debug(f"{self.__class__.__name__} was deleted")
@@ -0,0 +1,148 @@
+import logging
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import compress
+from logging import Logger
+from threading import RLock
+
+from anki.notes import NoteId
+from anki.utils import ids2str
+
+from ..calculator.size_calculator import SizeCalculator
+from ..common.collection_holder import CollectionHolder
+from ..common.types import SizeType, SizeBytes
+
+log: Logger = logging.getLogger(__name__)
+
+
+class _SortedSizes:
+    def __init__(self, sizes: array, note_ids: array) -> None:
+        self.sizes: array = sizes
+        self.note_ids: array = note_ids
+        self.outdated_note_ids: set[NoteId] = set()
+
+
+class SizeIndex:
+    # Rebuilding is cheaper than merging the outdated notes back when many notes were evicted
+    __max_outdated_share: float = 0.1
+
+    def __init__(self, collection_holder: CollectionHolder, size_calculator: SizeCalculator) -> None:
+        self.__lock: RLock = RLock()
+        self.__collection_holder: CollectionHolder = collection_holder
+        self.__size_calculator: SizeCalculator = size_calculator
+        self.__sorted_sizes: dict[SizeType, _SortedSizes] = {}
+        self.__building_outdated_note_ids: dict[SizeType, set[NoteId]] = {}
+        self.__generation: int = 0
+        log.debug(f"{self.__class__.__name__} was instantiated")
+
+    def find_note_ids(self, size_type: SizeType, operator: str, size: SizeBytes) -> tuple[array, array]:
+        with self.__lock:
+            sorted_sizes: _SortedSizes = self.__get_sorted_sizes(size_type)
+            start, end = SizeIndex.__find_range(sorted_sizes.sizes, operator, size)
+            note_ids: array = sorted_sizes.note_ids
+            matching_note_ids: array = note_ids[start:end]
+            other_note_ids: array = note_ids[:start] + note_ids[end:]
+            return matching_note_ids, other_note_ids
+
+    def is_built(self, size_type: SizeType) -> bool:
+        with self.__lock:
+            return size_type in self.__sorted_sizes
+
+    def build(self, size_type: SizeType) -> None:
+        with self.__lock:
+            if size_type in self.__sorted_sizes or size_type in self.__building_outdated_note_ids:
+                return
+            generation: int = self.__generation
+            self.__building_outdated_note_ids[size_type] = set()
+        try:
+            sorted_sizes: _SortedSizes = self.__build_sorted_sizes(size_type)
+        except Exception:
+            with self.__lock:
+                self.__building_outdated_note_ids.pop(size_type)
+            raise
+        with self.__lock:
+            outdated_note_ids: set[NoteId] = self.__building_outdated_note_ids.pop(size_type)
+            if generation != self.__generation:
+                log.debug(f"Skip size index built before invalidation: size_type={size_type}")
+                return
+            # Notes evicted while building could be read with their old sizes
+            sorted_sizes.outdated_note_ids = outdated_note_ids
+            self.__sorted_sizes[size_type] = sorted_sizes
+
+    def evict_note(self, note_id: NoteId) -> None:
+        with self.__lock:
+            for outdated_note_ids in self.__building_outdated_note_ids.values():
+                outdated_note_ids.add(note_id)
+            for size_type, sorted_sizes in list(self.__sorted_sizes.items()):
+                if len(sorted_sizes.outdated_note_ids) >= len(sorted_sizes.note_ids) * self.__max_outdated_share:
+                    log.debug(f"Drop size index with many outdated notes: size_type={size_type}")
+                    del self.__sorted_sizes[size_type]
+                    continue
+                sorted_sizes.outdated_note_ids.add(note_id)
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__generation += 1
+            if len(self.__sorted_sizes) > 0:
+                log.debug("Invalidate size index")
+                self.__sorted_sizes.clear()
+
+    def __get_sorted_sizes(self, size_type: SizeType) -> _SortedSizes:
+        if size_type in self.__sorted_sizes:
+            self.__update_outdated_notes(size_type, self.__sorted_sizes[size_type])
+        else:
+            self.__sorted_sizes[size_type] = self.__build_sorted_sizes(size_type)
+        return self.__sorted_sizes[size_type]
+
+    def __build_sorted_sizes(self, size_type: SizeType) -> _SortedSizes:
+        note_ids: list[NoteId] = self.__collection_holder.col().db.list("select id from notes")
+        sizes: array = self.__size_calculator.get_note_sizes(note_ids, size_type, use_cache=True)
+        order: list[int] = sorted(range(len(sizes)), key=sizes.__getitem__)
+        log.debug(f"Size index was built: size_type={size_type}, notes={len(note_ids)}")
+        return _SortedSizes(array("q", [sizes[index] for index in order]),
+                            array("q", [note_ids[index] for index in order]))
+
+    def __update_outdated_notes(self, size_type: SizeType, sorted_sizes: _SortedSizes) -> None:
+        outdated_note_ids: set[NoteId] = sorted_sizes.outdated_note_ids
+        if len(outdated_note_ids) == 0:
+            return
+        kept: list[bool] = [note_id not in outdated_note_ids for note_id in sorted_sizes.note_ids]
+        kept_sizes: array = array("q", compress(sorted_sizes.sizes, kept))
+        kept_note_ids: array = array("q", compress(sorted_sizes.note_ids, kept))
+        note_ids: list[NoteId] = self.__collection_holder.col().db.list(
+            f"select id from notes where id in {ids2str(outdated_note_ids)}")
+        sizes: array = self.__size_calculator.get_note_sizes(note_ids, size_type, use_cache=True)
+        merged_sizes: array = array("q")
+        merged_note_ids: array = array("q")
+        start: int = 0
+        for size, note_id in sorted(zip(sizes, note_ids)):
+            end: int = bisect_right(kept_sizes, size, start)
+            merged_sizes.extend(kept_sizes[start:end])
+            merged_note_ids.extend(kept_note_ids[start:end])
+            merged_sizes.append(size)
+            merged_note_ids.append(note_id)
+            start = end
+        merged_sizes.extend(kept_sizes[start:])
+        merged_note_ids.extend(kept_note_ids[start:])
+        sorted_sizes.sizes = merged_sizes
+        sorted_sizes.note_ids = merged_note_ids
+        log.debug(f"Outdated notes were updated in size index: size_type={size_type}, "
+                  f"outdated={len(outdated_note_ids)}, updated={len(note_ids)}")
+        outdated_note_ids.clear()
+
+    @staticmethod
+    def __find_range(sizes: array, operator: str, size: SizeBytes) -> tuple[int, int]:
+        if operator == ">":
+            return bisect_right(sizes, size), len(sizes)
+        if operator == ">=":
+            return bisect_left(sizes, size), len(sizes)
+        if operator == "<":
+            return 0, bisect_left(sizes, size)
+        if operator == "<=":
+            return 0, bisect_right(sizes, size)
+        if operator == "=":
+            return bisect_left(sizes, size), bisect_right(sizes, size)
+        raise ValueError(f"Unsupported size operator: '{operator}'")
+
+    def __del__(self):
+        log.debug(f"{self.__class__.__name__} was deleted")
@@ -19,6 +19,7 @@ class SizeStrCache(Cache):
         self.__size_calculator: SizeCalculator = size_calculator
         self.__size_formatter: SizeFormatter = size_formatter
         self.__size_str_caches: dict[SizeType, dict[NoteId, dict[SignificantDigits, SizeStr]]] = {}
+        self.__generation: int = 0
         self.invalidate_cache()
         log.debug(f"{self.__class__.__name__} was instantiated")
 
@@ -41,8 +42,18 @@ class SizeStrCache(Cache):
                 cache[note_id][significant_digits] = self.__size_formatter.bytes_to_str(size, significant_digits)
                 return cache[note_id][significant_digits]
 
+    def get_note_size_strs(self, note_ids: Sequence[NoteId], size_type: SizeType,
+                           significant_digits: SignificantDigits, use_cache: bool) -> list[SizeStr]:
+        with self._lock:
+            return [self.get_note_size_str(note_id, size_type, significant_digits, use_cache) for note_id in note_ids]
+
+    def get_generation(self) -> int:
+        # Read without lock: callers only compare it to detect evictions
+        return self.__generation
+
     def evict_note(self, note_id: NoteId) -> None:
         with self._lock:
+            self.__generation += 1
             for cache in self.__size_str_caches.values():
                 if note_id in cache:
                     del cache[note_id]
@@ -54,11 +65,13 @@ class SizeStrCache(Cache):
     def read_from_dict_list(self, caches: list[dict[Any, Any]]) -> None:
         with self._lock:
             self.__size_str_caches = caches[0]
+            self.__generation += 1
             log.info("Cache was read from dict list")
 
     def invalidate_cache(self) -> None:
         with self._lock:
             self.__size_str_caches = {SizeType.TOTAL: {}, SizeType.TEXTS: {}, SizeType.FILES: {}}
+            self.__generation += 1
 
     def get_cache_size(self) -> int:
         with self._lock:
@@ -0,0 +1,70 @@
+import logging
+from logging import Logger
+from typing import Iterable, Optional
+
+from ..common.types import MediaFile, SizeBytes, FileSize, FilesNumber
+
+log: Logger = logging.getLogger(__name__)
+
+
+class FileRefcounts:
+    def __init__(self) -> None:
+        self.__refcounts: dict[MediaFile, int] = {}
+        self.__sizes: dict[MediaFile, FileSize] = {}
+        self.__total_size: SizeBytes = SizeBytes(0)
+        self.__missing_files_number: int = 0
+
+    def add_files(self, file_sizes: dict[MediaFile, FileSize]) -> dict[MediaFile, FileSize]:
+        new_file_sizes: dict[MediaFile, FileSize] = {}
+        for media_file, file_size in file_sizes.items():
+            refcount: int = self.__refcounts.get(media_file, 0)
+            if refcount == 0:
+                self.__sizes[media_file] = file_size
+                self.__total_size += file_size.size
+                if not file_size.exists:
+                    self.__missing_files_number += 1
+                new_file_sizes[media_file] = file_size
+            self.__refcounts[media_file] = refcount + 1
+        return new_file_sizes
+
+    def remove_files(self, files: Iterable[MediaFile]) -> None:
+        for media_file in files:
+            refcount: int = self.__refcounts.get(media_file, 0)
+            if refcount > 1:
+                self.__refcounts[media_file] = refcount - 1
+            elif refcount == 1:
+                del self.__refcounts[media_file]
+                file_size: FileSize = self.__sizes.pop(media_file)
+                self.__total_size -= file_size.size
+                if not file_size.exists:
+                    self.__missing_files_number -= 1
+
+    def update_file_size(self, media_file: MediaFile, file_size: FileSize) -> bool:
+        old_file_size: Optional[FileSize] = self.__sizes.get(media_file)
+        if old_file_size is None or old_file_size == file_size:
+            return False
+        self.__sizes[media_file] = file_size
+        self.__total_size += file_size.size - old_file_size.size
+        self.__missing_files_number += int(not file_size.exists) - int(not old_file_size.exists)
+        return True
+
+    def get_total_size(self) -> SizeBytes:
+        return self.__total_size
+
+    def get_files_number(self) -> FilesNumber:
+        return FilesNumber(len(self.__refcounts))
+
+    def get_missing_files_number(self) -> FilesNumber:
+        return FilesNumber(self.__missing_files_number)
+
+    def get_file_sizes(self) -> dict[MediaFile, FileSize]:
+        return dict(self.__sizes)
+
+    def get_refcounts(self) -> dict[MediaFile, int]:
+        return dict(self.__refcounts)
+
+    def clear(self) -> None:
+        self.__refcounts.clear()
+        self.__sizes.clear()
+        self.__total_size = SizeBytes(0)
+        self.__missing_files_number = 0
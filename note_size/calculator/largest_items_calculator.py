@@ -0,0 +1,66 @@
+import heapq
+import logging
+from array import array
+from logging import Logger
+from typing import Optional, Sequence
+
+from anki.notes import NoteId
+
+from ..cache.group_size_cache import GroupSizeCache, GroupKey, GroupSize
+from ..cache.media_cache import MediaCache
+from ..common.collection_holder import CollectionHolder
+from ..common.types import SizeBytes, MediaFile, SizeType, FileSize, GroupType
+from ..calculator.size_calculator import SizeCalculator
+
+log: Logger = logging.getLogger(__name__)
+
+
+class LargestItemsCalculator:
+
+    def __init__(self, collection_holder: CollectionHolder, size_calculator: SizeCalculator,
+                 media_cache: MediaCache, group_size_cache: GroupSizeCache) -> None:
+        self.__collection_holder: CollectionHolder = collection_holder
+        self.__size_calculator: SizeCalculator = size_calculator
+        self.__media_cache: MediaCache = media_cache
+        self.__group_size_cache: GroupSizeCache = group_size_cache
+        log.debug(f"{self.__class__.__name__} was instantiated")
+
+    def get_largest_notes(self, size_type: SizeType, number: int,
+                          note_ids: Optional[Sequence[NoteId]] = None) -> list[tuple[NoteId, SizeBytes]]:
+        if note_ids is None and self.__is_collection_cached(size_type):
+            log.debug(f"Select largest notes from cache: size_type={size_type}, number={number}")
+            return self.__size_calculator.get_largest_note_sizes(size_type, number)
+        if note_ids is None:
+            note_ids: list[NoteId] = self.__get_all_note_ids()
+        log.debug(f"Select largest notes: size_type={size_type}, number={number}, notes={len(note_ids)}")
+        sizes: array = self.__size_calculator.get_note_sizes(note_ids, size_type, use_cache=True)
+        indexes: list[int] = heapq.nlargest(number, range(len(sizes)), key=sizes.__getitem__)
+        return [(note_ids[index], SizeBytes(sizes[index])) for index in indexes]
+
+    def get_largest_files(self, number: int,
+                          note_ids: Optional[Sequence[NoteId]] = None) -> list[tuple[MediaFile, FileSize]]:
+        if note_ids is None and self.__is_collection_cached(SizeType.FILES):
+            files: set[MediaFile] = self.__size_calculator.get_cached_files()
+        else:
+            if note_ids is None:
+                note_ids: list[NoteId] = self.__get_all_note_ids()
+            files: set[MediaFile] = self.__size_calculator.get_notes_files(note_ids, use_cache=True)
+        log.debug(f"Select largest files: number={number}, files={len(files)}")
+        return self.__media_cache.get_largest_file_sizes(files, number)
+
+    def get_largest_groups(self, group_type: GroupType, number: int) -> list[tuple[GroupKey, GroupSize]]:
+        group_sizes: dict[GroupKey, GroupSize] = self.__group_size_cache.get_group_sizes(group_type)
+        log.debug(f"Select largest groups: group_type={group_type}, number={number}, groups={len(group_sizes)}")
+        group_keys: list[GroupKey] = heapq.nlargest(
+            number, group_sizes, key=lambda group_key: group_sizes[group_key].get_total_size())
+        return [(group_key, group_sizes[group_key]) for group_key in group_keys]
+
+    def __is_collection_cached(self, size_type: SizeType) -> bool:
+        cached_notes_number: int = self.__size_calculator.get_cached_note_sizes_number(size_type)
+        return cached_notes_number > 0 and cached_notes_number >= self.__collection_holder.col().note_count()
+
+    def __get_all_note_ids(self) -> list[NoteId]:
+        return self.__collection_holder.col().db.list("select id from notes")
+
+    def __del__(self):
+        log.debug(f"{self.__class__.__name__} was deleted")
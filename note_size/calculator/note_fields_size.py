@@ -0,0 +1,99 @@
+import logging
+from logging import Logger
+from typing import Optional
+
+from anki.models import NotetypeId
+from anki.notes import Note, NoteId
+
+from .file_refcounts import FileRefcounts
+from ..cache.media_cache import MediaCache
+from ..common.collection_holder import CollectionHolder
+from ..common.types import SizeBytes, MediaFile, SizeType, FileSize
+
+log: Logger = logging.getLogger(__name__)
+
+
+class _FieldSize:
+    def __init__(self, content: str, texts_size: SizeBytes, files: set[MediaFile]) -> None:
+        self.content: str = content
+        self.texts_size: SizeBytes = texts_size
+        self.files: set[MediaFile] = files
+
+
+class NoteFieldsSize:
+
+    def __init__(self, collection_holder: CollectionHolder, media_cache: MediaCache) -> None:
+        self.__collection_holder: CollectionHolder = collection_holder
+        self.__media_cache: MediaCache = media_cache
+        self.__note_id: Optional[NoteId] = None
+        self.__note_type_id: Optional[NotetypeId] = None
+        self.__fields: list[_FieldSize] = []
+        self.__texts_size: SizeBytes = SizeBytes(0)
+        self.__file_refcounts: FileRefcounts = FileRefcounts()
+        log.debug(f"{self.__class__.__name__} was instantiated")
+
+    def update(self, note: Note) -> None:
+        if note.id != self.__note_id or note.mid != self.__note_type_id or len(note.fields) != len(self.__fields):
+            self.__load(note)
+            return
+        for index, content in enumerate(note.fields):
+            field: _FieldSize = self.__fields[index]
+            if content is not field.content and content != field.content:
+                self.__update_field(index, content)
+
+    def update_file_sizes(self, note_id: NoteId) -> bool:
+        if note_id != self.__note_id:
+            return False
+        # Files can be replaced on disk while the note is open, so their sizes are read again bypassing the cache
+        updated_files: list[MediaFile] = [
+            media_file for media_file in self.__file_refcounts.get_refcounts()
+            if self.__file_refcounts.update_file_size(
+                media_file, self.__media_cache.get_file_size(media_file, use_cache=False))]
+        if len(updated_files) > 0:
+            log.debug(f"Note files were updated: note_id={note_id}, files={len(updated_files)}")
+        return len(updated_files) > 0
+
+    def get_size(self, size_type: SizeType) -> SizeBytes:
+        if size_type == SizeType.TOTAL:
+            return SizeBytes(self.__texts_size + self.__file_refcounts.get_total_size())
+        elif size_type == SizeType.TEXTS:
+            return self.__texts_size
+        elif size_type == SizeType.FILES:
+            return self.__file_refcounts.get_total_size()
+        else:
+            raise ValueError(f"Size type is not supported: {size_type}")
+
+    def clear(self) -> None:
+        self.__note_id = None
+        self.__note_type_id = None
+        self.__fields = []
+        self.__texts_size = SizeBytes(0)
+        self.__file_refcounts.clear()
+
+    def __load(self, note: Note) -> None:
+        log.debug(f"Load note fields: note_id={note.id}, fields={len(note.fields)}")
+        self.clear()
+        self.__note_id = note.id
+        self.__note_type_id = note.mid
+        for content in note.fields:
+            self.__fields.append(_FieldSize("", SizeBytes(0), set()))
+            self.__update_field(len(self.__fields) - 1, content)
+
+    def __update_field(self, index: int, content: str) -> None:
+        field: _FieldSize = self.__fields[index]
+        files: set[MediaFile] = set(self.__collection_holder.col().media.files_in_str(self.__note_type_id, content))
+        texts_size: SizeBytes = SizeBytes(len(content.encode()))
+        self.__file_refcounts.add_files({media_file: self.__get_file_size(media_file)
+                                         for media_file in files if media_file not in field.files})
+        self.__file_refcounts.remove_files([media_file for media_file in field.files if media_file not in files])
+        self.__texts_size += texts_size - field.texts_size
+        self.__fields[index] = _FieldSize(content, texts_size, files)
+
+    def __get_file_size(self, media_file: MediaFile) -> FileSize:
+        file_size: FileSize = self.__media_cache.get_file_size(media_file, use_cache=True)
+        if not file_size.exists:
+            file_size = self.__media_cache.get_file_size(media_file, use_cache=False)
+        return file_size
+
+    def __del__(self):
+        log.debug(f"{self.__class__.__name__} was deleted")
@@ -0,0 +1,276 @@
+import heapq
+import logging
+from array import array
+from bisect import bisect_left
+from logging import Logger
+from typing import Optional, Sequence
+
+from anki.notes import NoteId
+
+from ..common.types import SizeBytes, SizeType
+
+log: Logger = logging.getLogger(__name__)
+
+
+class NoteSizeStore:
+    __absent: int = -1
+    __min_merge_threshold: int = 1024
+    __scan_ratio: int = 8
+    __largest_block_size: int = 512
+
+    def __init__(self) -> None:
+        self.__note_ids: array = array("q")
+        self.__texts: array = array("q")
+        self.__files: array = array("q")
+        self.__totals: array = array("q")
+        self.__pending: dict[NoteId, list[int]] = {}
+        self.__texts_number: int = 0
+        self.__files_number: int = 0
+        self.__totals_number: int = 0
+        self.__removed_number: int = 0
+
+    def get_size(self, note_id: NoteId, size_type: SizeType) -> Optional[SizeBytes]:
+        texts, files = self.__get_row(note_id)
+        size: int = self.__size_of_row(texts, files, size_type)
+        return SizeBytes(size) if size != self.__absent else None
+
+    def get_sizes(self, note_ids: Sequence[NoteId], size_type: SizeType) -> array:
+        indexes: array = self.__find_indexes(note_ids)
+        if size_type == SizeType.TOTAL:
+            totals: array = self.__select(self.__totals, indexes)
+            self.__overlay_pending(note_ids, totals, 2)
+            return totals
+        elif size_type == SizeType.TEXTS:
+            texts: array = self.__select(self.__texts, indexes)
+            self.__overlay_pending(note_ids, texts, 0)
+            return texts
+        elif size_type == SizeType.FILES:
+            files: array = self.__select(self.__files, indexes)
+            self.__overlay_pending(note_ids, files, 1)
+            return files
+        else:
+            raise ValueError(f"Size type is not supported: {size_type}")
+
+    def set_size(self, note_id: NoteId, size_type: SizeType, size: SizeBytes) -> None:
+        texts, files = self.__get_row(note_id)
+        if size_type == SizeType.TEXTS:
+            self.__set_row(note_id, texts, files, size, files)
+        elif size_type == SizeType.FILES:
+            self.__set_row(note_id, texts, files, texts, size)
+        else:
+            raise ValueError(f"Size type is not stored: {size_type}")
+
+    def set_sizes(self, note_id: NoteId, texts_size: SizeBytes, files_size: SizeBytes) -> None:
+        texts, files = self.__get_row(note_id)
+        self.__set_row(note_id, texts, files, texts_size, files_size)
+
+    def remove(self, note_id: NoteId) -> None:
+        texts, files = self.__get_row(note_id)
+        if texts != self.__absent or files != self.__absent:
+            self.__set_row(note_id, texts, files, self.__absent, self.__absent)
+
+    def get_notes_number(self, size_type: SizeType) -> int:
+        if size_type == SizeType.TOTAL:
+            return self.__totals_number
+        elif size_type == SizeType.TEXTS:
+            return self.__texts_number
+        elif size_type == SizeType.FILES:
+            return self.__files_number
+        else:
+            raise ValueError(f"Size type is not supported: {size_type}")
+
+    def get_largest(self, size_type: SizeType, number: int) -> list[tuple[NoteId, SizeBytes]]:
+        self.__merge_pending()
+        sizes: array = self.__get_column(size_type)
+        block_size: int = self.__largest_block_size
+        block_maxima: list[int] = [max(sizes[start:start + block_size]) for start in range(0, len(sizes), block_size)]
+        largest_maxima: list[int] = heapq.nlargest(number, block_maxima)
+        if len(largest_maxima) == 0:
+            return []
+        # The N-th largest size is not less than the N-th largest block maximum, so smaller blocks are skipped,
+        # and only the first N sizes equal to that maximum can be in the result
+        min_block_max: int = max(largest_maxima[-1], 0) if len(largest_maxima) == number else 0
+        ties_number: int = number
+        indexes: list[int] = []
+        for block, block_max in enumerate(block_maxima):
+            if block_max > min_block_max or (block_max == min_block_max and ties_number > 0):
+                start: int = block * block_size
+                for index, size in enumerate(sizes[start:start + block_size], start):
+                    if size > min_block_max:
+                        indexes.append(index)
+                    elif size == min_block_max and ties_number > 0:
+                        indexes.append(index)
+                        ties_number -= 1
+        largest_indexes: list[int] = heapq.nlargest(number, indexes, key=sizes.__getitem__)
+        return [(NoteId(self.__note_ids[index]), SizeBytes(sizes[index])) for index in largest_indexes
+                if sizes[index] != self.__absent]
+
+    def as_dict(self, size_type: SizeType) -> dict[NoteId, SizeBytes]:
+        self.__merge_pending()
+        sizes: array = self.__get_column(size_type)
+        return {note_id: size for note_id, size in zip(self.__note_ids, sizes) if size != self.__absent}
+
+    def load(self, texts_sizes: dict[NoteId, SizeBytes], files_sizes: dict[NoteId, SizeBytes]) -> None:
+        note_ids: list[NoteId] = sorted(set(texts_sizes.keys()).union(files_sizes.keys()))
+        self.clear()
+        self.__note_ids = array("q", note_ids)
+        self.__texts = array("q", [texts_sizes.get(note_id, self.__absent) for note_id in note_ids])
+        self.__files = array("q", [files_sizes.get(note_id, self.__absent) for note_id in note_ids])
+        self.__totals = array("q", [self.__size_of_row(texts, files, SizeType.TOTAL)
+                                    for texts, files in zip(self.__texts, self.__files)])
+        self.__texts_number = len(texts_sizes)
+        self.__files_number = len(files_sizes)
+        self.__totals_number = sum(1 for note_id in texts_sizes.keys() if note_id in files_sizes)
+
+    def clear(self) -> None:
+        self.__note_ids = array("q")
+        self.__texts = array("q")
+        self.__files = array("q")
+        self.__totals = array("q")
+        self.__pending = {}
+        self.__texts_number = 0
+        self.__files_number = 0
+        self.__totals_number = 0
+        self.__removed_number = 0
+
+    def __get_row(self, note_id: NoteId) -> tuple[int, int]:
+        row: Optional[list[int]] = self.__pending.get(note_id)
+        if row is not None:
+            return row[0], row[1]
+        index: int = self.__find_index(note_id)
+        if index >= 0:
+            return self.__texts[index], self.__files[index]
+        return self.__absent, self.__absent
+
+    def __set_row(self, note_id: NoteId, old_texts: int, old_files: int, texts: int, files: int) -> None:
+        self.__texts_number += (texts != self.__absent) - (old_texts != self.__absent)
+        self.__files_number += (files != self.__absent) - (old_files != self.__absent)
+        self.__totals_number += (self.__is_total_present(texts, files) -
+                                 self.__is_total_present(old_texts, old_files))
+        is_removed: bool = texts == self.__absent and files == self.__absent
+        total: int = self.__size_of_row(texts, files, SizeType.TOTAL)
+        if note_id in self.__pending:
+            if is_removed:
+                del self.__pending[note_id]
+            else:
+                self.__pending[note_id] = [texts, files, total]
+            return
+        if len(self.__note_ids) == 0 or note_id > self.__note_ids[-1]:
+            if not is_removed:
+                self.__note_ids.append(note_id)
+                self.__texts.append(texts)
+                self.__files.append(files)
+                self.__totals.append(total)
+            return
+        index: int = self.__find_index(note_id)
+        if index >= 0:
+            was_removed: bool = old_texts == self.__absent and old_files == self.__absent
+            self.__removed_number += is_removed - was_removed
+            self.__texts[index] = texts
+            self.__files[index] = files
+            self.__totals[index] = total
+            if self.__removed_number > max(self.__min_merge_threshold, len(self.__note_ids) // 4):
+                self.__merge_pending()
+        elif not is_removed:
+            self.__pending[note_id] = [texts, files, total]
+            if len(self.__pending) > max(self.__min_merge_threshold, len(self.__note_ids) // 4):
+                self.__merge_pending()
+
+    def __find_index(self, note_id: NoteId) -> int:
+        index: int = bisect_left(self.__note_ids, note_id)
+        if index < len(self.__note_ids) and self.__note_ids[index] == note_id:
+            return index
+        return -1
+
+    def __find_indexes(self, note_ids: Sequence[NoteId]) -> array:
+        stored_note_ids: array = self.__note_ids
+        stored_number: int = len(stored_note_ids)
+        indexes: array = array("q", [-1]) * len(note_ids)
+        if len(note_ids) * self.__scan_ratio < stored_number:
+            for position, note_id in enumerate(note_ids):
+                indexes[position] = self.__find_index(note_id)
+        else:
+            # Walk both sorted sequences at once: cheaper than a binary search per note for large selections
+            index: int = 0
+            for position in sorted(range(len(note_ids)), key=note_ids.__getitem__):
+                note_id: NoteId = note_ids[position]
+                while index < stored_number and stored_note_ids[index] < note_id:
+                    index += 1
+                if index < stored_number and stored_note_ids[index] == note_id:
+                    indexes[position] = index
+        return indexes
+
+    @staticmethod
+    def __select(column: array, indexes: array) -> array:
+        return array("q", [column[index] if index >= 0 else -1 for index in indexes])
+
+    def __overlay_pending(self, note_ids: Sequence[NoteId], sizes: array, column: int) -> None:
+        if len(self.__pending) > 0:
+            for position, note_id in enumerate(note_ids):
+                row: Optional[list[int]] = self.__pending.get(note_id)
+                if row is not None:
+                    sizes[position] = row[column]
+
+    def __merge_pending(self) -> None:
+        if len(self.__pending) == 0 and self.__removed_number == 0:
+            return
+        note_ids: array = array("q")
+        texts: array = array("q")
+        files: array = array("q")
+        totals: array = array("q")
+        start: int = 0
+        for note_id, (note_texts, note_files, note_total) in sorted(self.__pending.items()):
+            end: int = bisect_left(self.__note_ids, note_id, start)
+            note_ids.extend(self.__note_ids[start:end])
+            texts.extend(self.__texts[start:end])
+            files.extend(self.__files[start:end])
+            totals.extend(self.__totals[start:end])
+            note_ids.append(note_id)
+            texts.append(note_texts)
+            files.append(note_files)
+            totals.append(note_total)
+            start = end
+        note_ids.extend(self.__note_ids[start:])
+        texts.extend(self.__texts[start:])
+        files.extend(self.__files[start:])
+        totals.extend(self.__totals[start:])
+        if self.__removed_number > 0:
+            kept: list[int] = [index for index, (note_texts, note_files) in enumerate(zip(texts, files))
+                               if note_texts != self.__absent or note_files != self.__absent]
+            note_ids = array("q", [note_ids[index] for index in kept])
+            texts = array("q", [texts[index] for index in kept])
+            files = array("q", [files[index] for index in kept])
+            totals = array("q", [totals[index] for index in kept])
+        log.debug(f"Pending note sizes were merged: pending={len(self.__pending)}, removed={self.__removed_number}, "
+                  f"notes={len(note_ids)}")
+        self.__note_ids = note_ids
+        self.__texts = texts
+        self.__files = files
+        self.__totals = totals
+        self.__pending = {}
+        self.__removed_number = 0
+
+    def __get_column(self, size_type: SizeType) -> array:
+        if size_type == SizeType.TOTAL:
+            return self.__totals
+        elif size_type == SizeType.TEXTS:
+            return self.__texts
+        elif size_type == SizeType.FILES:
+            return self.__files
+        else:
+            raise ValueError(f"Size type is not supported: {size_type}")
+
+    @staticmethod
+    def __size_of_row(texts: int, files: int, size_type: SizeType) -> int:
+        if size_type == SizeType.TOTAL:
+            return texts + files if NoteSizeStore.__is_total_present(texts, files) else NoteSizeStore.__absent
+        elif size_type == SizeType.TEXTS:
+            return texts
+        elif size_type == SizeType.FILES:
+            return files
+        else:
+            raise ValueError(f"Size type is not supported: {size_type}")
+
+    @staticmethod
+    def __is_total_present(texts: int, files: int) -> bool:
+        return texts != NoteSizeStore.__absent and files != NoteSizeStore.__absent
@@ -0,0 +1,141 @@
+import logging
+from array import array
+from logging import Logger
+from threading import RLock
+from typing import Iterable, Optional, Callable
+
+from anki.notes import NoteId
+from anki.utils import ids2str
+
+from .file_refcounts import FileRefcounts
+from .size_calculator import SizeCalculator
+from ..common.collection_holder import CollectionHolder
+from ..common.types import SizeBytes, MediaFile, SizeType, FileSize, FilesNumber
+
+log: Logger = logging.getLogger(__name__)
+
+
+class _SelectedNote:
+    def __init__(self, texts_size: SizeBytes, files: list[MediaFile]) -> None:
+        self.texts_size: SizeBytes = texts_size
+        self.files: list[MediaFile] = files
+
+
+class NotesSelection:
+    __first_chunk_size: int = 1000
+
+    def __init__(self, collection_holder: CollectionHolder, size_calculator: SizeCalculator) -> None:
+        self.__lock: RLock = RLock()
+        self.__collection_holder: CollectionHolder = collection_holder
+        self.__size_calculator: SizeCalculator = size_calculator
+        self.__selected_notes: dict[NoteId, _SelectedNote] = {}
+        self.__outdated_note_ids: set[NoteId] = set()
+        self.__texts_size: SizeBytes = SizeBytes(0)
+        self.__file_refcounts: FileRefcounts = FileRefcounts()
+        log.debug(f"{self.__class__.__name__} was instantiated")
+
+    def set_note_ids(self, note_ids: Iterable[NoteId],
+                     on_files_added: Optional[Callable[[dict[MediaFile, FileSize]], None]] = None) -> None:
+        with self.__lock:
+            new_note_ids: set[NoteId] = set(note_ids)
+            self.__outdated_note_ids &= new_note_ids
+            removed_note_ids: list[NoteId] = [note_id for note_id in self.__selected_notes
+                                              if note_id not in new_note_ids]
+            added_note_ids: list[NoteId] = [note_id for note_id in new_note_ids
+                                            if note_id not in self.__selected_notes]
+            log.debug(f"Update selection: added={len(added_note_ids)}, removed={len(removed_note_ids)}")
+            self.remove_notes(removed_note_ids)
+            if on_files_added and self.__file_refcounts.get_files_number() > 0:
+                on_files_added(self.__file_refcounts.get_file_sizes())
+            self.add_notes(added_note_ids, on_files_added)
+
+    def add_notes(self, note_ids: Iterable[NoteId],
+                  on_files_added: Optional[Callable[[dict[MediaFile, FileSize]], None]] = None) -> None:
+        with self.__lock:
+            added_note_ids: list[NoteId] = [note_id for note_id in dict.fromkeys(note_ids)
+                                            if note_id not in self.__selected_notes]
+            start: int = 0
+            chunk_size: int = self.__first_chunk_size
+            while start < len(added_note_ids):
+                # Growing chunks report the first files quickly while keeping the number of reports logarithmic
+                self.__add_notes_chunk(added_note_ids[start:start + chunk_size], on_files_added)
+                start += chunk_size
+                chunk_size *= 2
+
+    def remove_notes(self, note_ids: Iterable[NoteId]) -> None:
+        with self.__lock:
+            for note_id in note_ids:
+                selected_note: Optional[_SelectedNote] = self.__selected_notes.pop(note_id, None)
+                if selected_note:
+                    self.__file_refcounts.remove_files(selected_note.files)
+                    self.__texts_size -= selected_note.texts_size
+                self.__outdated_note_ids.discard(note_id)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__selected_notes.clear()
+            self.__outdated_note_ids.clear()
+            self.__texts_size = SizeBytes(0)
+            self.__file_refcounts.clear()
+
+    def evict_note(self, note_id: NoteId) -> None:
+        with self.__lock:
+            if note_id in self.__selected_notes:
+                self.remove_notes([note_id])
+                self.__outdated_note_ids.add(note_id)
+
+    def get_size(self, size_type: SizeType) -> SizeBytes:
+        with self.__lock:
+            self.__refresh()
+            if size_type == SizeType.TOTAL:
+                return SizeBytes(self.__texts_size + self.__file_refcounts.get_total_size())
+            elif size_type == SizeType.TEXTS:
+                return self.__texts_size
+            elif size_type == SizeType.FILES:
+                return self.__file_refcounts.get_total_size()
+            else:
+                raise ValueError(f"Size type is not supported: {size_type}")
+
+    def get_notes_number(self) -> int:
+        with self.__lock:
+            return len(self.__selected_notes) + len(self.__outdated_note_ids)
+
+    def get_files_number(self) -> FilesNumber:
+        with self.__lock:
+            self.__refresh()
+            return self.__file_refcounts.get_files_number()
+
+    def get_missing_files_number(self) -> FilesNumber:
+        with self.__lock:
+            self.__refresh()
+            return self.__file_refcounts.get_missing_files_number()
+
+    def get_file_sizes(self) -> dict[MediaFile, FileSize]:
+        with self.__lock:
+            self.__refresh()
+            return self.__file_refcounts.get_file_sizes()
+
+    def __add_notes_chunk(self, note_ids: list[NoteId],
+                          on_files_added: Optional[Callable[[dict[MediaFile, FileSize]], None]]) -> None:
+        texts_sizes: array = self.__size_calculator.get_note_sizes(note_ids, SizeType.TEXTS, use_cache=True)
+        new_file_sizes: dict[MediaFile, FileSize] = {}
+        for note_id, texts_size in zip(note_ids, texts_sizes):
+            file_sizes: dict[MediaFile, FileSize] = self.__size_calculator.get_note_file_sizes(note_id, use_cache=True)
+            new_file_sizes.update(self.__file_refcounts.add_files(file_sizes))
+            self.__texts_size += texts_size
+            self.__selected_notes[note_id] = _SelectedNote(SizeBytes(texts_size), list(file_sizes.keys()))
+            self.__outdated_note_ids.discard(note_id)
+        if on_files_added and len(new_file_sizes) > 0:
+            on_files_added(new_file_sizes)
+
+    def __refresh(self) -> None:
+        if len(self.__outdated_note_ids) > 0:
+            existing_note_ids: list[NoteId] = self.__collection_holder.col().db.list(
+                f"select id from notes where id in {ids2str(self.__outdated_note_ids)}")
+            log.debug(f"Refresh evicted notes of selection: evicted={len(self.__outdated_note_ids)}, "
+                      f"existing={len(existing_note_ids)}")
+            self.__outdated_note_ids.clear()
+            self.add_notes(existing_note_ids)
+
+    def __del__(self):
+        log.debug(f"{self.__class__.__name__} was deleted")
@@ -1,11 +1,14 @@
 import logging
+from array import array
+from concurrent.futures import Executor
 from logging import Logger
-from typing import Any, Sequence
+from typing import Any, Optional, Sequence
 
 from anki.models import NotetypeId
 from anki.notes import Note, NoteId
 
 from .note_helper import NoteHelper
+from .note_size_store import NoteSizeStore
 from ..cache.cache import Cache
 from ..cache.media_cache import MediaCache
 from ..common.collection_holder import CollectionHolder
@@ -15,12 +18,17 @@ log: Logger = logging.getLogger(__name__)
 
 
 class _Caches:
-    size_caches: dict[SizeType, dict[NoteId, SizeBytes]] = {}
+    note_sizes: NoteSizeStore = NoteSizeStore()
     note_files_cache: dict[NoteId, set[MediaFile]] = {}
+    file_note_ids_cache: dict[MediaFile, set[NoteId]] = {}
     note_file_sizes_cache: dict[NoteId, dict[MediaFile, FileSize]] = {}
+    note_mods_cache: dict[NoteId, int] = {}
+    collection_stamps: dict[str, int] = {}
 
 
 class SizeCalculator(Cache):
+    collection_schema_key: str = "schema"
+    collection_mod_key: str = "mod"
 
     def __init__(self, collection_holder: CollectionHolder, media_cache: MediaCache):
         super().__init__()
@@ -32,9 +40,9 @@ class SizeCalculator(Cache):
 
     def calculate_note_size(self, note: Note, size_type: SizeType, use_cache: bool) -> SizeBytes:
         with self._lock:
-            cache: dict[NoteId, SizeBytes] = self.__caches.size_caches[size_type]
-            if NoteHelper.is_note_saved(note) and use_cache and note.id in cache:
-                return cache[note.id]
+            cached_size: Optional[SizeBytes] = self.__caches.note_sizes.get_size(note.id, size_type)
+            if NoteHelper.is_note_saved(note) and use_cache and cached_size is not None:
+                return cached_size
             else:
                 if size_type == SizeType.TOTAL:
                     texts_size: SizeBytes = self.calculate_note_size(note, SizeType.TEXTS, use_cache)
@@ -45,18 +53,39 @@ class SizeCalculator(Cache):
                 if size_type == SizeType.FILES:
                     size: SizeBytes = SizeBytes(
                         sum([file_size.size for file_size in self.calculate_note_file_sizes(note, use_cache).values()]))
-                cache[note.id] = size
+                if size_type != SizeType.TOTAL:
+                    self.__caches.note_sizes.set_size(note.id, size_type, size)
+                self.__stamp_note(note)
                 return size
 
     def get_note_size(self, note_id: NoteId, size_type: SizeType, use_cache: bool) -> SizeBytes:
         with self._lock:
-            cache: dict[NoteId, SizeBytes] = self.__caches.size_caches[size_type]
-            if NoteHelper.is_note_id_saved(note_id) and use_cache and note_id in cache:
-                return cache[note_id]
+            cached_size: Optional[SizeBytes] = self.__caches.note_sizes.get_size(note_id, size_type)
+            if NoteHelper.is_note_id_saved(note_id) and use_cache and cached_size is not None:
+                return cached_size
             else:
                 note: Note = self.__collection_holder.col().get_note(note_id)
                 return self.calculate_note_size(note, size_type, use_cache)
 
+    def get_note_sizes(self, note_ids: Sequence[NoteId], size_type: SizeType, use_cache: bool) -> array:
+        with self._lock:
+            if use_cache:
+                sizes: array = self.__caches.note_sizes.get_sizes(note_ids, size_type)
+            else:
+                sizes: array = array("q", [-1]) * len(note_ids)
+            for index, size in enumerate(sizes):
+                if size < 0:
+                    sizes[index] = self.get_note_size(note_ids[index], size_type, use_cache)
+            return sizes
+
+    def get_largest_note_sizes(self, size_type: SizeType, number: int) -> list[tuple[NoteId, SizeBytes]]:
+        with self._lock:
+            return self.__caches.note_sizes.get_largest(size_type, number)
+
+    def get_cached_note_sizes_number(self, size_type: SizeType) -> int:
+        with self._lock:
+            return self.__caches.note_sizes.get_notes_number(size_type)
+
     def calculate_note_file_sizes(self, note: Note, use_cache: bool) -> dict[MediaFile, FileSize]:
         with self._lock:
             cache: dict[NoteId, dict[MediaFile, FileSize]] = self.__caches.note_file_sizes_cache
@@ -64,7 +93,7 @@ class SizeCalculator(Cache):
                 return cache[note.id]
             else:
                 files: set[MediaFile] = self.calculate_note_files(note, use_cache)
-                file_sizes: dict[MediaFile, FileSize] = self.__calculate_note_file_sizes(files)
+                file_sizes: dict[MediaFile, FileSize] = self.__calculate_note_file_sizes(files, use_cache)
                 cache[note.id] = file_sizes
                 return file_sizes
 
@@ -87,21 +116,32 @@ class SizeCalculator(Cache):
                 for field in note.fields:
                     files: list[MediaFile] = self.__parse_files_from_field(note.mid, field)
                     all_files.update(files)
-                cache[note.id] = all_files
+                if NoteHelper.is_note_saved(note):
+                    self.__set_note_files(note.id, all_files)
+                else:
+                    cache[note.id] = all_files
+                self.__stamp_note(note)
                 return all_files
 
-    def initialize_note_in_caches(self, note_id: NoteId, note_type_id: NotetypeId, fields: str) -> None:
+    def initialize_note_in_caches(self, note_id: NoteId, note_type_id: NotetypeId, fields: str, mod: int) -> None:
         with self._lock:
             files: set[MediaFile] = set(self.__parse_files_from_field(note_type_id, fields))
             file_sizes: dict[MediaFile, FileSize] = self.__calculate_note_file_sizes(files)
-            self.__caches.note_files_cache[note_id] = files
-            text_size_cache: dict[NoteId, SizeBytes] = self.__caches.size_caches[SizeType.TEXTS]
-            files_size_cache: dict[NoteId, SizeBytes] = self.__caches.size_caches[SizeType.FILES]
-            total_size_cache: dict[NoteId, SizeBytes] = self.__caches.size_caches[SizeType.TOTAL]
-            text_size_cache[note_id] = SizeBytes(len(fields.encode()))
-            files_size_cache[note_id] = SizeBytes(sum([file_size.size for file_size in file_sizes.values()]))
-            total_size_cache[note_id] = SizeBytes(text_size_cache[note_id] + files_size_cache[note_id])
-            self.__caches.note_file_sizes_cache[note_id] = file_sizes
+            self.__put_note_in_caches(note_id, fields, files, file_sizes)
+            self.__caches.note_mods_cache[note_id] = mod
+
+    def initialize_notes_in_caches(self, notes: Sequence[tuple[NoteId, NotetypeId, str, int]],
+                                   executor: Executor) -> None:
+        notes_files: list[set[MediaFile]] = list(executor.map(
+            lambda note: set(self.__parse_files_from_field(note[1], note[2])), notes))
+        all_files: set[MediaFile] = set[MediaFile]().union(*notes_files)
+        file_sizes: dict[MediaFile, FileSize] = self.__media_cache.get_file_sizes(all_files, executor)
+        with self._lock:
+            for (note_id, _, fields, mod), files in zip(notes, notes_files):
+                note_file_sizes: dict[MediaFile, FileSize] = {media_file: file_sizes[media_file]
+                                                              for media_file in files}
+                self.__put_note_in_caches(note_id, fields, files, note_file_sizes)
+                self.__caches.note_mods_cache[note_id] = mod
 
     def get_note_files(self, note_id: NoteId, use_cache: bool) -> set[MediaFile]:
         with self._lock:
@@ -112,6 +152,34 @@ class SizeCalculator(Cache):
                 note: Note = self.__collection_holder.col().get_note(note_id)
                 return self.calculate_note_files(note, use_cache)
 
+    def get_file_note_ids(self, media_file: MediaFile) -> set[NoteId]:
+        with self._lock:
+            return set(self.__caches.file_note_ids_cache.get(media_file, set()))
+
+    def get_cached_files(self) -> set[MediaFile]:
+        with self._lock:
+            return set(self.__caches.file_note_ids_cache.keys())
+
+    def is_note_cached(self, note_id: NoteId) -> bool:
+        with self._lock:
+            return note_id in self.__caches.note_mods_cache
+
+    def get_cached_note_number(self) -> int:
+        with self._lock:
+            return len(self.__caches.note_mods_cache)
+
+    def get_note_mods(self) -> dict[NoteId, int]:
+        with self._lock:
+            return dict(self.__caches.note_mods_cache)
+
+    def get_collection_stamps(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self.__caches.collection_stamps)
+
+    def set_collection_stamps(self, schema: int, mod: int) -> None:
+        with self._lock:
+            self.__caches.collection_stamps = {self.collection_schema_key: schema, self.collection_mod_key: mod}
+
     def calculate_size_of_files(self, files: set[MediaFile], use_cache: bool) -> SizeBytes:
         with self._lock:
             return SizeBytes(sum([self.__media_cache.get_file_size(file, use_cache).size for file in files]))
@@ -147,37 +215,46 @@ class SizeCalculator(Cache):
 
     def evict_note(self, note_id: NoteId) -> None:
         with self._lock:
-            for size_type in SizeType:
-                cache: dict[NoteId, SizeBytes] = self.__caches.size_caches[size_type]
-                if note_id in cache:
-                    del cache[note_id]
+            self.__caches.note_sizes.remove(note_id)
             if note_id in self.__caches.note_file_sizes_cache:
                 del self.__caches.note_file_sizes_cache[note_id]
-            if note_id in self.__caches.note_files_cache:
-                del self.__caches.note_files_cache[note_id]
+            self.__remove_note_files(note_id)
+            self.__caches.note_mods_cache.pop(note_id, None)
 
     def invalidate_cache(self) -> None:
         with self._lock:
-            self.__caches.size_caches = {SizeType.TOTAL: {}, SizeType.TEXTS: {}, SizeType.FILES: {}}
+            self.__caches.note_sizes = NoteSizeStore()
             self.__caches.note_files_cache.clear()
+            self.__caches.file_note_ids_cache.clear()
             self.__caches.note_file_sizes_cache.clear()
+            self.__caches.note_mods_cache.clear()
+            self.__caches.collection_stamps = {}
 
     def as_dict_list(self) -> list[dict[Any, Any]]:
         with self._lock:
-            return [self.__caches.size_caches, self.__caches.note_files_cache, self.__caches.note_file_sizes_cache]
+            size_caches: dict[SizeType, dict[NoteId, SizeBytes]] = {
+                size_type: self.__caches.note_sizes.as_dict(size_type) for size_type in SizeType}
+            return [size_caches, self.__caches.note_files_cache, self.__caches.note_file_sizes_cache,
+                    self.__caches.note_mods_cache, self.__caches.collection_stamps]
 
     def read_from_dict_list(self, caches: list[dict[Any, Any]]):
         with self._lock:
-            self.__caches.size_caches = caches[0]
+            self.__caches.note_sizes = NoteSizeStore()
+            self.__caches.note_sizes.load(caches[0][SizeType.TEXTS], caches[0][SizeType.FILES])
             self.__caches.note_files_cache = caches[1]
             self.__caches.note_file_sizes_cache = caches[2]
+            self.__caches.note_mods_cache = caches[3]
+            self.__caches.collection_stamps = caches[4]
+            self.__caches.file_note_ids_cache = {}
+            for note_id, files in self.__caches.note_files_cache.items():
+                self.__add_file_note_ids(note_id, files)
             log.info("Caches were read from dict list")
 
     def get_cache_size(self) -> int:
         with self._lock:
             size: int = 0
-            for cache in self.__caches.size_caches.values():
-                size += len(cache.keys())
+            for size_type in SizeType:
+                size += self.__caches.note_sizes.get_notes_number(size_type)
             size += len(self.__caches.note_files_cache.keys())
             size += len(self.__caches.note_file_sizes_cache.keys())
             return size
@@ -185,6 +262,39 @@ class SizeCalculator(Cache):
     def __parse_files_from_field(self, note_type_id: NotetypeId, field_content) -> list[MediaFile]:
         return self.__collection_holder.col().media.files_in_str(note_type_id, field_content)
 
+    def __put_note_in_caches(self, note_id: NoteId, fields: str, files: set[MediaFile],
+                             file_sizes: dict[MediaFile, FileSize]) -> None:
+        self.__set_note_files(note_id, files)
+        texts_size: SizeBytes = SizeBytes(len(fields.encode()))
+        files_size: SizeBytes = SizeBytes(sum([file_size.size for file_size in file_sizes.values()]))
+        self.__caches.note_sizes.set_sizes(note_id, texts_size, files_size)
+        self.__caches.note_file_sizes_cache[note_id] = file_sizes
+
+    def __stamp_note(self, note: Note) -> None:
+        if NoteHelper.is_note_saved(note):
+            self.__caches.note_mods_cache[note.id] = note.mod
+
+    def __set_note_files(self, note_id: NoteId, files: set[MediaFile]) -> None:
+        self.__remove_note_files(note_id)
+        self.__caches.note_files_cache[note_id] = files
+        self.__add_file_note_ids(note_id, files)
+
+    def __add_file_note_ids(self, note_id: NoteId, files: set[MediaFile]) -> None:
+        for media_file in files:
+            if media_file in self.__caches.file_note_ids_cache:
+                self.__caches.file_note_ids_cache[media_file].add(note_id)
+            else:
+                self.__caches.file_note_ids_cache[media_file] = {note_id}
+
+    def __remove_note_files(self, note_id: NoteId) -> None:
+        files: set[MediaFile] = self.__caches.note_files_cache.pop(note_id, set())
+        for media_file in files:
+            note_ids: Optional[set[NoteId]] = self.__caches.file_note_ids_cache.get(media_file)
+            if note_ids is not None:
+                note_ids.discard(note_id)
+                if not note_ids:
+                    del self.__caches.file_note_ids_cache[media_file]
+
     def __calculate_note_file_sizes(self, files: set[MediaFile], use_cache=True) -> dict[MediaFile, FileSize]:
         file_sizes: dict[MediaFile, FileSize] = dict[MediaFile, FileSize]()
         for media_file in files:
@@ -6,7 +6,6 @@ from anki.notes import NoteId
 
 from ..cache.cache import Cache
 from ..cache.media_cache import MediaCache
-from ..common.collection_holder import CollectionHolder
 from ..common.types import MediaFile
 from ..calculator.size_calculator import SizeCalculator
 
@@ -15,34 +14,20 @@ log: Logger = logging.getLogger(__name__)
 
 class UpdatedFilesCalculator(Cache):
 
-    def __init__(self, collection_holder: CollectionHolder, size_calculator: SizeCalculator,
-                 media_cache: MediaCache) -> None:
+    def __init__(self, size_calculator: SizeCalculator, media_cache: MediaCache) -> None:
         super().__init__()
-        self.__collection_holder: CollectionHolder = collection_holder
         self.__size_calculator: SizeCalculator = size_calculator
-        self.__file_note_ids_cache: dict[MediaFile, set[NoteId]] = {}
         self.__media_cache: MediaCache = media_cache
-        self.invalidate_cache()
         log.debug(f"{self.__class__.__name__} was instantiated")
 
-    def evict_note(self, note_id: NoteId) -> None:
-        with self._lock:
-            for media_file in self.__file_note_ids_cache.keys():
-                if note_id in self.__file_note_ids_cache[media_file]:
-                    self.__file_note_ids_cache[media_file].remove(note_id)
-
     def as_dict_list(self) -> list[dict[Any, Any]]:
-        with self._lock:
-            return [self.__file_note_ids_cache]
+        return []
 
     def read_from_dict_list(self, caches: list[dict[Any, Any]]) -> None:
-        with self._lock:
-            self.__file_note_ids_cache = caches[0]
-            log.info("Cache was read from dict list")
+        pass
 
     def invalidate_cache(self) -> None:
-        with self._lock:
-            self.__file_note_ids_cache.clear()
+        pass
 
     def get_notes_having_updated_files(self) -> set[NoteId]:
         with self._lock:
@@ -51,29 +36,13 @@ class UpdatedFilesCalculator(Cache):
                 log.debug("Refreshing notes having updated files started")
                 updated_files: set[MediaFile] = self.__media_cache.get_updated_files()
                 for updated_file in updated_files:
-                    note_ids: set[NoteId] = self.__note_ids_by_file(updated_file)
-                    updated_note_ids.update(note_ids)
+                    updated_note_ids.update(self.__size_calculator.get_file_note_ids(updated_file))
             else:
                 log.debug("Skip refreshing notes having updated files because ItemIdCache is not initialized")
             return updated_note_ids
 
     def get_cache_size(self) -> int:
-        with self._lock:
-            return len(self.__file_note_ids_cache)
-
-    def __note_ids_by_file(self, file: MediaFile, use_cache: bool = True) -> set[NoteId]:
-        with self._lock:
-            if use_cache and file in self.__file_note_ids_cache:
-                return self.__file_note_ids_cache[file]
-            else:
-                for note_id in self.__collection_holder.col().db.list("select id from notes"):
-                    files: set[MediaFile] = self.__size_calculator.get_note_files(note_id, use_cache)
-                    for note_file in files:
-                        if note_file in self.__file_note_ids_cache:
-                            self.__file_note_ids_cache[note_file].add(note_id)
-                        else:
-                            self.__file_note_ids_cache[note_file] = {note_id}
-            return self.__file_note_ids_cache[file]
+        return 0
 
     def __del__(self):
         log.debug(f"{self.__class__.__name__} was deleted")
@@ -41,5 +41,12 @@ class UsedFilesCalculator:
         return UsedFiles(files_size, FilesNumber(len(files)), exist_files_number, missing_files_number,
                          NotesNumber(len(note_ids)))
 
+    def get_cached_used_files_size(self) -> UsedFiles:
+        files: set[MediaFile] = self.__size_calculator.get_cached_files()
+        exist_files_number, missing_files_number = self.__media_cache.get_missing_files_number(files, use_cache=True)
+        files_size: SizeBytes = self.__size_calculator.calculate_size_of_files(files, use_cache=True)
+        return UsedFiles(files_size, FilesNumber(len(files)), exist_files_number, missing_files_number,
+                         NotesNumber(self.__size_calculator.get_cached_note_number()))
+
     def __del__(self):
         log.debug(f"{self.__class__.__name__} was deleted")
@@ -27,6 +27,12 @@ class SizeType(Enum):
     FILES = "files"
 
 
+class GroupType(Enum):
+    DECK = "deck"
+    NOTE_TYPE = "note_type"
+    TAG = "tag"
+
+
 class FileSize:
     def __init__(self, size: SizeBytes, exists: bool = True) -> None:
         self.size: SizeBytes = size
@@ -0,0 +1,56 @@
+import copy
+import logging
+from array import array
+from bisect import bisect_right
+from logging import Logger
+
+from aqt.theme import ThemeManager
+
+from .config import Config
+from .config_listener import ConfigListener
+from .level_parser import Level, LevelParser, LevelDict
+from ..common.types import SizeBytes, ColorName
+
+log: Logger = logging.getLogger(__name__)
+
+
+class ColorLevels(ConfigListener):
+
+    def __init__(self, level_parser: LevelParser, theme_manager: ThemeManager, config: Config) -> None:
+        self.__level_parser: LevelParser = level_parser
+        self.__theme_manager: ThemeManager = theme_manager
+        self.__config: Config = config
+        self.__color_enabled: bool = False
+        self.__min_sizes: array = array("q")
+        self.__max_sizes: array = array("q")
+        self.__light_theme_colors: list[ColorName] = []
+        self.__dark_theme_colors: list[ColorName] = []
+        self.__compile()
+        self.__config.add_listener(self)
+        log.debug(f"{self.__class__.__name__} was instantiated")
+
+    def get_color(self, size: SizeBytes) -> ColorName:
+        if self.__color_enabled:
+            index: int = bisect_right(self.__max_sizes, size)
+            if index < len(self.__max_sizes) and self.__min_sizes[index] <= size:
+                colors: list[ColorName] = self.__dark_theme_colors if self.__theme_manager.night_mode \
+                    else self.__light_theme_colors
+                return colors[index]
+        return ColorName("")
+
+    def on_config_changed(self) -> None:
+        self.__compile()
+
+    def __compile(self) -> None:
+        level_dicts: list[LevelDict] = copy.deepcopy(self.__config.get_size_button_color_levels())
+        levels: list[Level] = sorted(self.__level_parser.parse_levels(level_dicts),
+                                     key=lambda level: level.max_size_bytes)
+        self.__color_enabled = self.__config.get_size_button_color_enabled()
+        self.__min_sizes = array("q", [level.min_size_bytes for level in levels])
+        self.__max_sizes = array("q", [level.max_size_bytes for level in levels])
+        self.__light_theme_colors = [level.light_theme_color for level in levels]
+        self.__dark_theme_colors = [level.dark_theme_color for level in levels]
+        log.debug(f"Color levels were compiled: enabled={self.__color_enabled}, levels={len(levels)}")
+
+    def __del__(self):
+        log.debug(f"{self.__class__.__name__} was deleted")
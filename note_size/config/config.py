@@ -20,7 +20,14 @@ class Config:
     __key_1_profiler: str = 'Profiler'
     __key_2_warmup_enabled: str = 'Warmup Enabled'
     __key_2_store_cache_in_file_enabled: str = 'Store Cache In File Enabled'
+    __key_2_warmup_chunk_size: str = 'Warmup Chunk Size'
+    __key_2_warmup_workers: str = 'Warmup Workers'
+    __key_2_store_cache_in_file_interval_minutes: str = 'Store Cache In File Interval Minutes'
+    __key_2_lazy_mode_enabled: str = 'Lazy Mode Enabled'
+    __key_2_lazy_fill_slice_millis: str = 'Lazy Fill Slice Millis'
+    __key_2_lazy_fill_pause_millis: str = 'Lazy Fill Pause Millis'
     __key_2_deck_browser_show_collection_size: str = 'Show Collection Size'
+    __key_2_deck_browser_show_deck_sizes: str = 'Show Deck Sizes'
     __key_2_significant_digits: str = 'Significant Digits'
     __key_2_logger_level: str = 'Logger Level'
     __key_2_size_button_enabled: str = 'Enabled'
@@ -72,12 +79,54 @@ class Config:
     def set_store_cache_in_file_enabled(self, store_cache_in_file_enabled: bool) -> None:
         self.__set(store_cache_in_file_enabled, self.__key_1_cache, self.__key_2_store_cache_in_file_enabled)
 
+    def get_cache_warmup_chunk_size(self) -> int:
+        return self.__config[self.__key_1_cache][self.__key_2_warmup_chunk_size]
+
+    def set_cache_warmup_chunk_size(self, warmup_chunk_size: int) -> None:
+        self.__set(warmup_chunk_size, self.__key_1_cache, self.__key_2_warmup_chunk_size)
+
+    def get_cache_warmup_workers(self) -> int:
+        return self.__config[self.__key_1_cache][self.__key_2_warmup_workers]
+
+    def set_cache_warmup_workers(self, warmup_workers: int) -> None:
+        self.__set(warmup_workers, self.__key_1_cache, self.__key_2_warmup_workers)
+
+    def get_store_cache_in_file_interval_minutes(self) -> int:
+        return self.__config[self.__key_1_cache][self.__key_2_store_cache_in_file_interval_minutes]
+
+    def set_store_cache_in_file_interval_minutes(self, interval_minutes: int) -> None:
+        self.__set(interval_minutes, self.__key_1_cache, self.__key_2_store_cache_in_file_interval_minutes)
+
+    def get_cache_lazy_mode_enabled(self) -> bool:
+        return self.__config[self.__key_1_cache][self.__key_2_lazy_mode_enabled]
+
+    def set_cache_lazy_mode_enabled(self, lazy_mode_enabled: bool) -> None:
+        self.__set(lazy_mode_enabled, self.__key_1_cache, self.__key_2_lazy_mode_enabled)
+
+    def get_cache_lazy_fill_slice_millis(self) -> int:
+        return self.__config[self.__key_1_cache][self.__key_2_lazy_fill_slice_millis]
+
+    def set_cache_lazy_fill_slice_millis(self, slice_millis: int) -> None:
+        self.__set(slice_millis, self.__key_1_cache, self.__key_2_lazy_fill_slice_millis)
+
+    def get_cache_lazy_fill_pause_millis(self) -> int:
+        return self.__config[self.__key_1_cache][self.__key_2_lazy_fill_pause_millis]
+
+    def set_cache_lazy_fill_pause_millis(self, pause_millis: int) -> None:
+        self.__set(pause_millis, self.__key_1_cache, self.__key_2_lazy_fill_pause_millis)
+
     def get_deck_browser_show_collection_size(self) -> bool:
         return self.__config[self.__key_1_deck_browser][self.__key_2_deck_browser_show_collection_size]
 
     def set_deck_browser_show_collection_size(self, show_collection_size: bool) -> None:
         self.__set(show_collection_size, self.__key_1_deck_browser, self.__key_2_deck_browser_show_collection_size)
 
+    def get_deck_browser_show_deck_sizes(self) -> bool:
+        return self.__config[self.__key_1_deck_browser][self.__key_2_deck_browser_show_deck_sizes]
+
+    def set_deck_browser_show_deck_sizes(self, show_deck_sizes: bool) -> None:
+        self.__set(show_deck_sizes, self.__key_1_deck_browser, self.__key_2_deck_browser_show_deck_sizes)
+
     def get_deck_browser_significant_digits(self) -> SignificantDigits:
         return self.__config[self.__key_1_deck_browser][self.__key_2_significant_digits]
 
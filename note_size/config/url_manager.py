@@ -24,6 +24,8 @@ class UrlType(Enum):
     INFO_CHANGE_LOG = 12
     INFO_BUG_TRACKER = 13
     INFO_GITHUB = 14
+    CONFIGURATION_CACHE_LAZY_MODE_ENABLED = 15
+    CONFIGURATION_DECK_BROWSER_SHOW_DECK_SIZES = 16
 
 
 class UrlManager:
@@ -31,9 +33,11 @@ class UrlManager:
         UrlType.CONFIGURATION_BROWSER_SHOW_FOUND_NOTES_SIZE: "docs/configuration.md#show-size-of-notes-found-in-browser",
         UrlType.CONFIGURATION_CACHE_WARM_UP_ENABLED: "docs/configuration.md#enable-cache-warm-up",
         UrlType.CONFIGURATION_CACHE_STORE_ON_DISK: "docs/configuration.md#store-cache-in-file-on-exit",
+        UrlType.CONFIGURATION_CACHE_LAZY_MODE_ENABLED: "docs/configuration.md#lazy-cache-mode",
         UrlType.CONFIGURATION_EDITOR_SIZE_BUTTON_COLOR_ENABLED: "docs/configuration.md#color---enabled",
         UrlType.CONFIGURATION_EDITOR_SIZE_BUTTON_COLOR_LEVELS: "docs/configuration.md#color---levels",
         UrlType.CONFIGURATION_DECK_BROWSER_SHOW_COLLECTION_SIZE: "docs/configuration.md#show-collection-size",
+        UrlType.CONFIGURATION_DECK_BROWSER_SHOW_DECK_SIZES: "docs/configuration.md#show-deck-sizes",
         UrlType.CONFIGURATION_EDITOR_SIZE_BUTTON_ENABLED: "docs/configuration.md#enabled",
         UrlType.CONFIGURATION_LOGGING_LEVEL: "docs/configuration.md#logging",
         UrlType.INFO_USER_MANUAL: "docs/user-manual.md",
@@ -1,37 +1,47 @@
 import logging
 from logging import Logger
-from typing import Sequence
+from typing import Optional, Sequence
 
 from anki.cards import CardId
 from anki.notes import NoteId
 from aqt.browser import Browser, ItemId
-from aqt.progress import ProgressManager
-from aqt.qt import QPushButton
+from aqt.operations import QueryOp
+from aqt.qt import QPushButton, QTimer, sip
 
 from ....ui.common.browser_helper import BrowserHelper
 from ....common.number_formatter import NumberFormatter
 from ....ui.details_dialog.details_dialog import DetailsDialog
 from ....ui.details_dialog.show_details_dialog_op import ShowDetailsDialogOp
 from ....cache.item_id_cache import ItemIdCache
-from ....cache.size_str_cache import SizeStrCache
+from ....cache.search_aggregate_cache import SearchAggregateCache, SearchAggregate
+from ....calculator.size_formatter import SizeFormatter
 from ....config.config import Config
-from ....common.types import SizeType, SizeStr, SignificantDigits
+from ....common.types import SizeStr, SignificantDigits
 
 log: Logger = logging.getLogger(__name__)
 
 
 class BrowserButton(QPushButton):
+    __debounce_millis: int = 300
+    __placeholder: str = "..."
+    __failure_text: str = "?"
 
-    def __init__(self, item_id_cache: ItemIdCache, size_str_cache: SizeStrCache, details_dialog: DetailsDialog,
-                 browser: Browser, progress_manager: ProgressManager, config: Config) -> None:
+    def __init__(self, item_id_cache: ItemIdCache, search_aggregate_cache: SearchAggregateCache,
+                 size_formatter: SizeFormatter, details_dialog: DetailsDialog, browser: Browser,
+                 config: Config) -> None:
         super().__init__()
         self.__item_id_cache: ItemIdCache = item_id_cache
-        self.__size_str_cache: SizeStrCache = size_str_cache
+        self.__search_aggregate_cache: SearchAggregateCache = search_aggregate_cache
+        self.__size_formatter: SizeFormatter = size_formatter
         self.__details_dialog: DetailsDialog = details_dialog
         self.__browser: Browser = browser
-        self.__progress_manager: ProgressManager = progress_manager
         self.__config: Config = config
         self.__current_item_ids: Sequence[ItemId] = []
+        self.__generation: int = 0
+        self.__debounce_timer: QTimer = QTimer(self)
+        self.__debounce_timer.setSingleShot(True)
+        # noinspection PyUnresolvedReferences
+        self.__debounce_timer.timeout.connect(self.__calculate_size_in_background)
         # noinspection PyUnresolvedReferences
         self.setStyleSheet("""
         QPushButton {
@@ -46,45 +56,76 @@ class BrowserButton(QPushButton):
     def show_items_size(self, item_ids: Sequence[ItemId]) -> None:
         log.debug(f"Update browser size button for {len(item_ids)} items")
         self.__current_item_ids = item_ids
-        if BrowserHelper.is_notes_mode(self.__browser):
-            note_ids: Sequence[NoteId] = item_ids
-            self.__show_notes_size(note_ids)
+        self.__generation += 1
+        self.setText(self.__placeholder)
+        # noinspection PyUnresolvedReferences
+        self.setToolTip("Calculating size...")
+        self.__debounce_timer.start(self.__debounce_millis)
+
+    def __calculate_size_in_background(self) -> None:
+        generation: int = self.__generation
+        item_ids: Sequence[ItemId] = self.__current_item_ids
+        notes_mode: bool = BrowserHelper.is_notes_mode(self.__browser)
+        query_op: QueryOp[Optional[tuple[SizeStr, str]]] = QueryOp(
+            parent=self.__browser, op=lambda _: self.__calculate_size(generation, item_ids, notes_mode),
+            success=lambda size_and_tooltip: self.__on_size_calculated(generation, size_and_tooltip))
+        query_op.failure(lambda e: self.__on_failure(generation, e)).run_in_background()
+
+    def __calculate_size(self, generation: int, item_ids: Sequence[ItemId],
+                         notes_mode: bool) -> Optional[tuple[SizeStr, str]]:
+        if generation != self.__generation:
+            log.debug("Skip size calculation of outdated search")
+            return None
+        if notes_mode:
+            return self.__calculate_notes_size(item_ids)
         else:
-            card_ids: Sequence[CardId] = item_ids
-            self.__show_cards_size(card_ids)
+            return self.__calculate_cards_size(item_ids)
 
-    def __show_notes_size(self, note_ids: Sequence[NoteId]) -> None:
-        significant_digits: SignificantDigits = self.__config.get_size_button_significant_digits()
-        size: SizeStr = self.__size_str_cache.get_notes_size_str(note_ids, SizeType.TOTAL, significant_digits,
-                                                                 use_cache=True)
-        self.setText(size)
+    def __calculate_notes_size(self, note_ids: Sequence[NoteId]) -> tuple[SizeStr, str]:
+        size: SizeStr = self.__get_total_size_str(note_ids)
         note_ids_number: str = NumberFormatter.with_thousands_separator(len(note_ids))
         tooltip: str = (f"Size of {note_ids_number} notes\n"
                         "Size includes texts and files\n"
                         "Click for details")
-        # noinspection PyUnresolvedReferences
-        self.setToolTip(tooltip)
+        return size, tooltip
 
-    def __show_cards_size(self, card_ids: Sequence[CardId]) -> None:
-        note_ids: Sequence[NoteId] = self.__item_ids_to_note_ids(card_ids)
-        significant_digits: SignificantDigits = self.__config.get_size_button_significant_digits()
-        size: SizeStr = self.__size_str_cache.get_notes_size_str(note_ids, SizeType.TOTAL, significant_digits,
-                                                                 use_cache=True)
-        self.setText(size)
+    def __calculate_cards_size(self, card_ids: Sequence[CardId]) -> tuple[SizeStr, str]:
+        note_ids: Sequence[NoteId] = self.__item_id_cache.get_note_ids_by_card_ids(card_ids)
+        size: SizeStr = self.__get_total_size_str(note_ids)
         note_ids_number: str = NumberFormatter.with_thousands_separator(len(note_ids))
         card_ids_number: str = NumberFormatter.with_thousands_separator(len(card_ids))
         tooltip: str = (f"Size of {card_ids_number} cards ({note_ids_number} notes)\n"
                         "Size includes texts and files\n"
                         "Click for details")
+        return size, tooltip
+
+    def __get_total_size_str(self, note_ids: Sequence[NoteId]) -> SizeStr:
+        aggregate: SearchAggregate = self.__search_aggregate_cache.get_aggregate(note_ids)
+        significant_digits: SignificantDigits = self.__config.get_size_button_significant_digits()
+        return self.__size_formatter.bytes_to_str(aggregate.get_total_size(), significant_digits)
+
+    def __on_size_calculated(self, generation: int, size_and_tooltip: Optional[tuple[SizeStr, str]]) -> None:
+        if generation != self.__generation or size_and_tooltip is None or sip.isdeleted(self):
+            log.debug("Skip showing size of outdated search")
+            return
+        size, tooltip = size_and_tooltip
+        self.setText(size)
         # noinspection PyUnresolvedReferences
         self.setToolTip(tooltip)
 
+    def __on_failure(self, generation: int, e: Exception) -> None:
+        log.error("Error during calculating size of found items", exc_info=e)
+        if generation != self.__generation or sip.isdeleted(self):
+            return
+        self.setText(self.__failure_text)
+        # noinspection PyUnresolvedReferences
+        self.setToolTip("Cannot calculate size of found items")
+
     def __on_click(self) -> None:
         log.debug("Browser size button clicked")
         self.show_items_size(self.__current_item_ids)
         note_ids: Sequence[NoteId] = self.__item_ids_to_note_ids(self.__current_item_ids)
-        op: ShowDetailsDialogOp = ShowDetailsDialogOp(self.__details_dialog, note_ids, self.__progress_manager,
-                                                      self.__browser)
+        op: ShowDetailsDialogOp = ShowDetailsDialogOp(self.__details_dialog, note_ids, self.__browser)
         op.run()
         log.debug("Browser size button click finished")
 
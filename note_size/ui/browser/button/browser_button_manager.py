@@ -4,12 +4,12 @@ from typing import Optional
 
 import aqt
 from aqt.browser import Browser
-from aqt.progress import ProgressManager
 
 from .browser_button import BrowserButton
 from ....ui.details_dialog.details_dialog import DetailsDialog
 from ....cache.item_id_cache import ItemIdCache
-from ....cache.size_str_cache import SizeStrCache
+from ....cache.search_aggregate_cache import SearchAggregateCache
+from ....calculator.size_formatter import SizeFormatter
 from ....config.config import Config
 from ....config.config_listener import ConfigListener
 
@@ -18,21 +18,21 @@ log: Logger = logging.getLogger(__name__)
 
 class BrowserButtonManager(ConfigListener):
 
-    def __init__(self, item_id_cache: ItemIdCache, size_str_cache: SizeStrCache, details_dialog: DetailsDialog,
-                 progress_manager: ProgressManager, config: Config) -> None:
+    def __init__(self, item_id_cache: ItemIdCache, search_aggregate_cache: SearchAggregateCache,
+                 size_formatter: SizeFormatter, details_dialog: DetailsDialog, config: Config) -> None:
         super().__init__()
         self.__item_id_cache: ItemIdCache = item_id_cache
-        self.__size_str_cache: SizeStrCache = size_str_cache
+        self.__search_aggregate_cache: SearchAggregateCache = search_aggregate_cache
+        self.__size_formatter: SizeFormatter = size_formatter
         self.__details_dialog: DetailsDialog = details_dialog
-        self.__progress_manager: ProgressManager = progress_manager
         self.__config: Config = config
         self.__button: Optional[BrowserButton] = None
         self.__config.add_listener(self)
         log.debug(f"{self.__class__.__name__} was instantiated")
 
     def create_browser_button(self, browser: Browser) -> BrowserButton:
-        self.__button = BrowserButton(self.__item_id_cache, self.__size_str_cache, self.__details_dialog,
-                                      browser, self.__progress_manager, self.__config)
+        self.__button = BrowserButton(self.__item_id_cache, self.__search_aggregate_cache, self.__size_formatter,
+                                      self.__details_dialog, browser, self.__config)
         return self.__button
 
     def get_current_button(self) -> BrowserButton:
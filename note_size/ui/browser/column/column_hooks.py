@@ -13,12 +13,25 @@ from ....ui.common.browser_helper import BrowserHelper
 from ....cache.item_id_cache import ItemIdCache
 from ....cache.size_str_cache import SizeStrCache
 from ....config.config import Config
-from ....common.types import SizeType, SignificantDigits
+from ....config.config_listener import ConfigListener
+from ....common.types import SizeType, SignificantDigits, SizeStr
 
 log: Logger = logging.getLogger(__name__)
 
 
-class ColumnHooks:
+class _RenderContext:
+    def __init__(self, item_ids: Sequence[ItemId], is_note: bool, significant_digits: SignificantDigits,
+                 generation: int) -> None:
+        self.item_ids: Sequence[ItemId] = item_ids
+        self.is_note: bool = is_note
+        self.significant_digits: SignificantDigits = significant_digits
+        self.generation: int = generation
+        self.columns: Optional[list[str]] = None
+        self.column_indexes: list[tuple[SizeType, int]] = []
+        self.size_strs: dict[ItemId, list[SizeStr]] = {}
+
+
+class ColumnHooks(ConfigListener):
     __column_total_key: str = "note-size-total"
     __column_total_label: str = "Size"
     __column_total_tooltip: str = "Note size (texts and files are included)"
@@ -28,13 +41,22 @@ class ColumnHooks:
     __column_files_key: str = "note-size-files"
     __column_files_label: str = "Size (files)"
     __column_files_tooltip: str = "Note size (files only, texts are not included)"
+    __column_size_types: dict[str, SizeType] = {
+        __column_total_key: SizeType.TOTAL,
+        __column_texts_key: SizeType.TEXTS,
+        __column_files_key: SizeType.FILES,
+    }
+    __prefetch_row_number: int = 200
 
     def __init__(self, item_id_cache: ItemIdCache, size_str_cache: SizeStrCache, item_id_sorter: ItemIdSorter,
                  config: Config) -> None:
+        super().__init__()
         self.__item_id_cache: ItemIdCache = item_id_cache
         self.__size_str_cache: SizeStrCache = size_str_cache
         self.__item_id_sorter: ItemIdSorter = item_id_sorter
         self.__config: Config = config
+        self.__render_context: Optional[_RenderContext] = None
+        self.__config.add_listener(self)
         self.__hook_browser_did_fetch_columns: Callable[[dict[str, Column]], None] = ColumnHooks.__add_custom_column
         self.__hook_browser_did_fetch_row: Callable[[Union[int, NoteId], bool, CellRow, Sequence[str]], None] = \
             self.__modify_row
@@ -81,18 +103,60 @@ class ColumnHooks:
         )
 
     def __modify_row(self, item_id: ItemId, is_note: bool, row: CellRow, columns: Sequence[str]) -> None:
-        note_id: NoteId = item_id if is_note else self.__item_id_cache.get_note_id_by_card_id(item_id)
-        self.__update_column(ColumnHooks.__column_total_key, SizeType.TOTAL, row, columns, note_id)
-        self.__update_column(ColumnHooks.__column_texts_key, SizeType.TEXTS, row, columns, note_id)
-        self.__update_column(ColumnHooks.__column_files_key, SizeType.FILES, row, columns, note_id)
-
-    def __update_column(self, column_key: str, size_type: SizeType, row: CellRow, columns: Sequence[str],
-                        note_id: NoteId) -> None:
-        if column_key in columns:
-            column_index: int = columns.index(column_key)
+        render_context: _RenderContext = self.__get_render_context(is_note)
+        # Browser changes the list of active columns in place, so a copy is compared
+        if columns != render_context.columns:
+            self.__resolve_columns(render_context, columns)
+        if len(render_context.column_indexes) == 0:
+            return
+        size_strs: Optional[list[SizeStr]] = render_context.size_strs.get(item_id)
+        if size_strs is None:
+            note_id: NoteId = item_id if is_note else self.__item_id_cache.get_note_id_by_card_id(item_id)
+            size_strs = [self.__size_str_cache.get_note_size_str(
+                note_id, size_type, render_context.significant_digits, use_cache=True)
+                for size_type, _ in render_context.column_indexes]
+            render_context.size_strs[item_id] = size_strs
+        for (_, column_index), size_str in zip(render_context.column_indexes, size_strs):
             cell: Cell = row.cells[column_index]
-            significant_digits: SignificantDigits = self.__config.get_browser_significant_digits()
-            cell.text = self.__size_str_cache.get_note_size_str(note_id, size_type, significant_digits, use_cache=True)
+            cell.text = size_str
+
+    def __get_render_context(self, is_note: bool) -> _RenderContext:
+        render_context: Optional[_RenderContext] = self.__render_context
+        generation: int = self.__size_str_cache.get_generation()
+        if render_context is None or render_context.is_note != is_note:
+            render_context = self.__create_render_context([], is_note)
+        elif render_context.generation != generation:
+            log.debug("Reset size strings of render context because notes were evicted")
+            render_context.size_strs = {}
+            render_context.generation = generation
+        return render_context
+
+    def __create_render_context(self, item_ids: Sequence[ItemId], is_note: bool) -> _RenderContext:
+        significant_digits: SignificantDigits = self.__config.get_browser_significant_digits()
+        self.__render_context = _RenderContext(item_ids, is_note, significant_digits,
+                                               self.__size_str_cache.get_generation())
+        return self.__render_context
+
+    def __resolve_columns(self, render_context: _RenderContext, columns: Sequence[str]) -> None:
+        render_context.columns = list(columns)
+        render_context.column_indexes = [(size_type, columns.index(column_key))
+                                         for column_key, size_type in ColumnHooks.__column_size_types.items()
+                                         if column_key in columns]
+        render_context.size_strs = {}
+        if len(render_context.column_indexes) > 0:
+            self.__prefetch_size_strs(render_context)
+
+    def __prefetch_size_strs(self, render_context: _RenderContext) -> None:
+        item_ids: Sequence[ItemId] = render_context.item_ids[:ColumnHooks.__prefetch_row_number]
+        if len(item_ids) > 0:
+            note_ids: Sequence[NoteId] = item_ids if render_context.is_note \
+                else self.__item_id_cache.map_card_ids_to_note_ids(item_ids)
+            size_strs_by_type: list[list[SizeStr]] = [self.__size_str_cache.get_note_size_strs(
+                note_ids, size_type, render_context.significant_digits, use_cache=True)
+                for size_type, _ in render_context.column_indexes]
+            render_context.size_strs = {item_id: list(size_strs)
+                                        for item_id, size_strs in zip(item_ids, zip(*size_strs_by_type))}
+            log.debug(f"Size strings were prefetched: {len(item_ids)}")
 
     @staticmethod
     def __on_browser_will_search(context: SearchContext) -> None:
@@ -114,11 +178,16 @@ class ColumnHooks:
         self.__sort_rows_by_column(ColumnHooks.__column_total_label, SizeType.TOTAL, context, is_note)
         self.__sort_rows_by_column(ColumnHooks.__column_texts_label, SizeType.TEXTS, context, is_note)
         self.__sort_rows_by_column(ColumnHooks.__column_files_label, SizeType.FILES, context, is_note)
+        self.__create_render_context(context.ids or [], is_note)
 
     def __sort_rows_by_column(self, column_label: str, size_type: SizeType, context: SearchContext,
                               is_note: bool) -> None:
         if context.ids and isinstance(context.order, Column) and context.order.notes_mode_label == column_label:
             context.ids = self.__item_id_sorter.sort_item_ids(context.ids, size_type, is_note)
 
+    def on_config_changed(self) -> None:
+        # Significant digits could change
+        self.__render_context = None
+
     def __del__(self):
         log.debug(f"{self.__class__.__name__} was deleted")
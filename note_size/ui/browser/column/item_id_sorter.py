@@ -1,5 +1,5 @@
 import logging
-from functools import partial
+from array import array
 from logging import Logger
 from typing import Sequence
 
@@ -8,7 +8,12 @@ from aqt.browser import ItemId
 
 from ....cache.item_id_cache import ItemIdCache
 from ....calculator.size_calculator import SizeCalculator
-from ....common.types import SizeBytes, SizeType
+from ....common.types import SizeType
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 log: Logger = logging.getLogger(__name__)
 
@@ -18,15 +23,19 @@ class ItemIdSorter:
     def __init__(self, item_id_cache: ItemIdCache, size_calculator: SizeCalculator) -> None:
         self.__item_id_cache: ItemIdCache = item_id_cache
         self.__size_calculator: SizeCalculator = size_calculator
-        log.debug(f"{self.__class__.__name__} was instantiated")
-
-    def sort_item_ids(self, item_ids: Sequence[ItemId], size_type: SizeType, is_note: bool) -> Sequence[NoteId]:
-        key_func: partial = partial(self.__get_item_size, size_type, is_note)
-        return sorted(item_ids, key=key_func, reverse=True)
-
-    def __get_item_size(self, size_type: SizeType, is_note: bool, item_id: ItemId) -> SizeBytes:
-        note_id: NoteId = item_id if is_note else self.__item_id_cache.get_note_id_by_card_id(item_id)
-        return self.__size_calculator.get_note_size(note_id, size_type, use_cache=True)
+        log.debug(f"{self.__class__.__name__} was instantiated (numpy={numpy is not None})")
+
+    def sort_item_ids(self, item_ids: Sequence[ItemId], size_type: SizeType, is_note: bool) -> Sequence[ItemId]:
+        note_ids: Sequence[NoteId] = item_ids if is_note else self.__item_id_cache.map_card_ids_to_note_ids(item_ids)
+        sizes: array = self.__size_calculator.get_note_sizes(note_ids, size_type, use_cache=True)
+        return [item_ids[index] for index in ItemIdSorter.__argsort_descending(sizes)]
+
+    @staticmethod
+    def __argsort_descending(sizes: array) -> Sequence[int]:
+        # Stable order keeps items of equal size in their original order (as "sorted(reverse=True)" does)
+        if numpy is not None and len(sizes) > 0:
+            return numpy.argsort(-numpy.frombuffer(sizes, dtype=numpy.int64), kind="stable").tolist()
+        return sorted(range(len(sizes)), key=sizes.__getitem__, reverse=True)
 
     def __del__(self):
         log.debug(f"{self.__class__.__name__} was deleted")
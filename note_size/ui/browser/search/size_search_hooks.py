@@ -0,0 +1,146 @@
+import logging
+import re
+from logging import Logger
+from re import Match, Pattern
+from typing import Callable, Sequence
+
+from anki.notes import NoteId
+from aqt import gui_hooks
+from aqt.browser import Browser, SearchContext, ItemId
+from aqt.operations import QueryOp
+from aqt.qt import sip
+
+from ....cache.item_id_cache import ItemIdCache
+from ....cache.size_index import SizeIndex
+from ....calculator.size_formatter import SizeFormatter
+from ....common.types import SizeType, SizeBytes, SizeStr
+from ....ui.common.browser_helper import BrowserHelper
+
+log: Logger = logging.getLogger(__name__)
+
+
+class _SizeTerm:
+    def __init__(self, size_type: SizeType, operator: str, size: SizeBytes, negated: bool) -> None:
+        self.size_type: SizeType = size_type
+        self.operator: str = operator
+        self.size: SizeBytes = size
+        self.negated: bool = negated
+
+
+class _NoteIdFilter:
+    def __init__(self, note_ids: set[NoteId], included: bool) -> None:
+        self.note_ids: set[NoteId] = note_ids
+        self.included: bool = included
+
+    def accepts(self, note_id: NoteId) -> bool:
+        return (note_id in self.note_ids) == self.included
+
+
+class SizeSearchHooks:
+    __size_term_pattern: Pattern = re.compile(
+        r"(?<!\S)(-?)notesize:(total|texts|files)?(>=|<=|>|<|=)(\d+(?:\.\d+)?(?:[KMG]?B)?)(?!\S)", re.IGNORECASE)
+    __or_pattern: Pattern = re.compile(r"(?<!\S)or(?!\S)", re.IGNORECASE)
+    # Size terms are applied to the found items after the search, so they match all cards in the search itself
+    __match_all_search: str = "deck:*"
+    # There is no note with id 0
+    __match_none_search: str = "nid:0"
+
+    def __init__(self, size_index: SizeIndex, item_id_cache: ItemIdCache) -> None:
+        self.__size_index: SizeIndex = size_index
+        self.__item_id_cache: ItemIdCache = item_id_cache
+        self.__size_terms: list[_SizeTerm] = []
+        self.__building: bool = False
+        self.__hook_browser_will_search: Callable[[SearchContext], None] = self.__on_browser_will_search
+        self.__hook_browser_did_search: Callable[[SearchContext], None] = self.__on_browser_did_search
+        log.debug(f"{self.__class__.__name__} was instantiated")
+
+    def setup_hooks(self) -> None:
+        gui_hooks.browser_will_search.append(self.__hook_browser_will_search)
+        gui_hooks.browser_did_search.append(self.__hook_browser_did_search)
+        log.info(f"{self.__class__.__name__} are set")
+
+    def remove_hooks(self) -> None:
+        gui_hooks.browser_will_search.remove(self.__hook_browser_will_search)
+        gui_hooks.browser_did_search.remove(self.__hook_browser_did_search)
+        log.info(f"{self.__class__.__name__} are removed")
+
+    def __on_browser_will_search(self, context: SearchContext) -> None:
+        self.__size_terms = []
+        if not context.search or "notesize:" not in context.search.lower():
+            return
+        size_terms: list[_SizeTerm] = [SizeSearchHooks.__parse_size_term(match)
+                                       for match in self.__size_term_pattern.finditer(context.search)]
+        if len(size_terms) == 0:
+            return
+        if self.__or_pattern.search(context.search):
+            raise ValueError("Size terms (notesize:) cannot be combined with OR")
+        missing_size_types: list[SizeType] = list(dict.fromkeys(
+            size_term.size_type for size_term in size_terms if not self.__size_index.is_built(size_term.size_type)))
+        if len(missing_size_types) > 0:
+            log.debug(f"Size index is not built, search will be repeated: size_types={missing_size_types}")
+            self.__build_size_index_in_background(context.browser, missing_size_types)
+            context.search = self.__match_none_search
+            return
+        search: str = self.__size_term_pattern.sub(self.__match_all_search, context.search)
+        log.debug(f"Size terms were replaced in search: original='{context.search}', replaced='{search}'")
+        context.search = search
+        self.__size_terms = size_terms
+
+    def __on_browser_did_search(self, context: SearchContext) -> None:
+        size_terms: list[_SizeTerm] = self.__size_terms
+        self.__size_terms = []
+        if len(size_terms) == 0 or not context.ids:
+            return
+        note_id_filters: list[_NoteIdFilter] = [self.__create_note_id_filter(size_term) for size_term in size_terms]
+        item_ids: Sequence[ItemId] = context.ids
+        note_ids: Sequence[NoteId] = item_ids if BrowserHelper.is_notes_mode(context.browser) \
+            else self.__item_id_cache.map_card_ids_to_note_ids(item_ids)
+        context.ids = [item_id for item_id, note_id in zip(item_ids, note_ids)
+                       if all(note_id_filter.accepts(note_id) for note_id_filter in note_id_filters)]
+        log.debug(f"Found items were filtered by size: before={len(item_ids)}, after={len(context.ids)}")
+
+    def __create_note_id_filter(self, size_term: _SizeTerm) -> _NoteIdFilter:
+        matching_note_ids, other_note_ids = self.__size_index.find_note_ids(
+            size_term.size_type, size_term.operator, size_term.size)
+        if size_term.negated:
+            matching_note_ids, other_note_ids = other_note_ids, matching_note_ids
+        # Excluding the other notes needs a smaller set when most notes match
+        if len(matching_note_ids) <= len(other_note_ids):
+            return _NoteIdFilter(set(matching_note_ids), True)
+        else:
+            return _NoteIdFilter(set(other_note_ids), False)
+
+    def __build_size_index_in_background(self, browser: Browser, size_types: list[SizeType]) -> None:
+        if self.__building:
+            return
+        self.__building = True
+        query_op: QueryOp[None] = QueryOp(parent=browser, op=lambda _: self.__build_size_index(size_types),
+                                          success=lambda _: self.__on_size_index_built(browser))
+        query_op.failure(self.__on_failure).run_in_background()
+
+    def __build_size_index(self, size_types: list[SizeType]) -> None:
+        for size_type in size_types:
+            self.__size_index.build(size_type)
+
+    def __on_size_index_built(self, browser: Browser) -> None:
+        self.__building = False
+        if sip.isdeleted(browser):
+            return
+        log.debug("Repeat search after size index was built")
+        browser.search()
+
+    def __on_failure(self, e: Exception) -> None:
+        self.__building = False
+        log.error("Error during building size index", exc_info=e)
+
+    @staticmethod
+    def __parse_size_term(match: Match) -> _SizeTerm:
+        negated: bool = match.group(1) == "-"
+        size_type: SizeType = SizeType(match.group(2).lower()) if match.group(2) else SizeType.TOTAL
+        operator: str = match.group(3)
+        size_str: str = match.group(4).upper()
+        size: SizeBytes = SizeFormatter.str_to_bytes(SizeStr(size_str if size_str.endswith("B") else f"{size_str}B"))
+        return _SizeTerm(size_type, operator, size, negated)
+
+    def __del__(self):
+        log.debug(f"{self.__class__.__name__} was deleted")
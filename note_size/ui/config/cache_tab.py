@@ -24,6 +24,10 @@ class CacheTab(QWidget):
         self.__enable_warmup_checkbox: CheckboxWithInfo = CheckboxWithInfo(
             "Enable cache warm-up", warmup_enabled_url, desktop_services, settings)
         self.__enable_warmup_checkbox.add_checkbox_listener(self.__on_warmup_checkbox_state_changed)
+        lazy_mode_enabled_url: str = url_manager.get_url(UrlType.CONFIGURATION_CACHE_LAZY_MODE_ENABLED)
+        self.__lazy_mode_checkbox: CheckboxWithInfo = CheckboxWithInfo(
+            "Lazy cache mode (fill cache in background)", lazy_mode_enabled_url, desktop_services, settings)
+        self.__lazy_mode_checkbox.add_checkbox_listener(self.__on_lazy_mode_checkbox_state_changed)
         store_cache_to_file_enabled_url: str = url_manager.get_url(UrlType.CONFIGURATION_CACHE_STORE_ON_DISK)
         self.__store_cache_to_file_checkbox: CheckboxWithInfo = CheckboxWithInfo(
             "Store cache in file on exit", store_cache_to_file_enabled_url, desktop_services, settings)
@@ -35,6 +39,7 @@ class CacheTab(QWidget):
         layout: QVBoxLayout = QVBoxLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         layout.addLayout(self.__enable_warmup_checkbox)
+        layout.addLayout(self.__lazy_mode_checkbox)
         layout.addLayout(self.__store_cache_to_file_checkbox)
         layout.addWidget(refresh_cache_button)
         self.setLayout(layout)
@@ -42,11 +47,15 @@ class CacheTab(QWidget):
 
     def refresh_from_model(self):
         self.__enable_warmup_checkbox.set_checked(self.__model.cache_warmup_enabled)
+        self.__lazy_mode_checkbox.set_checked(self.__model.cache_lazy_mode_enabled)
         self.__store_cache_to_file_checkbox.set_checked(self.__model.store_cache_in_file_enabled)
 
     def __on_warmup_checkbox_state_changed(self, _: int):
         self.__model.cache_warmup_enabled = self.__enable_warmup_checkbox.is_checked()
 
+    def __on_lazy_mode_checkbox_state_changed(self, _: int):
+        self.__model.cache_lazy_mode_enabled = self.__lazy_mode_checkbox.is_checked()
+
     def __on_store_to_file_checkbox_state_changed(self, _: int):
         self.__model.store_cache_in_file_enabled = self.__store_cache_to_file_checkbox.is_checked()
 
@@ -21,17 +21,26 @@ class DeckBrowserTab(QWidget):
         self.__checkbox: CheckboxWithInfo = CheckboxWithInfo(
             "Show collection size in Deck Browser", url, desktop_services, settings)
         self.__checkbox.add_checkbox_listener(self.__on_checkbox_state_changed)
+        deck_sizes_url: str = url_manager.get_url(UrlType.CONFIGURATION_DECK_BROWSER_SHOW_DECK_SIZES)
+        self.__deck_sizes_checkbox: CheckboxWithInfo = CheckboxWithInfo(
+            "Show deck sizes in Deck Browser", deck_sizes_url, desktop_services, settings)
+        self.__deck_sizes_checkbox.add_checkbox_listener(self.__on_deck_sizes_checkbox_state_changed)
         layout: QVBoxLayout = QVBoxLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         layout.addLayout(self.__checkbox)
+        layout.addLayout(self.__deck_sizes_checkbox)
         self.setLayout(layout)
         log.debug(f"{self.__class__.__name__} was instantiated")
 
     def refresh_from_model(self):
         self.__checkbox.set_checked(self.__model.deck_browser_show_collection_size)
+        self.__deck_sizes_checkbox.set_checked(self.__model.deck_browser_show_deck_sizes)
 
     def __on_checkbox_state_changed(self, _: int):
         self.__model.deck_browser_show_collection_size = self.__checkbox.is_checked()
 
+    def __on_deck_sizes_checkbox_state_changed(self, _: int):
+        self.__model.deck_browser_show_deck_sizes = self.__deck_sizes_checkbox.is_checked()
+
     def __del__(self):
         log.debug(f"{self.__class__.__name__} was deleted")
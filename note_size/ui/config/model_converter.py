@@ -12,6 +12,7 @@ class ModelConverter:
     @staticmethod
     def apply_model_to_config(model: UiModel, config: Config):
         config.set_deck_browser_show_collection_size(model.deck_browser_show_collection_size)
+        config.set_deck_browser_show_deck_sizes(model.deck_browser_show_deck_sizes)
         config.set_browser_show_found_notes_size(model.browser_show_found_notes_size)
         config.set_size_button_enabled(model.size_button_enabled)
         config.set_size_button_color_enabled(model.size_button_color_enabled)
@@ -19,10 +20,12 @@ class ModelConverter:
         config.set_log_level(model.log_level)
         config.set_cache_warmup_enabled(model.cache_warmup_enabled)
         config.set_store_cache_in_file_enabled(model.store_cache_in_file_enabled)
+        config.set_cache_lazy_mode_enabled(model.cache_lazy_mode_enabled)
 
     @staticmethod
     def apply_config_to_model(model: UiModel, config: Config):
         model.deck_browser_show_collection_size = config.get_deck_browser_show_collection_size()
+        model.deck_browser_show_deck_sizes = config.get_deck_browser_show_deck_sizes()
         model.browser_show_found_notes_size = config.get_browser_show_found_notes_size()
         model.size_button_enabled = config.get_size_button_enabled()
         model.size_button_color_enabled = config.get_size_button_color_enabled()
@@ -30,3 +33,4 @@ class ModelConverter:
         model.log_level = config.get_log_level()
         model.cache_warmup_enabled = config.get_cache_warmup_enabled()
         model.store_cache_in_file_enabled = config.get_store_cache_in_file_enabled()
+        model.cache_lazy_mode_enabled = config.get_cache_lazy_mode_enabled()
@@ -4,7 +4,9 @@ from ...config.level_parser import LevelDict
 class UiModel:
     cache_warmup_enabled: bool
     store_cache_in_file_enabled: bool
+    cache_lazy_mode_enabled: bool
     deck_browser_show_collection_size: bool
+    deck_browser_show_deck_sizes: bool
     browser_show_found_notes_size: bool
     log_level: str
     size_button_enabled: bool
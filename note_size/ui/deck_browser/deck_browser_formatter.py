@@ -4,6 +4,7 @@ from logging import Logger
 from pathlib import Path
 from typing import Optional
 
+from anki.decks import DeckId
 from aqt.theme import ThemeManager
 from bs4 import BeautifulSoup, Tag
 
@@ -12,12 +13,14 @@ from .trash import Trash
 from ...calculator.db_size_calculator import DbSizeCalculator
 from ...common.collection_holder import CollectionHolder
 from ...common.number_formatter import NumberFormatter
+from ...cache.group_size_cache import GroupSizeCache, GroupSize
 from ...cache.item_id_cache import ItemIdCache
 from ...cache.media_cache import MediaCache
 from ...calculator.used_files_calculator import UsedFilesCalculator, UsedFiles
 from ...config.config import Config
 from ...config.settings import Settings
-from ...common.types import SizeBytes, FilesNumber, SignificantDigits
+from ...common.types import SizeBytes, FilesNumber, SignificantDigits, GroupType
+from ...calculator.size_calculator import SizeCalculator
 from ...calculator.size_formatter import SizeFormatter
 
 log: Logger = logging.getLogger(__name__)
@@ -26,17 +29,21 @@ log: Logger = logging.getLogger(__name__)
 class DeckBrowserFormatter:
     __code_style: str = "font-family:Consolas,monospace;display: inline-block;"
     __sand_clock: str = "⏳"
+    __deck_size_style: str = "font-size: 80%; margin-left: 0.5em; opacity: 0.7;"
 
-    def __init__(self, collection_holder: CollectionHolder, item_id_cache: ItemIdCache, media_cache: MediaCache,
-                 trash: Trash, size_formatter: SizeFormatter, used_files_calculator: UsedFilesCalculator,
-                 db_size_calculator: DbSizeCalculator, theme_manager: ThemeManager, config: Config, settings: Settings):
+    def __init__(self, collection_holder: CollectionHolder, item_id_cache: ItemIdCache,
+                 size_calculator: SizeCalculator, media_cache: MediaCache, trash: Trash, size_formatter: SizeFormatter,
+                 used_files_calculator: UsedFilesCalculator, db_size_calculator: DbSizeCalculator,
+                 group_size_cache: GroupSizeCache, theme_manager: ThemeManager, config: Config, settings: Settings):
         self.__collection_holder: CollectionHolder = collection_holder
         self.__item_id_cache: ItemIdCache = item_id_cache
+        self.__size_calculator: SizeCalculator = size_calculator
         self.__media_cache: MediaCache = media_cache
         self.__trash: Trash = trash
         self.__size_formatter: SizeFormatter = size_formatter
         self.__used_files_calculator: UsedFilesCalculator = used_files_calculator
         self.__db_size_calculator: DbSizeCalculator = db_size_calculator
+        self.__group_size_cache: GroupSizeCache = group_size_cache
         self.__theme_manager: ThemeManager = theme_manager
         self.__config: Config = config
         self.__web_dir: str = os.path.join("_addons", settings.module_name, "ui", "web")
@@ -45,17 +52,28 @@ class DeckBrowserFormatter:
     def format_collection_size_html(self) -> str:
         log.debug("Preparing data for formatting collection size has started")
         collection_file_path: Path = Path(self.__collection_holder.col().path)
-        if self.__item_id_cache.is_initialized():
-            log.debug("Use actual collection sizes")
+        initialized: bool = self.__item_id_cache.is_initialized()
+        cached_note_number: int = self.__size_calculator.get_cached_note_number() if not initialized else 0
+        progress: Optional[str] = None
+        if initialized or cached_note_number > 0:
             collection_size: SizeBytes = SizeBytes(collection_file_path.stat().st_size)
-            used_files: UsedFiles = self.__used_files_calculator.get_used_files_size(use_cache=True)
+            note_count: int = self.__collection_holder.col().note_count()
+            if initialized:
+                log.debug("Use actual collection sizes")
+                used_files: UsedFiles = self.__used_files_calculator.get_used_files_size(use_cache=True)
+                unused_files_size, unused_files_number = self.__media_cache.get_unused_files_size(use_cache=True)
+                unused_files_size_str: str = NumberFormatter.with_thousands_separator(unused_files_number)
+            else:
+                log.debug("Use partial collection sizes while cache is being filled")
+                used_files: UsedFiles = self.__used_files_calculator.get_cached_used_files_size()
+                unused_files_size: Optional[SizeBytes] = None
+                unused_files_size_str: str = self.__sand_clock
+                progress = f"{cached_note_number * 100 // max(1, note_count)}%"
             used_files_size: SizeBytes = used_files.used_files_size
-            unused_files_size, unused_files_number = self.__media_cache.get_unused_files_size(use_cache=True)
             trash_dir_size: SizeBytes = self.__trash.get_trash_dir_size()
             rev_table_size: SizeBytes = self.__db_size_calculator.get_revision_log_size()
             rev_table_count: int = self.__db_size_calculator.get_revision_log_count()
             trash_files_number: FilesNumber = self.__trash.get_trash_files_number()
-            note_count: int = self.__collection_holder.col().note_count()
             note_number_str: str = NumberFormatter.with_thousands_separator(note_count)
             significant_digits: SignificantDigits = self.__config.get_deck_browser_significant_digits()
             rev_log_size_str: str = self.__size_formatter.bytes_to_str(rev_table_size, significant_digits)
@@ -64,10 +82,9 @@ class DeckBrowserFormatter:
             used_files_number_str: str = NumberFormatter.with_thousands_separator(used_files.used_files_number)
             existing_files_number_str: str = NumberFormatter.with_thousands_separator(used_files.exist_files_number)
             missing_files_number_str: str = NumberFormatter.with_thousands_separator(used_files.missing_files_number)
-            unused_files_size_str: str = NumberFormatter.with_thousands_separator(unused_files_number)
             trash_files_number_str: str = NumberFormatter.with_thousands_separator(trash_files_number)
             total_size: SizeBytes = SizeBytes(
-                collection_size + used_files.used_files_size + unused_files_size + trash_dir_size)
+                collection_size + used_files.used_files_size + (unused_files_size or 0) + trash_dir_size)
         else:
             log.debug("Use sand clocks instead of actual collection sizes")
             collection_size: Optional[SizeBytes] = None
@@ -99,11 +116,16 @@ class DeckBrowserFormatter:
         trash_title: str = f'Size of {trash_files_number_str} media files in the Trash (can be emptied)\n' \
                            f'Folder "{trash_dir_path}"'
         total_title: str = 'Total size of collection, media files, unused files and trash files'
+        if progress:
+            progress_title: str = f'\nCache is being filled: {progress} of notes processed'
+            media_title += progress_title
+            total_title += progress_title
         div.append(self.__span(soup, "Collection", collection_size, collection_title))
-        div.append(self.__span(soup, "Media", used_files_size, media_title))
+        div.append(self.__span(soup, "Media", used_files_size, media_title, progress=progress))
         div.append(self.__span(soup, "Unused", unused_files_size, unused_title, self.__check_media_icon_tag(soup)))
         div.append(self.__span(soup, "Trash", trash_dir_size, trash_title, self.__check_media_icon_tag(soup)))
-        div.append(self.__span(soup, "Total", total_size, total_title))
+        largest_items_icon: Optional[Tag] = self.__largest_items_icon_tag(soup) if initialized else None
+        div.append(self.__span(soup, "Total", total_size, total_title, largest_items_icon, progress=progress))
         div.append(self.__configuration_icon_tag(soup))
 
         soup.append(div)
@@ -111,6 +133,37 @@ class DeckBrowserFormatter:
         log.debug("Formatting collection size finished")
         return html
 
+    def format_deck_tree_html(self, tree_html: str) -> str:
+        if not self.__item_id_cache.is_initialized():
+            log.debug("Skip formatting deck sizes while cache is not initialized")
+            return tree_html
+        deck_sizes: Optional[dict[DeckId, GroupSize]] = self.__group_size_cache.get_built_group_sizes(GroupType.DECK)
+        if deck_sizes is None:
+            log.debug("Skip formatting deck sizes while group sizes are being built")
+            return tree_html
+        significant_digits: SignificantDigits = self.__config.get_deck_browser_significant_digits()
+        soup: BeautifulSoup = BeautifulSoup(tree_html, 'html.parser')
+        for deck_row in soup.find_all('tr', class_='deck'):
+            deck_link: Optional[Tag] = deck_row.find('a', class_='deck')
+            deck_size: Optional[GroupSize] = deck_sizes.get(DeckId(int(deck_row.get('id', 0))))
+            if deck_link and deck_size:
+                texts_size_str: str = self.__size_formatter.bytes_to_str(deck_size.texts_size, significant_digits)
+                files_size_str: str = self.__size_formatter.bytes_to_str(deck_size.files.get_total_size(),
+                                                                         significant_digits)
+                notes_number_str: str = NumberFormatter.with_thousands_separator(deck_size.notes_number)
+                files_number_str: str = NumberFormatter.with_thousands_separator(deck_size.files.get_files_number())
+                size_span: Tag = soup.new_tag('span', attrs={
+                    "title": f"Size of {notes_number_str} notes (including subdecks)\n"
+                             f"Texts: {texts_size_str}, {files_number_str} files: {files_size_str}",
+                    "style": DeckBrowserFormatter.__deck_size_style})
+                size_span.string = self.__size_formatter.bytes_to_str(deck_size.get_total_size(), significant_digits)
+                deck_link.insert_after(size_span)
+        log.debug("Formatting deck sizes finished")
+        return str(soup)
+
+    def is_deck_sizes_outdated(self) -> bool:
+        return self.__item_id_cache.is_initialized() and not self.__group_size_cache.is_up_to_date()
+
     def __check_media_icon_tag(self, soup: BeautifulSoup) -> Tag:
         if self.__theme_manager.night_mode:
             icon_file: str = "info_white.png"
@@ -125,6 +178,20 @@ class DeckBrowserFormatter:
         })
         return details_icon
 
+    def __largest_items_icon_tag(self, soup: BeautifulSoup) -> Tag:
+        if self.__theme_manager.night_mode:
+            icon_file: str = "info_white.png"
+        else:
+            icon_file: str = "info_black.png"
+        largest_items_icon: Tag = soup.new_tag('img', attrs={
+            "title": 'Click to show largest notes and files',
+            "src": os.path.join(self.__web_dir, icon_file),
+            "height": "12",
+            "onclick": f"pycmd('{DeckBrowserJs.open_largest_items_action}')",
+            "style": "margin-right: 0.2em;"
+        })
+        return largest_items_icon
+
     def __configuration_icon_tag(self, soup: BeautifulSoup) -> Tag:
         if self.__theme_manager.night_mode:
             icon_file: str = "setting_white.png"
@@ -138,7 +205,8 @@ class DeckBrowserFormatter:
         })
         return config_icon
 
-    def __span(self, soup: BeautifulSoup, name: str, size: Optional[SizeBytes], title: str, icon: Tag = None) -> Tag:
+    def __span(self, soup: BeautifulSoup, name: str, size: Optional[SizeBytes], title: str, icon: Tag = None,
+               progress: Optional[str] = None) -> Tag:
         log.debug(f"Create span for: name={name}, size={size}")
         outer_span: Tag = soup.new_tag('span', attrs={"title": f'{title}', "style": "margin-right: 0.5em;"})
         outer_span.string = f"{name}: "
@@ -156,6 +224,11 @@ class DeckBrowserFormatter:
             unit_span.string = unit
             outer_span.append(" ")
             outer_span.append(unit_span)
+            if progress:
+                progress_span: Tag = soup.new_tag('span', attrs={"style": "font-size: 80%"})
+                progress_span.string = f"{self.__sand_clock}{progress}"
+                outer_span.append(" ")
+                outer_span.append(progress_span)
             if icon:
                 outer_span.append(icon)
         else:
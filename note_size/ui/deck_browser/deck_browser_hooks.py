@@ -17,16 +17,19 @@ class DeckBrowserHooks:
             [Any, Any], None] = deck_browser_updater.on_browser_will_render_content
         self.__hook_webview_did_receive_js_message: Callable[
             [tuple[bool, Any], str, Any], tuple[bool, Any]] = deck_browser_js.on_js_message
+        self.__hook_operation_did_execute: Callable[[Any, Any], None] = deck_browser_updater.on_operation_did_execute
         log.debug(f"{self.__class__.__name__} was instantiated")
 
     def setup_hooks(self) -> None:
         gui_hooks.deck_browser_will_render_content.append(self.__hook_deck_browser_will_render_content)
         gui_hooks.webview_did_receive_js_message.append(self.__hook_webview_did_receive_js_message)
+        gui_hooks.operation_did_execute.append(self.__hook_operation_did_execute)
         log.info(f"{self.__class__.__name__} are set")
 
     def remove_hooks(self) -> None:
         gui_hooks.deck_browser_will_render_content.remove(self.__hook_deck_browser_will_render_content)
         gui_hooks.webview_did_receive_js_message.remove(self.__hook_webview_did_receive_js_message)
+        gui_hooks.operation_did_execute.remove(self.__hook_operation_did_execute)
         log.info(f"{self.__class__.__name__} are removed")
 
     def __del__(self):
@@ -7,6 +7,7 @@ from aqt.mediacheck import check_media_db
 
 from ...config.config import Config
 from ...ui.config.config_ui import ConfigUi
+from ...ui.largest_items_dialog.largest_items_dialog import LargestItemsDialog
 
 log: Logger = logging.getLogger(__name__)
 
@@ -14,10 +15,12 @@ log: Logger = logging.getLogger(__name__)
 class DeckBrowserJs:
     open_config_action: str = "open-config-action"
     open_check_media_action: str = "open-check-media-action"
+    open_largest_items_action: str = "open-largest-items-action"
 
-    def __init__(self, config: Config, config_ui: ConfigUi):
+    def __init__(self, config: Config, config_ui: ConfigUi, largest_items_dialog: LargestItemsDialog):
         self.__config: Config = config
         self.__config_ui: ConfigUi = config_ui
+        self.__largest_items_dialog: LargestItemsDialog = largest_items_dialog
         log.debug(f"{self.__class__.__name__} was instantiated")
 
     def on_js_message(self, handled: tuple[bool, Any], message: str, _: Any) -> tuple[bool, Any]:
@@ -27,6 +30,9 @@ class DeckBrowserJs:
         if message == DeckBrowserJs.open_check_media_action:
             check_media_db(mw)
             return True, None
+        if message == DeckBrowserJs.open_largest_items_action:
+            self.__largest_items_dialog.show_collection(mw)
+            return True, None
         return handled
 
     def __del__(self):
@@ -1,19 +1,28 @@
 import logging
 from logging import Logger
+from typing import Optional
 
+from anki.collection import OpChanges
 from aqt.deckbrowser import DeckBrowser
+from aqt.operations import QueryOp
+from aqt.taskman import TaskManager
 
 from .deck_browser_formatter import DeckBrowserFormatter
+from ...cache.group_size_cache import GroupSizeCache
 from ...config.config import Config
 
 log: Logger = logging.getLogger(__name__)
 
 
 class DeckBrowserUpdater:
-    def __init__(self, deck_browser: DeckBrowser, deck_browser_formatter: DeckBrowserFormatter, config: Config):
+    def __init__(self, deck_browser: DeckBrowser, deck_browser_formatter: DeckBrowserFormatter,
+                 group_size_cache: GroupSizeCache, task_manager: TaskManager, config: Config):
         self.__deck_browser_formatter: DeckBrowserFormatter = deck_browser_formatter
         self.__deck_browser: DeckBrowser = deck_browser
+        self.__group_size_cache: GroupSizeCache = group_size_cache
+        self.__task_manager: TaskManager = task_manager
         self.__config: Config = config
+        self.__refreshing_deck_sizes: bool = False
         log.debug(f"{self.__class__.__name__} was instantiated")
 
     # noinspection PyUnresolvedReferences
@@ -25,10 +34,38 @@ class DeckBrowserUpdater:
             log.debug(f"DeckBrowserContent stats (edited): {content.stats}")
         else:
             log.debug("Showing collection size in DeckBrowser is disabled")
+        if self.__config.get_deck_browser_show_deck_sizes():
+            content.tree = self.__deck_browser_formatter.format_deck_tree_html(content.tree)
+            self.__refresh_deck_sizes_if_outdated()
+        else:
+            log.debug("Showing deck sizes in DeckBrowser is disabled")
+
+    def on_operation_did_execute(self, _: OpChanges, __: Optional[object]) -> None:
+        if self.__config.get_deck_browser_show_deck_sizes():
+            # Let the cache hooks mark changed groups first
+            self.__task_manager.run_on_main(self.__refresh_deck_sizes_if_outdated)
 
     def on_theme_changed(self):
         log.debug("Theme did changed")
         self.__deck_browser.refresh()
 
+    def __refresh_deck_sizes_if_outdated(self) -> None:
+        if self.__refreshing_deck_sizes or not self.__deck_browser_formatter.is_deck_sizes_outdated():
+            return
+        log.debug("Refresh deck sizes in background")
+        self.__refreshing_deck_sizes = True
+        query_op: QueryOp[bool] = QueryOp(parent=self.__deck_browser.mw, op=lambda _: self.__group_size_cache.refresh(),
+                                          success=self.__on_deck_sizes_refreshed)
+        query_op.failure(self.__on_deck_sizes_failure).run_in_background()
+
+    def __on_deck_sizes_refreshed(self, changed: bool) -> None:
+        self.__refreshing_deck_sizes = False
+        if changed and self.__deck_browser.mw.state == "deckBrowser":
+            self.__deck_browser.refresh()
+
+    def __on_deck_sizes_failure(self, e: Exception) -> None:
+        self.__refreshing_deck_sizes = False
+        log.error("Error during refreshing deck sizes", exc_info=e)
+
     def __del__(self):
         log.debug(f"{self.__class__.__name__} was deleted")
@@ -4,15 +4,19 @@ from logging import Logger
 from typing import Sequence, Optional
 
 from anki.notes import Note, NoteId
-from aqt.qt import QDialog, QLabel, QGridLayout, QFont, QDialogButtonBox, Qt, QWidget
+from aqt.qt import QDialog, QLabel, QGridLayout, QFont, QDialogButtonBox, Qt, QWidget, QPushButton, sip
+from aqt.taskman import TaskManager
 from aqt.theme import ThemeManager
 
 from .configuration_button import ConfigurationButton
 from .details_model import DetailsModel
 from .details_model_filler import DetailsModelFiller
 from .files_table import FilesTable
+from ..largest_items_dialog.largest_items_dialog import LargestItemsDialog
 from ...calculator.size_calculator import SizeCalculator
 from ...calculator.size_formatter import SizeFormatter
+from ...common.number_formatter import NumberFormatter
+from ...common.types import MediaFile, FileSize
 from ...config.config import Config
 from ..config.config_ui import ConfigUi
 from ...config.settings import Settings
@@ -29,13 +33,18 @@ class DetailsDialog(QDialog):
     __button_box_row: int = 4
 
     def __init__(self, size_calculator: SizeCalculator, size_formatter: SizeFormatter, file_type_helper: FileTypeHelper,
-                 details_model_filler: DetailsModelFiller, theme_manager: ThemeManager,
-                 config_ui: ConfigUi, config: Config, settings: Settings):
+                 details_model_filler: DetailsModelFiller, largest_items_dialog: LargestItemsDialog,
+                 task_manager: TaskManager, theme_manager: ThemeManager, config_ui: ConfigUi, config: Config,
+                 settings: Settings):
         super().__init__(parent=None)
         self.__size_calculator: SizeCalculator = size_calculator
         self.__size_formatter: SizeFormatter = size_formatter
         self.__model: DetailsModel = DetailsModel()
         self.__details_model_filler: DetailsModelFiller = details_model_filler
+        self.__largest_items_dialog: LargestItemsDialog = largest_items_dialog
+        self.__task_manager: TaskManager = task_manager
+        self.__note_ids: Sequence[NoteId] = []
+        self.__generation: int = 0
         # noinspection PyUnresolvedReferences
         self.setWindowTitle('"Note Size" addon')
         self.__configuration_button: ConfigurationButton = ConfigurationButton(theme_manager, config_ui, settings)
@@ -47,6 +56,10 @@ class DetailsDialog(QDialog):
         button_box: QDialogButtonBox = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         # noinspection PyUnresolvedReferences
         button_box.rejected.connect(self.__close)
+        self.__largest_items_button: QPushButton = button_box.addButton(
+            "Largest items", QDialogButtonBox.ButtonRole.ActionRole)
+        # noinspection PyUnresolvedReferences
+        self.__largest_items_button.clicked.connect(self.__show_largest_items)
 
         layout: QGridLayout = QGridLayout(self)
 
@@ -70,25 +83,46 @@ class DetailsDialog(QDialog):
 
     def show_note(self, note: Note, parent: Optional[QWidget] = None) -> None:
         self.__model = self.__details_model_filler.prepare_note_model(note)
-        self.__files_table.prepare_items(self.__model.file_sizes)
+        self.__note_ids = [note.id] if note.id else []
+        self.__generation += 1
+        self.__files_table.set_files(self.__model.file_sizes)
         self.__show_model(parent)
 
-    def prepare_show_notes(self, note_ids: Sequence[NoteId]) -> None:
+    def show_notes(self, note_ids: Sequence[NoteId], parent: Optional[QWidget] = None) -> int:
         log.debug(f"Start showing notes: {len(note_ids)}")
+        self.__generation += 1
+        self.__note_ids = note_ids
+        self.__model = DetailsModel()
+        note_number_str: str = NumberFormatter.with_thousands_separator(len(note_ids))
+        self.__model.total_note_size_text = f"Calculating size of {note_number_str} notes..."
+        self.__model.texts_note_size_text = ""
+        self.__model.files_note_size_text = ""
+        self.__model.file_sizes = {}
+        self.__files_table.clear_rows()
+        self.__show_model(parent)
+        return self.__generation
+
+    def prepare_show_notes(self, generation: int, note_ids: Sequence[NoteId]) -> DetailsModel:
+        log.debug(f"Start preparing notes: {len(note_ids)}")
         start_time: datetime = datetime.now()
-        self.__model: DetailsModel = self.__details_model_filler.prepare_notes_model(note_ids)
-        self.__files_table.prepare_items(self.__model.file_sizes)
+        model: DetailsModel = self.__details_model_filler.prepare_notes_model(
+            note_ids, lambda file_sizes: self.__task_manager.run_on_main(
+                lambda: self.__add_files(generation, file_sizes)))
         end_time: datetime = datetime.now()
         duration_sec: int = round((end_time - start_time).total_seconds())
         log.info(f"Data preparation for showing notes finished: duration_sec={duration_sec}")
+        return model
 
-    def show_notes(self, parent: Optional[QWidget] = None) -> None:
-        log.debug("Start showing notes")
-        start_time: datetime = datetime.now()
-        self.__show_model(parent)
-        end_time: datetime = datetime.now()
-        duration_sec: int = round((end_time - start_time).total_seconds())
-        log.info(f"Showing notes finished: duration_sec={duration_sec}")
+    def show_notes_model(self, generation: int, model: DetailsModel) -> None:
+        if generation != self.__generation or sip.isdeleted(self):
+            log.debug("Skip showing model of outdated notes")
+            return
+        self.__model = model
+        self.__total_size_label.setText(self.__model.total_note_size_text)
+        self.__texts_size_label.setText(self.__model.texts_note_size_text)
+        self.__files_size_label.setText(self.__model.files_note_size_text)
+        self.adjustSize()
+        log.info("Showing notes finished")
 
     def on_theme_changed(self) -> None:
         log.debug("On theme changed")
@@ -96,9 +130,22 @@ class DetailsDialog(QDialog):
         self.__files_table.on_theme_changed()
 
     def __close(self):
+        self.__generation += 1
         self.__files_table.clear_rows()
         self.close()
 
+    def __add_files(self, generation: int, file_sizes: dict[MediaFile, FileSize]) -> None:
+        if generation != self.__generation or sip.isdeleted(self):
+            log.debug("Skip showing files of outdated notes")
+            return
+        was_table_hidden: bool = self.__files_table.isHidden()
+        self.__files_table.add_files(file_sizes)
+        if was_table_hidden:
+            self.adjustSize()
+
+    def __show_largest_items(self) -> None:
+        self.__largest_items_dialog.show_notes(self.__note_ids, self)
+
     @staticmethod
     def __total_size_label() -> QLabel:
         font: QFont = QFont()
@@ -115,7 +162,7 @@ class DetailsDialog(QDialog):
         self.__total_size_label.setText(self.__model.total_note_size_text)
         self.__texts_size_label.setText(self.__model.texts_note_size_text)
         self.__files_size_label.setText(self.__model.files_note_size_text)
-        self.__files_table.show_files()
+        self.__largest_items_button.setEnabled(len(self.__note_ids) > 0)
         # noinspection PyUnresolvedReferences
         self.show()
         self.__files_table.recalculate_window_sizes()
@@ -0,0 +1,155 @@
+import logging
+from array import array
+from logging import Logger
+from typing import Any
+
+from aqt.qt import QAbstractTableModel, QModelIndex, QIcon, Qt
+
+from .file_type_helper import FileTypeHelper
+from ...calculator.size_formatter import SizeFormatter
+from ...config.config import Config
+from ...common.types import MediaFile, FileSize, FileType, SizeBytes, SignificantDigits
+
+log: Logger = logging.getLogger(__name__)
+
+
+class FilesTableModel(QAbstractTableModel):
+    icon_column: int = 0
+    filename_column: int = 1
+    size_column: int = 2
+    __headers: list[str] = ["", "File", "Size"]
+    __missing_file_text: str = "❌"
+    __missing_file_tooltip: str = "File is referenced in notes, but missing in media folder"
+
+    def __init__(self, file_type_helper: FileTypeHelper, size_formatter: SizeFormatter, icons: dict[FileType, QIcon],
+                 config: Config) -> None:
+        super().__init__(parent=None)
+        self.__file_type_helper: FileTypeHelper = file_type_helper
+        self.__size_formatter: SizeFormatter = size_formatter
+        self.__icons: dict[FileType, QIcon] = icons
+        self.__config: Config = config
+        self.__names: list[MediaFile] = []
+        self.__sizes: array = array("q")
+        self.__exists: bytearray = bytearray()
+        self.__types: bytearray = bytearray()
+        self.__order: array = array("q")
+        self.__sorted_number: int = 0
+        self.__sort_column: int = self.size_column
+        self.__sort_order: Qt.SortOrder = Qt.SortOrder.DescendingOrder
+        log.debug(f"{self.__class__.__name__} was instantiated")
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.__order)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.__headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole:
+            if orientation == Qt.Orientation.Horizontal:
+                return self.__headers[section]
+            return str(section + 1)
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or index.row() >= len(self.__order):
+            return None
+        row: int = self.__order[index.row()]
+        column: int = index.column()
+        if column == self.icon_column:
+            if role == Qt.ItemDataRole.DecorationRole:
+                return self.__icons[FileType(self.__types[row])]
+        elif column == self.filename_column:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.__names[row]
+        elif column == self.size_column:
+            exists: bool = self.__exists[row] == 1
+            if role == Qt.ItemDataRole.DisplayRole:
+                if exists:
+                    significant_digits: SignificantDigits = self.__config.get_browser_significant_digits()
+                    return self.__size_formatter.bytes_to_str(SizeBytes(self.__sizes[row]), significant_digits)
+                return self.__missing_file_text
+            elif role == Qt.ItemDataRole.ToolTipRole:
+                return None if exists else self.__missing_file_tooltip
+            elif role == Qt.ItemDataRole.TextAlignmentRole:
+                return (Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter) if exists \
+                    else Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if index.column() == self.icon_column:
+            return Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        # Already sorted rows go first in ascending order, so sorting appended rows only merges two runs
+        sorted_rows: list[int] = list(self.__order[:self.__sorted_number]) if column == self.__sort_column else []
+        if self.__sort_order == Qt.SortOrder.DescendingOrder:
+            sorted_rows.reverse()
+        unsorted_rows: list[int] = list(self.__order[len(sorted_rows):])
+        self.__sort_column = column
+        self.__sort_order = order
+        # noinspection PyUnresolvedReferences
+        self.layoutAboutToBeChanged.emit()
+        old_order: array = self.__order
+        self.__order = self.__sorted_rows(sorted_rows + unsorted_rows)
+        self.__sorted_number = len(self.__order)
+        self.__update_persistent_indexes(old_order)
+        # noinspection PyUnresolvedReferences
+        self.layoutChanged.emit()
+
+    def add_files(self, file_sizes: dict[MediaFile, FileSize]) -> None:
+        if len(file_sizes) == 0:
+            return
+        first_row: int = len(self.__names)
+        for media_file, file_size in file_sizes.items():
+            self.__names.append(media_file)
+            self.__sizes.append(file_size.size)
+            self.__exists.append(1 if file_size.exists else 0)
+            self.__types.append(self.__file_type_helper.get_file_type(media_file).value)
+        last_row: int = len(self.__names) - 1
+        self.beginInsertRows(QModelIndex(), first_row, last_row)
+        self.__order.extend(range(first_row, last_row + 1))
+        self.endInsertRows()
+        self.sort(self.__sort_column, self.__sort_order)
+        log.debug(f"Files were added to table model: added={len(file_sizes)}, total={len(self.__names)}")
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self.__names = []
+        self.__sizes = array("q")
+        self.__exists = bytearray()
+        self.__types = bytearray()
+        self.__order = array("q")
+        self.__sorted_number = 0
+        self.endResetModel()
+
+    def __sorted_rows(self, rows: list[int]) -> array:
+        if self.__sort_column == self.icon_column:
+            sorted_rows: list[int] = sorted(rows, key=self.__types.__getitem__)
+        elif self.__sort_column == self.filename_column:
+            sorted_rows: list[int] = sorted(rows, key=self.__names.__getitem__)
+        else:
+            missing_rows: list[int] = sorted([row for row in rows if not self.__exists[row]],
+                                             key=self.__names.__getitem__, reverse=True)
+            existing_rows: list[int] = sorted([row for row in rows if self.__exists[row]],
+                                              key=self.__sizes.__getitem__)
+            sorted_rows: list[int] = missing_rows + existing_rows
+        if self.__sort_order == Qt.SortOrder.DescendingOrder:
+            sorted_rows.reverse()
+        return array("q", sorted_rows)
+
+    def __update_persistent_indexes(self, old_order: array) -> None:
+        old_indexes: list[QModelIndex] = self.persistentIndexList()
+        if len(old_indexes) == 0:
+            return
+        new_positions: array = array("q", [0]) * len(self.__order)
+        for position, row in enumerate(self.__order):
+            new_positions[row] = position
+        new_indexes: list[QModelIndex] = [
+            self.index(new_positions[old_order[index.row()]], index.column()) if index.isValid() else QModelIndex()
+            for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+
+    def __del__(self):
+        log.debug(f"{self.__class__.__name__} was deleted")
@@ -5,46 +5,45 @@ from typing import Sequence
 from anki.collection import Collection
 from anki.notes import NoteId
 from aqt.operations import QueryOp
-from aqt.progress import ProgressManager
 from aqt.utils import show_critical
 from aqt import QWidget
 
 from .details_dialog import DetailsDialog
+from .details_model import DetailsModel
 
 log: Logger = logging.getLogger(__name__)
 
 
 class ShowDetailsDialogOp:
-    __progress_dialog_title: str = '"Note Size" addon'
 
-    def __init__(self, details_dialog: DetailsDialog, note_ids: Sequence[NoteId], progress_manager: ProgressManager,
-                 parent: QWidget):
+    def __init__(self, details_dialog: DetailsDialog, note_ids: Sequence[NoteId], parent: QWidget):
         self.__details_dialog: DetailsDialog = details_dialog
         self.__note_ids: Sequence[NoteId] = note_ids
-        self.__progress_manager: ProgressManager = progress_manager
         self.__parent: QWidget = parent
+        self.__generation: int = 0
         log.debug(f"{self.__class__.__name__} was instantiated")
 
     def run(self):
         log.debug("Start running ShowDetailsDialogOp")
+        # The dialog is shown at once and its files table is filled while the notes are being aggregated
+        self.__generation = self.__details_dialog.show_notes(self.__note_ids, self.__parent.parent())
         QueryOp(parent=self.__parent, op=self.__background_op, success=self.__on_success).failure(
-            self.__on_failure).without_collection().with_progress().run_in_background()
-        self.__progress_manager.set_title(self.__progress_dialog_title)
+            self.__on_failure).without_collection().run_in_background()
         log.debug("Finished running ShowDetailsDialogOp")
 
-    def __background_op(self, _: Collection) -> int:
+    def __background_op(self, _: Collection) -> DetailsModel:
         log.debug(f"Background operation started: {len(self.__note_ids)}")
-        self.__details_dialog.prepare_show_notes(self.__note_ids)
+        model: DetailsModel = self.__details_dialog.prepare_show_notes(self.__generation, self.__note_ids)
         log.debug("Background operation finished")
-        return len(self.__note_ids)
+        return model
 
-    def __on_success(self, count: int) -> None:
-        log.debug(f"Notes shown successfully: {count}")
-        self.__details_dialog.show_notes(self.__parent.parent())
+    def __on_success(self, model: DetailsModel) -> None:
+        log.debug(f"Notes shown successfully: {len(self.__note_ids)}")
+        self.__details_dialog.show_notes_model(self.__generation, model)
 
     @staticmethod
     def __on_failure(e: Exception) -> None:
-        log.error("Error during cache initialization", exc_info=e)
+        log.error("Error during showing note details", exc_info=e)
         show_critical(title="Showing note details", text="Failed")
 
     def __del__(self):
@@ -5,25 +5,41 @@ from typing import Any, Callable, Optional
 from anki.notes import Note
 from aqt import gui_hooks
 from aqt.editor import Editor
+from aqt.theme import ThemeManager
 from aqt.webview import WebContent
-from aqt.qt import QWidget
+from aqt.qt import QWidget, QTimer, sip
 
 from .editor_button_creator import EditorButtonCreator
 from .editor_button_js import EditorButtonJs
+from ....calculator.note_fields_size import NoteFieldsSize
 from ....config.config import Config
+from ....config.config_listener import ConfigListener
 from ....config.settings import Settings
 
 log: Logger = logging.getLogger(__name__)
 
 
-class EditorButtonHooks:
-    def __init__(self, editor_button_creator: EditorButtonCreator, editor_button_js: EditorButtonJs, settings: Settings,
+class EditorButtonHooks(ConfigListener):
+    __refresh_millis: int = 16
+
+    def __init__(self, editor_button_creator: EditorButtonCreator, editor_button_js: EditorButtonJs,
+                 note_fields_size: NoteFieldsSize, theme_manager: ThemeManager, settings: Settings,
                  config: Config) -> None:
+        super().__init__()
         self.editor: Optional[Editor] = None
         self.__config: Config = config
         self.__editor_button_creator: EditorButtonCreator = editor_button_creator
         self.__editor_button_js: EditorButtonJs = editor_button_js
+        self.__note_fields_size: NoteFieldsSize = note_fields_size
+        self.__theme_manager: ThemeManager = theme_manager
         self.__module_name: str = settings.module_name
+        self.__pending_editor: Optional[Editor] = None
+        self.__last_content_key: Optional[tuple[Any, ...]] = None
+        self.__last_js: Optional[tuple[int, str]] = None
+        self.__refresh_timer: QTimer = QTimer()
+        self.__refresh_timer.setSingleShot(True)
+        # noinspection PyUnresolvedReferences
+        self.__refresh_timer.timeout.connect(self.__refresh_pending_editor)
         self.__hook_editor_did_init: Callable[[Editor], None] = self.__on_editor_did_init
         self.__hook_editor_did_init_buttons: Callable[[list[str], Editor], None] = self.__on_editor_did_init_buttons
         self.__hook_editor_did_load_note: Callable[[Editor], None] = self.__on_editor_did_load_note
@@ -32,6 +48,7 @@ class EditorButtonHooks:
         self.__hook_webview_will_set_content: Callable[[WebContent, Optional[object]], None] \
             = self.__add_size_button_css
         self.__hook_focus_did_change: Callable[[Optional[QWidget], Optional[QWidget]], None] = self.__on_focus_changed
+        self.__config.add_listener(self)
         log.debug(f"{self.__class__.__name__} was instantiated")
 
     def setup_hooks(self) -> None:
@@ -52,15 +69,28 @@ class EditorButtonHooks:
         gui_hooks.editor_did_fire_typing_timer.remove(self.__hook_editor_did_fire_typing_timer)
         gui_hooks.webview_will_set_content.remove(self.__hook_webview_will_set_content)
         gui_hooks.focus_did_change.remove(self.__hook_focus_did_change)
+        self.__refresh_timer.stop()
+        self.__pending_editor = None
         log.info(f"{self.__class__.__name__} was set")
 
+    def on_config_changed(self) -> None:
+        log.debug("On config changed...")
+        # Size button label and color depend on config, so the same note content has to be rendered again
+        self.__last_content_key = None
+        self.__last_js = None
+        if self.__is_editor_shown(self.editor):
+            self.__refresh_size_button(self.editor)
+
     def __on_focus_changed(self, _: Optional[QWidget], __: Optional[QWidget]) -> None:
-        log.debug("On focus changed...")
-        self.__refresh_size_button(self.editor)
+        if self.__is_editor_shown(self.editor):
+            log.debug("On focus changed...")
+            self.__refresh_size_button(self.editor)
 
     def __on_editor_did_init(self, editor: Editor) -> None:
         log.debug("On Editor did init...")
         self.editor: Optional[Editor] = editor
+        self.__last_content_key = None
+        self.__last_js = None
         self.__refresh_size_button(editor)
 
     def __on_editor_did_init_buttons(self, buttons: list[str], editor: Editor) -> None:
@@ -89,18 +119,50 @@ class EditorButtonHooks:
         log.debug(f"Eval callback: {val}")
 
     def __refresh_size_button(self, editor: Optional[Editor]) -> None:
+        if editor:
+            self.__pending_editor = editor
+            if not self.__refresh_timer.isActive():
+                self.__refresh_timer.start(self.__refresh_millis)
+
+    def __refresh_pending_editor(self) -> None:
+        editor: Optional[Editor] = self.__pending_editor
+        self.__pending_editor = None
         log.debug("Refresh size button...")
-        if editor and editor.web:
-            if self.__config.get_size_button_enabled():
-                js: str = self.__editor_button_js.show_size_button_js(editor.note, editor.addMode)
-                editor.web.evalWithCallback(js, self.__eval_callback)
-                log.debug("Size button was refreshed")
-            else:
-                js: str = self.__editor_button_js.hide_size_button_js()
-                editor.web.evalWithCallback(js, self.__eval_callback)
-                log.debug("Size button was hidden")
-        else:
+        if not self.__is_editor_shown(editor):
             log.debug("Skip size button refresh as editor.web is empty")
+            return
+        size_button_enabled: bool = self.__config.get_size_button_enabled()
+        content_key: tuple[Any, ...] = self.__get_content_key(editor, size_button_enabled)
+        files_updated: bool = size_button_enabled and editor.note is not None \
+            and self.__note_fields_size.update_file_sizes(editor.note.id)
+        if content_key == self.__last_content_key and not files_updated:
+            log.debug("Skip size button refresh as note was not changed")
+            return
+        self.__last_content_key = content_key
+        if size_button_enabled:
+            js: str = self.__editor_button_js.show_size_button_js(editor.note, editor.addMode)
+        else:
+            js: str = self.__editor_button_js.hide_size_button_js()
+        if self.__last_js == (id(editor), js):
+            log.debug("Skip size button refresh as label was not changed")
+            return
+        self.__last_js = (id(editor), js)
+        editor.web.evalWithCallback(js, self.__eval_callback)
+        log.debug("Size button was refreshed" if size_button_enabled else "Size button was hidden")
+
+    def __get_content_key(self, editor: Editor, size_button_enabled: bool) -> tuple[Any, ...]:
+        # Size button color depends on night mode
+        night_mode: bool = self.__theme_manager.night_mode
+        note: Optional[Note] = editor.note
+        if note:
+            return (id(editor), size_button_enabled, night_mode, editor.addMode, note.id, note.mid,
+                    hash(tuple(note.fields)))
+        return id(editor), size_button_enabled, night_mode, editor.addMode
+
+    @staticmethod
+    def __is_editor_shown(editor: Optional[Editor]) -> bool:
+        return editor is not None and editor.web is not None and not sip.isdeleted(editor.web) \
+            and editor.web.isVisible()
 
     def __del__(self):
         log.debug(f"{self.__class__.__name__} was deleted")
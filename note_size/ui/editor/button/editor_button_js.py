@@ -22,7 +22,7 @@ class EditorButtonJs:
             if add_mode:
                 label: EditorButtonLabel = self.__editor_button_formatter.get_add_mode_label(note)
             else:
-                label: EditorButtonLabel = self.__editor_button_formatter.get_edit_mode_label(note.id)
+                label: EditorButtonLabel = self.__editor_button_formatter.get_edit_mode_label(note)
         js: str = f"""
             try {{
                 const sizeButton = document.getElementById('size_button');
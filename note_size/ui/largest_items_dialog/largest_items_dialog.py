@@ -0,0 +1,216 @@
+import logging
+from logging import Logger
+from typing import Optional, Sequence
+
+import aqt
+from anki.collection import Collection, SearchNode
+from anki.notes import NoteId
+from anki.utils import strip_html
+from aqt.operations import QueryOp
+from aqt.qt import QDialog, QComboBox, QTableWidget, QTableWidgetItem, QHeaderView, QDialogButtonBox, QVBoxLayout, \
+    Qt, QWidget, QLabel
+from aqt.utils import show_critical
+
+from ...cache.group_size_cache import GroupKey, GroupSize
+from ...calculator.largest_items_calculator import LargestItemsCalculator
+from ...calculator.size_calculator import SizeCalculator
+from ...calculator.size_formatter import SizeFormatter
+from ...common.types import SizeType, SizeStr, SignificantDigits, MediaFile, SizeBytes, FileSize, GroupType
+from ...config.config import Config
+
+log: Logger = logging.getLogger(__name__)
+
+
+class _Row:
+    def __init__(self, label: str, size_str: SizeStr, search: Optional[str]) -> None:
+        self.label: str = label
+        self.size_str: SizeStr = size_str
+        self.search: Optional[str] = search
+
+
+class LargestItemsDialog(QDialog):
+    __items_number: int = 100
+    __files_report: str = "files"
+    __note_reports: dict[str, str] = {
+        SizeType.TOTAL.value: "Notes by total size",
+        SizeType.TEXTS.value: "Notes by texts size",
+        SizeType.FILES.value: "Notes by files size",
+        __files_report: "Media files by size",
+    }
+    __group_reports: dict[str, str] = {
+        GroupType.DECK.value: "Decks by size",
+        GroupType.NOTE_TYPE.value: "Note types by size",
+        GroupType.TAG.value: "Tags by size",
+    }
+    __group_headers: dict[GroupType, str] = {
+        GroupType.DECK: "Deck",
+        GroupType.NOTE_TYPE: "Note type",
+        GroupType.TAG: "Tag",
+    }
+    __label_column: int = 0
+    __size_column: int = 1
+    __label_max_length: int = 80
+
+    def __init__(self, largest_items_calculator: LargestItemsCalculator, size_calculator: SizeCalculator,
+                 size_formatter: SizeFormatter, config: Config):
+        super().__init__(parent=None)
+        self.__largest_items_calculator: LargestItemsCalculator = largest_items_calculator
+        self.__size_calculator: SizeCalculator = size_calculator
+        self.__size_formatter: SizeFormatter = size_formatter
+        self.__config: Config = config
+        self.__note_ids: Optional[Sequence[NoteId]] = None
+        self.__rows: list[_Row] = []
+        # noinspection PyUnresolvedReferences
+        self.setWindowTitle('"Note Size" addon: largest items')
+
+        self.__title_label: QLabel = QLabel()
+        self.__report_combo_box: QComboBox = QComboBox()
+        # noinspection PyUnresolvedReferences
+        self.__report_combo_box.activated.connect(self.__refresh)
+
+        self.__table: QTableWidget = QTableWidget()
+        self.__table.setColumnCount(2)
+        self.__table.setWordWrap(False)
+        self.__table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.__table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        horizontal_header: QHeaderView = self.__table.horizontalHeader()
+        horizontal_header.setSectionResizeMode(self.__label_column, QHeaderView.ResizeMode.Stretch)
+        horizontal_header.setSectionResizeMode(self.__size_column, QHeaderView.ResizeMode.ResizeToContents)
+        # noinspection PyUnresolvedReferences
+        self.__table.cellDoubleClicked.connect(self.__on_cell_double_clicked)
+
+        button_box: QDialogButtonBox = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        # noinspection PyUnresolvedReferences
+        button_box.rejected.connect(self.close)
+
+        layout: QVBoxLayout = QVBoxLayout(self)
+        layout.addWidget(self.__title_label)
+        layout.addWidget(self.__report_combo_box)
+        layout.addWidget(self.__table)
+        layout.addWidget(button_box)
+        self.setLayout(layout)
+        self.setMinimumSize(500, 400)
+        log.debug(f"{self.__class__.__name__} was instantiated")
+
+    def show_collection(self, parent: Optional[QWidget] = None) -> None:
+        log.debug("Show largest items of collection")
+        self.__note_ids = None
+        self.__title_label.setText(f"{self.__items_number} largest items in collection "
+                                   f"(double-click to open in Browser)")
+        self.__set_reports({**self.__note_reports, **self.__group_reports})
+        self.__show(parent)
+
+    def show_notes(self, note_ids: Sequence[NoteId], parent: Optional[QWidget] = None) -> None:
+        log.debug(f"Show largest items of notes: {len(note_ids)}")
+        self.__note_ids = note_ids
+        self.__title_label.setText(f"{self.__items_number} largest items in {len(note_ids)} notes "
+                                   f"(double-click to open in Browser)")
+        self.__set_reports(self.__note_reports)
+        self.__show(parent)
+
+    def __set_reports(self, reports: dict[str, str]) -> None:
+        current_report: str = self.__report_combo_box.currentData()
+        self.__report_combo_box.clear()
+        for report, report_name in reports.items():
+            self.__report_combo_box.addItem(report_name, report)
+        if current_report in reports:
+            self.__report_combo_box.setCurrentIndex(self.__report_combo_box.findData(current_report))
+
+    def __show(self, parent: Optional[QWidget]) -> None:
+        self.setParent(parent, self.windowFlags())
+        self.__refresh()
+        # noinspection PyUnresolvedReferences
+        self.show()
+
+    def __refresh(self) -> None:
+        report: str = self.__report_combo_box.currentData()
+        query_op: QueryOp[list[_Row]] = QueryOp(parent=self, op=lambda col: self.__prepare_rows(col, report),
+                                                success=self.__show_rows)
+        query_op.failure(self.__on_failure).with_progress().run_in_background()
+
+    def __prepare_rows(self, col: Collection, report: str) -> list[_Row]:
+        significant_digits: SignificantDigits = self.__config.get_browser_significant_digits()
+        if report == self.__files_report:
+            largest_files: list[tuple[MediaFile, FileSize]] = self.__largest_items_calculator.get_largest_files(
+                self.__items_number, self.__note_ids)
+            return [_Row(media_file, self.__size_formatter.bytes_to_str(file_size.size, significant_digits),
+                         self.__note_ids_search(sorted(self.__size_calculator.get_file_note_ids(media_file))))
+                    for media_file, file_size in largest_files]
+        elif report in self.__group_reports:
+            group_type: GroupType = GroupType(report)
+            largest_groups: list[tuple[GroupKey, GroupSize]] = self.__largest_items_calculator.get_largest_groups(
+                group_type, self.__items_number)
+            rows: list[_Row] = []
+            for group_key, group_size in largest_groups:
+                group_node: Optional[SearchNode] = self.__group_search_node(col, group_type, group_key)
+                if group_node:
+                    label: str = group_node.deck or group_node.note or group_node.tag
+                    size_str: SizeStr = self.__size_formatter.bytes_to_str(group_size.get_total_size(),
+                                                                           significant_digits)
+                    rows.append(_Row(label, size_str, col.build_search_string(group_node)))
+            return rows
+        else:
+            largest_notes: list[tuple[NoteId, SizeBytes]] = self.__largest_items_calculator.get_largest_notes(
+                SizeType(report), self.__items_number, self.__note_ids)
+            return [_Row(self.__note_label(col, note_id), self.__size_formatter.bytes_to_str(size, significant_digits),
+                         self.__note_ids_search([note_id]))
+                    for note_id, size in largest_notes]
+
+    @staticmethod
+    def __group_search_node(col: Collection, group_type: GroupType, group_key: GroupKey) -> Optional[SearchNode]:
+        if group_type == GroupType.DECK:
+            deck_name: Optional[str] = col.decks.name_if_exists(group_key)
+            return SearchNode(deck=deck_name) if deck_name else None
+        if group_type == GroupType.NOTE_TYPE:
+            note_type: Optional[dict] = col.models.get(group_key)
+            return SearchNode(note=note_type["name"]) if note_type else None
+        return SearchNode(tag=group_key)
+
+    @staticmethod
+    def __note_ids_search(note_ids: list[NoteId]) -> Optional[str]:
+        return f"nid:{','.join(map(str, note_ids))}" if len(note_ids) > 0 else None
+
+    def __note_label(self, col: Collection, note_id: NoteId) -> str:
+        sort_field: Optional[str] = col.db.scalar("select sfld from notes where id = ?", note_id)
+        label: str = strip_html(str(sort_field)) if sort_field is not None else ""
+        if len(label) > self.__label_max_length:
+            label = label[:self.__label_max_length] + "…"
+        return f"{note_id}: {label}"
+
+    def __show_rows(self, rows: list[_Row]) -> None:
+        self.__rows = rows
+        report: str = self.__report_combo_box.currentData()
+        # noinspection PyUnresolvedReferences
+        self.__table.setHorizontalHeaderLabels([self.__label_header(report), "Size"])
+        # noinspection PyUnresolvedReferences
+        self.__table.setRowCount(len(rows))
+        for row_index, row in enumerate(rows):
+            label_item: QTableWidgetItem = QTableWidgetItem(row.label)
+            size_item: QTableWidgetItem = QTableWidgetItem(row.size_str)
+            size_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            # noinspection PyUnresolvedReferences
+            self.__table.setItem(row_index, self.__label_column, label_item)
+            # noinspection PyUnresolvedReferences
+            self.__table.setItem(row_index, self.__size_column, size_item)
+        log.debug(f"Largest items were shown: {len(rows)}")
+
+    def __label_header(self, report: str) -> str:
+        if report == self.__files_report:
+            return "File"
+        if report in self.__group_reports:
+            return self.__group_headers[GroupType(report)]
+        return "Note"
+
+    def __on_cell_double_clicked(self, row_index: int, _: int) -> None:
+        search: Optional[str] = self.__rows[row_index].search
+        if search:
+            log.debug(f"Open Browser: {search}")
+            aqt.dialogs.open("Browser", aqt.mw, search=(search,))
+
+    @staticmethod
+    def __on_failure(e: Exception) -> None:
+        log.error("Error during calculating largest items", exc_info=e)
+        show_critical(title="Largest items", text="Failed")
+
+    def __del__(self):
+        log.debug(f"{self.__class__.__name__} was deleted")
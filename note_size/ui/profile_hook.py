@@ -26,12 +26,16 @@ class ProfileHook:
         from ..config.config_hooks import ConfigHooks
         from ..config.settings import Settings
         from ..config.level_parser import LevelParser
+        from ..config.color_levels import ColorLevels
         from ..config.url_manager import UrlManager
         from ..calculator.size_calculator import SizeCalculator
         from ..calculator.size_formatter import SizeFormatter
         from ..calculator.updated_files_calculator import UpdatedFilesCalculator
         from ..calculator.used_files_calculator import UsedFilesCalculator
         from ..calculator.db_size_calculator import DbSizeCalculator
+        from ..calculator.largest_items_calculator import LargestItemsCalculator
+        from ..calculator.notes_selection import NotesSelection
+        from ..calculator.note_fields_size import NoteFieldsSize
         from ..cache.cache_hooks import CacheHooks
         from ..cache.cache_initializer import CacheInitializer
         from ..cache.item_id_cache import ItemIdCache
@@ -39,6 +43,9 @@ class ProfileHook:
         from ..cache.cache_storage import CacheStorage
         from ..cache.cache_manager import CacheManager
         from ..cache.size_str_cache import SizeStrCache
+        from ..cache.size_index import SizeIndex
+        from ..cache.group_size_cache import GroupSizeCache
+        from ..cache.search_aggregate_cache import SearchAggregateCache
         from .deck_browser.deck_browser_js import DeckBrowserJs
         from .deck_browser.deck_browser_updater import DeckBrowserUpdater
         from ..log.logs import Logs
@@ -49,10 +56,12 @@ class ProfileHook:
         from ..ui.details_dialog.details_dialog import DetailsDialog
         from ..ui.details_dialog.details_model_filler import DetailsModelFiller
         from ..ui.details_dialog.file_type_helper import FileTypeHelper
+        from ..ui.largest_items_dialog.largest_items_dialog import LargestItemsDialog
         from ..ui.editor.button.editor_button_formatter import EditorButtonFormatter
         from ..ui.editor.button.editor_button_hooks import EditorButtonHooks
         from ..ui.browser.column.column_hooks import ColumnHooks
         from ..ui.browser.column.item_id_sorter import ItemIdSorter
+        from ..ui.browser.search.size_search_hooks import SizeSearchHooks
         from ..ui.editor.button.editor_button_js import EditorButtonJs
         from ..ui.editor.button.editor_button_creator import EditorButtonCreator
         from ..ui.browser.button.browser_hooks import BrowserHooks
@@ -91,20 +100,26 @@ class ProfileHook:
         size_str_cache: SizeStrCache = SizeStrCache(size_calculator, size_formatter)
         column_hooks: ColumnHooks = ColumnHooks(item_id_cache, size_str_cache, item_id_sorter, config)
         column_hooks.setup_hooks()
+        size_index: SizeIndex = SizeIndex(self.__collection_holder, size_calculator)
+        size_search_hooks: SizeSearchHooks = SizeSearchHooks(size_index, item_id_cache)
+        size_search_hooks.setup_hooks()
+        group_size_cache: GroupSizeCache = GroupSizeCache(self.__collection_holder, size_calculator)
+        notes_selection: NotesSelection = NotesSelection(self.__collection_holder, size_calculator)
+        search_aggregate_cache: SearchAggregateCache = SearchAggregateCache(notes_selection)
         level_parser: LevelParser = LevelParser(size_formatter)
         theme_manager: ThemeManager = theme.theme_manager
+        color_levels: ColorLevels = ColorLevels(level_parser, theme_manager, config)
+        note_fields_size: NoteFieldsSize = NoteFieldsSize(self.__collection_holder, media_cache)
         editor_button_formatter: EditorButtonFormatter = EditorButtonFormatter(
-            size_str_cache, size_calculator, size_formatter, level_parser, theme_manager, config)
+            note_fields_size, size_formatter, color_levels, config)
         trash: Trash = Trash(self.__collection_holder)
-        current_cache_version: int = 1
+        current_cache_version: int = 2
         cache_storage: CacheStorage = CacheStorage(current_cache_version, settings)
         file_type_helper: FileTypeHelper = FileTypeHelper()
-        updated_files_calculator: UpdatedFilesCalculator = UpdatedFilesCalculator(self.__collection_holder,
-                                                                                  size_calculator,
-                                                                                  media_cache)
+        updated_files_calculator: UpdatedFilesCalculator = UpdatedFilesCalculator(size_calculator, media_cache)
         cache_manager: CacheManager = CacheManager(
             media_cache, item_id_cache, size_calculator, size_formatter, file_type_helper, size_str_cache,
-            updated_files_calculator)
+            updated_files_calculator, size_index, group_size_cache, search_aggregate_cache)
         deck_browser: DeckBrowser = mw.deckBrowser
         progress_manager: ProgressManager = mw.progress
         task_manager: TaskManager = mw.taskman
@@ -114,24 +129,29 @@ class ProfileHook:
                                                                          media_cache)
         db_size_calculator: DbSizeCalculator = DbSizeCalculator(self.__collection_holder)
         deck_browser_formatter: DeckBrowserFormatter = DeckBrowserFormatter(
-            self.__collection_holder, item_id_cache, media_cache, trash, size_formatter, used_files_calculator,
-            db_size_calculator, theme_manager, config, settings)
+            self.__collection_holder, item_id_cache, size_calculator, media_cache, trash, size_formatter,
+            used_files_calculator, db_size_calculator, group_size_cache, theme_manager, config, settings)
         desktop_services: QDesktopServices = QDesktopServices()
         url_manager: UrlManager = UrlManager()
         config_ui: ConfigUi = ConfigUi(config, config_loader, logs, cache_initializer, desktop_services, level_parser,
                                        url_manager, deck_browser, theme_manager, settings)
         details_model_filler: DetailsModelFiller = DetailsModelFiller(
-            size_calculator, size_formatter, media_cache, config)
+            size_calculator, size_formatter, media_cache, search_aggregate_cache, config)
+        largest_items_calculator: LargestItemsCalculator = LargestItemsCalculator(
+            self.__collection_holder, size_calculator, media_cache, group_size_cache)
+        largest_items_dialog: LargestItemsDialog = LargestItemsDialog(
+            largest_items_calculator, size_calculator, size_formatter, config)
         details_dialog: DetailsDialog = DetailsDialog(
-            size_calculator, size_formatter, file_type_helper, details_model_filler, theme_manager, config_ui,
-            config, settings)
+            size_calculator, size_formatter, file_type_helper, details_model_filler, largest_items_dialog,
+            task_manager, theme_manager, config_ui, config, settings)
         editor_button_js: EditorButtonJs = EditorButtonJs(editor_button_formatter)
         editor_button_creator: EditorButtonCreator = EditorButtonCreator(editor_button_formatter, details_dialog)
         editor_button_hooks: EditorButtonHooks = EditorButtonHooks(
-            editor_button_creator, editor_button_js, settings, config)
+            editor_button_creator, editor_button_js, note_fields_size, theme_manager, settings, config)
         editor_button_hooks.setup_hooks()
-        deck_browser_js: DeckBrowserJs = DeckBrowserJs(config, config_ui)
-        deck_browser_updater: DeckBrowserUpdater = DeckBrowserUpdater(deck_browser, deck_browser_formatter, config)
+        deck_browser_js: DeckBrowserJs = DeckBrowserJs(config, config_ui, largest_items_dialog)
+        deck_browser_updater: DeckBrowserUpdater = DeckBrowserUpdater(
+            deck_browser, deck_browser_formatter, group_size_cache, task_manager, config)
         deck_browser_hooks: DeckBrowserHooks = DeckBrowserHooks(deck_browser_updater, deck_browser_js)
         deck_browser_hooks.setup_hooks()
         cache_hooks: CacheHooks = CacheHooks(cache_manager, cache_initializer, updated_files_calculator)
@@ -139,7 +159,7 @@ class ProfileHook:
         config_hooks: ConfigHooks = ConfigHooks(config_ui, desktop_services, url_manager)
         config_hooks.setup_hooks()
         browser_button_manager: BrowserButtonManager = BrowserButtonManager(
-            item_id_cache, size_str_cache, details_dialog, progress_manager, config)
+            item_id_cache, search_aggregate_cache, size_formatter, details_dialog, config)
         browser_hooks: BrowserHooks = BrowserHooks(browser_button_manager, config)
         browser_hooks.setup_hooks()
         theme_hooks: ThemeHooks = ThemeHooks(deck_browser_updater, details_dialog)
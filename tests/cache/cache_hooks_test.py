@@ -24,6 +24,7 @@ def test_setup_hooks(cache_hooks: CacheHooks):
     assert hooks.note_will_flush.count() == 1
     assert gui_hooks.profile_did_open.count() == 2
     assert gui_hooks.profile_will_close.count() == 2
+    assert gui_hooks.operation_did_execute.count() == 1
     cache_hooks.remove_hooks()
     assert_no_hooks()
 
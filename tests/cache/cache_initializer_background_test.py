@@ -2,6 +2,7 @@ from typing import Optional
 
 from anki.cards import Card
 from anki.collection import Collection
+from anki.notes import Note
 from aqt.deckbrowser import DeckBrowser
 from aqt.taskman import TaskManager
 
@@ -50,11 +51,16 @@ def test_initialize_caches(td: Data, col: Collection, cache_manager: CacheManage
     assert size_formatter.is_initialized()
     assert file_type_helper.is_initialized()
 
-    assert media_cache.as_dict_list() == [{MediaFiles.animation: FileSize(SizeBytes(9)),
-                                           MediaFiles.picture: FileSize(SizeBytes(7)),
-                                           MediaFiles.sound: FileSize(SizeBytes(5))}]
+    assert media_cache.as_dict_list()[0] == {MediaFiles.animation: FileSize(SizeBytes(9)),
+                                             MediaFiles.picture: FileSize(SizeBytes(7)),
+                                             MediaFiles.sound: FileSize(SizeBytes(5))}
+    assert media_cache.as_dict_list()[1][MediaCache.file_index_key].keys() == {
+        MediaFiles.animation, MediaFiles.picture, MediaFiles.sound}
     assert item_id_cache.as_dict_list() == [{card1.id: card1.nid,
-                                             card2.id: card2.nid}]
+                                             card2.id: card2.nid},
+                                            {card1.nid: [card1.id],
+                                             card2.nid: [card2.id]}]
+    schema: int = col.db.scalar("select scm from col")
     assert size_calculator.as_dict_list() == [{SizeType.TOTAL: {card1.nid: 144, card2.nid: 71},
                                                SizeType.TEXTS: {card1.nid: 123, card2.nid: 71},
                                                SizeType.FILES: {card1.nid: 21, card2.nid: 0}},
@@ -63,7 +69,10 @@ def test_initialize_caches(td: Data, col: Collection, cache_manager: CacheManage
                                               {card1.nid: {MediaFiles.animation: FileSize(SizeBytes(9)),
                                                            MediaFiles.picture: FileSize(SizeBytes(7)),
                                                            MediaFiles.sound: FileSize(SizeBytes(5))},
-                                               card2.nid: {}}]
+                                               card2.nid: {}},
+                                              {card1.nid: card1.note().mod, card2.nid: card2.note().mod},
+                                              {SizeCalculator.collection_schema_key: schema,
+                                               SizeCalculator.collection_mod_key: col.mod}]
     assert size_formatter.as_dict_list() == [{SizeBytes(0): {Digits.two: '0 B'},
                                               SizeBytes(21): {Digits.two: '21 B'},
                                               SizeBytes(71): {Digits.two: '71 B'},
@@ -89,3 +98,68 @@ def test_update_progress(td: Data, col: Collection, cache_manager: CacheManager,
     assert count == 21
     assert update_progress_history == ['Caching note sizes: 10 of 21 - 10 - 21',
                                        'Caching note sizes: 20 of 21 - 20 - 21']
+
+
+def test_initialize_caches_in_chunks(td: Data, col: Collection, cache_manager: CacheManager,
+                                     size_calculator: SizeCalculator, item_id_cache: ItemIdCache,
+                                     cache_storage: CacheStorage, task_manager: TaskManager,
+                                     deck_browser: DeckBrowser):
+    config: Config = td.read_config_updated({'Cache': {'Warmup Chunk Size': 2, 'Warmup Workers': 3}})
+    card1: Card = td.create_card_with_files()
+    card2: Card = td.create_card_without_files()
+    card3: Card = td.create_card_with_files()
+    card4: Card = td.create_card_without_files()
+    card5: Card = td.create_card_with_files()
+    cache_initializer_background: CacheInitializerBackground = CacheInitializerBackground(
+        cache_storage, cache_manager, deck_browser, task_manager, config, update_progress_callback)
+    count: int = cache_initializer_background.initialize_caches(col)
+    assert count == 5
+    assert size_calculator.is_initialized()
+    assert size_calculator.as_dict_list()[0] == {
+        SizeType.TOTAL: {card1.nid: 144, card2.nid: 71, card3.nid: 144, card4.nid: 71, card5.nid: 144},
+        SizeType.TEXTS: {card1.nid: 123, card2.nid: 71, card3.nid: 123, card4.nid: 71, card5.nid: 123},
+        SizeType.FILES: {card1.nid: 21, card2.nid: 0, card3.nid: 21, card4.nid: 0, card5.nid: 21}}
+    assert item_id_cache.get_cache_size() == 5
+
+
+def test_initialize_caches_validates_saved_caches(td: Data, col: Collection, cache_manager: CacheManager,
+                                                  size_calculator: SizeCalculator, item_id_cache: ItemIdCache,
+                                                  config: Config, cache_storage: CacheStorage,
+                                                  task_manager: TaskManager, deck_browser: DeckBrowser):
+    note1: Note = td.create_note_without_files()
+    note2: Note = td.create_note_without_files()
+    cache_initializer_background: CacheInitializerBackground = CacheInitializerBackground(
+        cache_storage, cache_manager, deck_browser, task_manager, config, update_progress_callback)
+    assert cache_initializer_background.initialize_caches(col) == 2
+    cache_storage.save_caches_to_file(cache_manager.get_caches())
+
+    Data.update_front_field(note1, "updated")
+    col.remove_notes([note2.id])
+    note3: Note = td.create_note_without_files()
+    cache_manager.invalidate_caches()
+
+    assert cache_initializer_background.initialize_caches(col) == 2
+    assert size_calculator.is_initialized()
+    assert size_calculator.as_dict_list()[0][SizeType.TEXTS] == {note1.id: 44, note3.id: 71}
+    assert size_calculator.get_note_mods() == {note1.id: col.get_note(note1.id).mod,
+                                               note3.id: col.get_note(note3.id).mod}
+    assert item_id_cache.get_cache_size() == 2
+
+
+def test_fill_caches_in_slices(td: Data, col: Collection, cache_manager: CacheManager, size_calculator: SizeCalculator,
+                               item_id_cache: ItemIdCache, config: Config, cache_storage: CacheStorage,
+                               task_manager: TaskManager, deck_browser: DeckBrowser):
+    note1: Note = td.create_note_with_files()
+    note2: Note = td.create_note_without_files()
+    cache_initializer_background: CacheInitializerBackground = CacheInitializerBackground(
+        cache_storage, cache_manager, deck_browser, task_manager, config, update_progress_callback)
+    assert not cache_initializer_background.start_filling_caches(col)
+    assert not cache_manager.get_caches_initialized()
+    assert size_calculator.get_cached_note_number() == 0
+
+    assert not cache_initializer_background.fill_caches_slice(col, slice_millis=0)
+    assert size_calculator.get_cached_note_number() == 0
+    assert cache_initializer_background.fill_caches_slice(col, slice_millis=10_000)
+    assert cache_manager.get_caches_initialized()
+    assert size_calculator.as_dict_list()[0][SizeType.TOTAL] == {note1.id: 144, note2.id: 71}
+    assert item_id_cache.get_cache_size() == 2
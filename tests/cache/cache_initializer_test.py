@@ -1,6 +1,9 @@
 from pathlib import Path
 
 from anki.cards import Card
+from anki.collection import Collection
+from aqt import AnkiQt
+from pytestqt.qtbot import QtBot
 
 from note_size.cache.cache_initializer import CacheInitializer
 from note_size.cache.cache_manager import CacheManager
@@ -23,9 +26,12 @@ def test_initialize_caches_no_file(cache_initializer: CacheInitializer, cache_ma
     wait_until(lambda: cache_manager.get_cache_size() == 0)
 
 
-def test_initialize_caches_from_file(cache_initializer: CacheInitializer, td: Data, cache_manager: CacheManager,
-                                     cache_storage: CacheStorage, settings: Settings):
+def test_initialize_caches_from_file(cache_initializer: CacheInitializer, td: Data, col: Collection, mw: AnkiQt,
+                                     cache_manager: CacheManager, cache_storage: CacheStorage, settings: Settings):
+    mw.col = col
     __fill_cache(cache_manager, td)
+    schema, mod = col.db.first("select scm, mod from col")
+    cache_manager.get_size_calculator().set_collection_stamps(schema, mod)
     assert cache_manager.get_cache_size() == 12
 
     cache_file: Path = settings.get_cache_file()
@@ -42,7 +48,33 @@ def test_initialize_caches_from_file(cache_initializer: CacheInitializer, td: Da
     cache_initializer.warmup_caches()
     wait_until(lambda: cache_manager.get_caches_initialized())
     wait_until(lambda: cache_manager.get_cache_size() == 12)
-    wait_until(lambda: not cache_file.exists())
+    assert cache_file.exists()
+
+
+def test_initialize_caches_lazily(cache_initializer: CacheInitializer, td: Data, col: Collection, mw: AnkiQt,
+                                  cache_manager: CacheManager, config: Config, qtbot: QtBot):
+    mw.col = col
+    config.set_cache_lazy_mode_enabled(True)
+    config.set_cache_lazy_fill_pause_millis(0)
+    card: Card = td.create_card_with_files()
+    assert not cache_manager.get_caches_initialized()
+    cache_initializer.warmup_caches()
+    qtbot.waitUntil(lambda: cache_manager.get_caches_initialized(), timeout=10_000)
+    assert cache_manager.get_size_calculator().is_note_cached(card.nid)
+
+
+# Partially filled caches are saved to be completed on next startup
+def test_save_cache_to_file_partially_filled(cache_initializer: CacheInitializer, td: Data, col: Collection,
+                                             cache_manager: CacheManager, settings: Settings):
+    __fill_cache(cache_manager, td)
+    schema, mod = col.db.first("select scm, mod from col")
+    cache_manager.get_size_calculator().set_collection_stamps(schema, mod)
+    assert not cache_manager.get_caches_initialized()
+
+    cache_file: Path = settings.get_cache_file()
+    assert not cache_file.exists()
+    cache_initializer.save_cache_to_file()
+    assert cache_file.exists()
 
 
 def test_save_cache_to_file_enabled(cache_initializer: CacheInitializer, td: Data, cache_manager: CacheManager,
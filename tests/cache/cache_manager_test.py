@@ -5,6 +5,7 @@ from note_size.cache.cache import Cache
 from note_size.cache.cache_manager import CacheManager
 from note_size.cache.item_id_cache import ItemIdCache
 from note_size.cache.media_cache import MediaCache
+from note_size.cache.search_aggregate_cache import SearchAggregateCache
 from note_size.cache.size_str_cache import SizeStrCache
 from note_size.calculator.size_calculator import SizeCalculator
 from note_size.calculator.size_formatter import SizeFormatter
@@ -96,6 +97,10 @@ def test_get_size_str_cache(cache_manager: CacheManager, size_str_cache: SizeStr
     assert cache_manager.get_size_str_cache() == size_str_cache
 
 
+def test_get_search_aggregate_cache(cache_manager: CacheManager, search_aggregate_cache: SearchAggregateCache):
+    assert cache_manager.get_search_aggregate_cache() == search_aggregate_cache
+
+
 def test_get_size_formatter(cache_manager: CacheManager, size_formatter: SizeFormatter):
     assert cache_manager.get_size_formatter() == size_formatter
 
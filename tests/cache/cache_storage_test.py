@@ -54,18 +54,21 @@ def test_write_read_cache_file(cache_storage: CacheStorage, td: Data, collection
     size_formatter_2: SizeFormatter = SizeFormatter()
     file_type_helper_2: FileTypeHelper = FileTypeHelper()
     size_str_cache_2: SizeStrCache = SizeStrCache(size_calculator_2, size_formatter_2)
-    updated_files_calculator_2: UpdatedFilesCalculator = UpdatedFilesCalculator(collection_holder, size_calculator_2,
-                                                                                media_cache_2)
-    assert item_id_cache_2.as_dict_list() == [{}]
+    updated_files_calculator_2: UpdatedFilesCalculator = UpdatedFilesCalculator(size_calculator_2, media_cache_2)
+    assert item_id_cache_2.as_dict_list() == [{}, {}]
     read_success: bool = cache_storage.read_caches_from_file(
         [media_cache_2, item_id_cache_2, size_calculator_2, size_formatter_2, file_type_helper_2, size_str_cache_2,
          updated_files_calculator_2])
     assert read_success
     assert media_cache_2.as_dict_list() == [{MediaFiles.animation: FileSize(SizeBytes(9)),
                                              MediaFiles.picture: FileSize(SizeBytes(7)),
-                                             MediaFiles.sound: FileSize(SizeBytes(5))}]
+                                             MediaFiles.sound: FileSize(SizeBytes(5))},
+                                            {MediaCache.file_index_key: None,
+                                             MediaCache.media_dir_mtime_key: None}]
     assert item_id_cache_2.as_dict_list() == [{card1.id: card1.nid,
-                                               card2.id: card2.nid}]
+                                               card2.id: card2.nid},
+                                              {card1.nid: [card1.id],
+                                               card2.nid: [card2.id]}]
     assert size_calculator_2.as_dict_list() == [{SizeType.TOTAL: {card1.nid: 143, card2.nid: 70},
                                                  SizeType.TEXTS: {card1.nid: 122, card2.nid: 70},
                                                  SizeType.FILES: {card1.nid: 21, card2.nid: 0}},
@@ -75,7 +78,9 @@ def test_write_read_cache_file(cache_storage: CacheStorage, td: Data, collection
                                                 {card1.nid: {MediaFiles.animation: FileSize(SizeBytes(9)),
                                                              MediaFiles.picture: FileSize(SizeBytes(7)),
                                                              MediaFiles.sound: FileSize(SizeBytes(5))},
-                                                 card2.nid: {}}]
+                                                 card2.nid: {}},
+                                                {card1.nid: card1.note().mod, card2.nid: card2.note().mod},
+                                                {}]
     assert size_formatter_2.as_dict_list() == [{SizeBytes(0): {Digits.one: '0 B'},
                                                 SizeBytes(70): {Digits.one: '70 B'},
                                                 SizeBytes(143): {Digits.one: '143 B'}}]
@@ -100,11 +105,11 @@ def test_read_invalid_cache_file(cache_storage: CacheStorage, item_id_cache: Ite
     cache_file: Path = settings.get_cache_file()
     cache_file.write_bytes(b'invalid cache content')
     assert os.path.exists(cache_file)
-    assert item_id_cache.as_dict_list() == [{}]
+    assert item_id_cache.as_dict_list() == [{}, {}]
     with caplog.at_level(logging.WARNING):
         read_success: bool = cache_storage.read_caches_from_file([item_id_cache])
     assert not read_success
-    assert item_id_cache.as_dict_list() == [{}]
+    assert item_id_cache.as_dict_list() == [{}, {}]
     assert "Cannot deserialize cache file:" in caplog.text
     assert not os.path.exists(cache_file)
 
@@ -112,15 +117,44 @@ def test_read_invalid_cache_file(cache_storage: CacheStorage, item_id_cache: Ite
 def test_read_absent_cache_file(cache_storage: CacheStorage, item_id_cache: ItemIdCache, settings: Settings, caplog):
     cache_file: Path = settings.get_cache_file()
     assert not cache_file.exists()
-    assert item_id_cache.as_dict_list() == [{}]
+    assert item_id_cache.as_dict_list() == [{}, {}]
     with caplog.at_level(logging.INFO):
         read_success: bool = cache_storage.read_caches_from_file([item_id_cache])
     assert not read_success
-    assert item_id_cache.as_dict_list() == [{}]
+    assert item_id_cache.as_dict_list() == [{}, {}]
     assert "Skip reading absent cache file:" in caplog.text
     assert not cache_file.exists()
 
 
+def test_save_cache_file_atomically(cache_storage: CacheStorage, td: Data, item_id_cache: ItemIdCache,
+                                    settings: Settings):
+    card: Card = td.create_card_with_files()
+    item_id_cache.get_note_id_by_card_id(card.id)
+    cache_file: Path = settings.get_cache_file()
+    cache_file.write_bytes(b'previous cache content')
+    cache_storage.save_caches_to_file([item_id_cache])
+    assert cache_file.read_bytes() != b'previous cache content'
+    assert not cache_file.with_name(f"{cache_file.name}.partial").exists()
+
+
+def test_read_corrupted_cache_file(cache_storage: CacheStorage, td: Data, collection_holder: CollectionHolder,
+                                   item_id_cache: ItemIdCache, settings: Settings, caplog):
+    card: Card = td.create_card_with_files()
+    item_id_cache.get_note_id_by_card_id(card.id)
+    cache_storage.save_caches_to_file([item_id_cache])
+    cache_file: Path = settings.get_cache_file()
+    content: bytearray = bytearray(cache_file.read_bytes())
+    content[-1] ^= 0xFF
+    cache_file.write_bytes(bytes(content))
+    item_id_cache_2: ItemIdCache = ItemIdCache(collection_holder)
+    with caplog.at_level(logging.WARNING):
+        read_success: bool = cache_storage.read_caches_from_file([item_id_cache_2])
+    assert not read_success
+    assert "Cannot deserialize cache file:" in caplog.text
+    assert item_id_cache_2.as_dict_list() == [{}, {}]
+    assert not cache_file.exists()
+
+
 def test_read_partially_invalid_cache_file(cache_storage: CacheStorage, td: Data, collection_holder: CollectionHolder,
                                            item_id_cache: ItemIdCache, size_calculator: SizeCalculator,
                                            config: Config, settings: Settings, media_cache: MediaCache, caplog):
@@ -137,12 +171,12 @@ def test_read_partially_invalid_cache_file(cache_storage: CacheStorage, td: Data
     assert os.path.exists(cache_file)
 
     item_id_cache_2: ItemIdCache = ItemIdCache(collection_holder)
-    assert item_id_cache_2.as_dict_list() == [{}]
+    assert item_id_cache_2.as_dict_list() == [{}, {}]
     with caplog.at_level(logging.WARNING):
         read_success: bool = cache_storage.read_caches_from_file([item_id_cache_2])
     assert not read_success
     assert "Cannot deserialize cache file:" in caplog.text
-    assert item_id_cache_2.as_dict_list() == [{}]
+    assert item_id_cache_2.as_dict_list() == [{}, {}]
     assert not os.path.exists(cache_file)
 
 
@@ -154,3 +188,19 @@ def test_ignore_cache_of_old_version(current_cache_version: int, cache_storage:
     old_cache_storage.save_caches_to_file(caches)
     read_success: bool = cache_storage.read_caches_from_file(caches)
     assert not read_success
+
+
+def test_read_legacy_pickle_cache_file(current_cache_version: int, cache_storage: CacheStorage, td: Data,
+                                       collection_holder: CollectionHolder, item_id_cache: ItemIdCache,
+                                       settings: Settings):
+    card: Card = td.create_card_with_files()
+    item_id_cache.get_note_id_by_card_id(card.id)
+    dict_of_caches: dict[str, Any] = {
+        item_id_cache.cache_id(): item_id_cache.as_dict_list(),
+        CacheStorage.cache_metadata_key: [{CacheStorage.version_key: current_cache_version}]}
+    # noinspection PyTypeChecker
+    pickle.dump(dict_of_caches, settings.get_cache_file().open("wb"))
+    item_id_cache_2: ItemIdCache = ItemIdCache(collection_holder)
+    read_success: bool = cache_storage.read_caches_from_file([item_id_cache_2])
+    assert read_success
+    assert item_id_cache_2.as_dict_list() == [{card.id: card.nid}, {card.nid: [card.id]}]
@@ -0,0 +1,50 @@
+import pytest
+
+from note_size.cache.columnar_codec import ColumnarCodec
+from note_size.common.types import SizeType, FileType, FileSize, SizeBytes
+from tests.data import MediaFiles
+
+
+@pytest.fixture
+def codec() -> ColumnarCodec:
+    return ColumnarCodec()
+
+
+def test_encode_decode(codec: ColumnarCodec):
+    obj: dict[str, list] = {
+        "media": [{MediaFiles.picture: FileSize(SizeBytes(7)), MediaFiles.video: FileSize(SizeBytes(0), exists=False)},
+                  {"index": {MediaFiles.picture: (7, 1_700_000_000_000_000_000, 42)}, "mtime": None}],
+        "ids": [{1: 10, 2: 10, 3: 30}, {10: [1, 2], 30: [3]}],
+        "sizes": [{SizeType.TOTAL: {10: 143}, SizeType.TEXTS: {}, SizeType.FILES: {10: 21}},
+                  {10: {MediaFiles.picture, MediaFiles.sound}, 30: set()},
+                  {10: {MediaFiles.picture: FileSize(SizeBytes(7))}, 30: {}}],
+        "types": [{MediaFiles.picture: FileType.IMAGE}],
+        "formats": [{0: {1: "0 B"}}],
+        "other": [True, False, -1, ("a", 2)],
+        "empty": [{}]
+    }
+    decoded: dict[str, list] = codec.decode(codec.encode(obj))
+    assert decoded == obj
+
+
+def test_decode_without_copying(codec: ColumnarCodec):
+    encoded: bytes = codec.encode({"cache": codec.encode([{3: 30, 1: 10, 2: 20}])})
+    decoded: dict[str, memoryview] = codec.decode(encoded)
+    assert isinstance(decoded["cache"], memoryview)
+    assert decoded["cache"].obj is encoded
+    assert list(codec.decode(decoded["cache"])[0].items()) == [(1, 10), (2, 20), (3, 30)]
+
+
+def test_is_columnar(codec: ColumnarCodec):
+    assert ColumnarCodec.is_columnar(codec.encode({}))
+    assert not ColumnarCodec.is_columnar(b"\x80\x04")
+
+
+def test_decode_invalid(codec: ColumnarCodec):
+    with pytest.raises(ValueError):
+        codec.decode(b"invalid cache content")
+
+
+def test_encode_unsupported_type(codec: ColumnarCodec):
+    with pytest.raises(TypeError):
+        codec.encode({1: 2.5})
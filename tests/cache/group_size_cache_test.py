@@ -0,0 +1,99 @@
+from anki.collection import Collection, OpChanges
+from anki.decks import DeckId
+from anki.notes import Note
+from aqt import gui_hooks
+
+from note_size.cache.cache_hooks import CacheHooks
+from note_size.cache.group_size_cache import GroupSizeCache, GroupSize
+from note_size.common.types import GroupType, MediaFile
+from tests.data import Data, DefaultFields
+
+
+def test_get_group_sizes(col: Collection, td: Data, group_size_cache: GroupSizeCache):
+    parent_deck_id: DeckId = col.decks.id("Parent")
+    child_deck_id: DeckId = col.decks.id("Parent::Child")
+    note_1: Note = __create_note(col, td, parent_deck_id, "tag1::sub", {MediaFile("a.jpg"): "aaaa"})
+    __create_note(col, td, child_deck_id, "tag2", {MediaFile("a.jpg"): "aaaa", MediaFile("b.jpg"): "bb"})
+    assert __get_sizes(group_size_cache, GroupType.DECK) == {
+        parent_deck_id: (2, 51, 6, {"a.jpg": 2, "b.jpg": 1}),
+        child_deck_id: (1, 34, 6, {"a.jpg": 1, "b.jpg": 1})}
+    assert __get_sizes(group_size_cache, GroupType.NOTE_TYPE) == {
+        note_1.mid: (2, 51, 6, {"a.jpg": 2, "b.jpg": 1})}
+    assert __get_sizes(group_size_cache, GroupType.TAG) == {
+        "tag1": (1, 17, 4, {"a.jpg": 1}),
+        "tag1::sub": (1, 17, 4, {"a.jpg": 1}),
+        "tag2": (1, 34, 6, {"a.jpg": 1, "b.jpg": 1})}
+    assert group_size_cache.get_group_size(GroupType.DECK, parent_deck_id).get_total_size() == 57
+    assert group_size_cache.get_group_size(GroupType.TAG, "absent") is None
+
+
+def test_update_incrementally(col: Collection, td: Data, group_size_cache: GroupSizeCache, cache_hooks: CacheHooks):
+    cache_hooks.setup_hooks()
+    parent_deck_id: DeckId = col.decks.id("Parent")
+    child_deck_id: DeckId = col.decks.id("Parent::Child")
+    note_1: Note = __create_note(col, td, parent_deck_id, "tag1", {MediaFile("a.jpg"): "aaaa"})
+    note_2: Note = __create_note(col, td, child_deck_id, "tag2", {MediaFile("a.jpg"): "aaaa", MediaFile("b.jpg"): "bb"})
+    assert __get_sizes(group_size_cache, GroupType.DECK) == {
+        parent_deck_id: (2, 51, 6, {"a.jpg": 2, "b.jpg": 1}),
+        child_deck_id: (1, 34, 6, {"a.jpg": 1, "b.jpg": 1})}
+
+    note_2[DefaultFields.front_field_name] = '<img src="b.jpg">'
+    col.update_note(note_2)
+    assert __get_sizes(group_size_cache, GroupType.DECK) == {
+        parent_deck_id: (2, 34, 6, {"a.jpg": 1, "b.jpg": 1}),
+        child_deck_id: (1, 17, 2, {"b.jpg": 1})}
+
+    col.remove_notes([note_1.id])
+    assert __get_sizes(group_size_cache, GroupType.DECK) == {
+        parent_deck_id: (1, 17, 2, {"b.jpg": 1}),
+        child_deck_id: (1, 17, 2, {"b.jpg": 1})}
+    assert __get_sizes(group_size_cache, GroupType.TAG) == {"tag2": (1, 17, 2, {"b.jpg": 1})}
+
+    group_size_cache.invalidate()
+    assert __get_sizes(group_size_cache, GroupType.TAG) == {"tag2": (1, 17, 2, {"b.jpg": 1})}
+
+
+def test_mark_changed(col: Collection, td: Data, group_size_cache: GroupSizeCache, cache_hooks: CacheHooks):
+    cache_hooks.setup_hooks()
+    parent_deck_id: DeckId = col.decks.id("Parent")
+    other_deck_id: DeckId = col.decks.id("Other")
+    note: Note = __create_note(col, td, parent_deck_id, "tag1", {MediaFile("a.jpg"): "aaaa"})
+    assert __get_sizes(group_size_cache, GroupType.DECK) == {parent_deck_id: (1, 17, 4, {"a.jpg": 1})}
+    assert group_size_cache.is_up_to_date()
+
+    changes: OpChanges = col.set_deck(note.card_ids(), other_deck_id).changes
+    gui_hooks.operation_did_execute(changes, None)
+    assert not group_size_cache.is_up_to_date()
+    assert group_size_cache.get_built_group_sizes(GroupType.DECK).keys() == {parent_deck_id}
+    assert group_size_cache.refresh()
+    assert group_size_cache.is_up_to_date()
+    assert __get_sizes(group_size_cache, GroupType.DECK) == {other_deck_id: (1, 17, 4, {"a.jpg": 1})}
+
+    changes = col.tags.bulk_add([note.id], "tag2").changes
+    gui_hooks.operation_did_execute(changes, None)
+    assert __get_sizes(group_size_cache, GroupType.TAG) == {
+        "tag1": (1, 17, 4, {"a.jpg": 1}),
+        "tag2": (1, 17, 4, {"a.jpg": 1})}
+
+    changes = col.decks.reparent([other_deck_id], parent_deck_id).changes
+    gui_hooks.operation_did_execute(changes, None)
+    assert __get_sizes(group_size_cache, GroupType.DECK) == {
+        parent_deck_id: (1, 17, 4, {"a.jpg": 1}),
+        other_deck_id: (1, 17, 4, {"a.jpg": 1})}
+
+
+def __create_note(col: Collection, td: Data, deck_id: DeckId, tag: str, files: dict[MediaFile, str]) -> Note:
+    for media_file, content in files.items():
+        td.write_file(media_file, content)
+    note: Note = col.new_note(td.note_type)
+    note[DefaultFields.front_field_name] = "".join(f'<img src="{media_file}">' for media_file in files.keys())
+    note.tags = [tag]
+    col.add_note(note, deck_id)
+    return note
+
+
+def __get_sizes(group_size_cache: GroupSizeCache,
+                group_type: GroupType) -> dict[object, tuple[int, int, int, dict[MediaFile, int]]]:
+    group_sizes: dict[object, GroupSize] = group_size_cache.get_group_sizes(group_type)
+    return {group_key: (group_size.notes_number, group_size.texts_size, group_size.files.get_total_size(),
+                        group_size.files.get_refcounts()) for group_key, group_size in group_sizes.items()}
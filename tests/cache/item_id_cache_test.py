@@ -1,4 +1,5 @@
 import timeit
+from typing import Sequence
 
 import pytest
 from anki.cards import Card
@@ -48,7 +49,7 @@ def test_get_note_size_bytes_performance(td: Data, item_id_cache: ItemIdCache, s
 
 def test_evict_note(col: Collection, td: Data, item_id_cache: ItemIdCache):
     assert item_id_cache.get_cache_size() == 0
-    assert item_id_cache.as_dict_list() == [{}]
+    assert item_id_cache.as_dict_list() == [{}, {}]
 
     card1: Card = td.create_card_with_files()
     item_id_cache.get_note_id_by_card_id(card1.id)
@@ -56,11 +57,48 @@ def test_evict_note(col: Collection, td: Data, item_id_cache: ItemIdCache):
     card2: Card = td.create_card_with_files()
     item_id_cache.get_note_id_by_card_id(card2.id)
     assert item_id_cache.get_cache_size() == 2
-    assert item_id_cache.as_dict_list() == [{card1.id: card1.nid, card2.id: card2.nid}]
+    assert item_id_cache.as_dict_list() == [{card1.id: card1.nid, card2.id: card2.nid},
+                                            {card1.nid: [card1.id], card2.nid: [card2.id]}]
 
     item_id_cache.evict_note(card1.nid)
     wait_until(lambda: item_id_cache.get_cache_size() == 1)
-    wait_until(lambda: item_id_cache.as_dict_list() == [{card2.id: card2.nid}])
+    wait_until(lambda: item_id_cache.as_dict_list() == [{card2.id: card2.nid}, {card2.nid: [card2.id]}])
+
+
+def test_get_cached_card_ids_by_note_id(col: Collection, td: Data, item_id_cache: ItemIdCache):
+    note: Note = col.new_note(col.models.by_name("Basic (and reversed card)"))
+    note[DefaultFields.front_field_name] = DefaultFields.front_field_content_2
+    note[DefaultFields.back_field_name] = DefaultFields.back_field_content_2
+    col.add_note(note, td.deck_id)
+    card1: Card = td.create_card_with_files()
+    assert item_id_cache.get_cached_card_ids_by_note_id(note.id) == []
+    item_id_cache.initialize_cache()
+    assert sorted(item_id_cache.get_cached_card_ids_by_note_id(note.id)) == sorted(note.card_ids())
+    assert item_id_cache.get_cached_card_ids_by_note_id(card1.nid) == [card1.id]
+    item_id_cache.evict_note(note.id)
+    assert item_id_cache.get_cached_card_ids_by_note_id(note.id) == []
+    assert item_id_cache.get_cache_size() == 1
+
+
+def test_get_note_ids_by_card_ids(col: Collection, td: Data, item_id_cache: ItemIdCache):
+    card1: Card = td.create_card_with_files()
+    card2: Card = td.create_card_without_files()
+    card3: Card = td.create_card_with_files()
+    item_id_cache.get_note_id_by_card_id(card2.id)
+    assert item_id_cache.get_cache_size() == 1
+    note_ids: Sequence[NoteId] = item_id_cache.get_note_ids_by_card_ids([card3.id, card1.id, card2.id, card3.id])
+    assert note_ids == [card3.nid, card1.nid, card2.nid]
+    assert item_id_cache.get_cache_size() == 3
+    assert item_id_cache.get_cached_card_ids_by_note_id(card1.nid) == [card1.id]
+
+
+def test_map_card_ids_to_note_ids(td: Data, item_id_cache: ItemIdCache):
+    card1: Card = td.create_card_with_files()
+    card2: Card = td.create_card_without_files()
+    item_id_cache.get_note_id_by_card_id(card2.id)
+    note_ids: list[NoteId] = item_id_cache.map_card_ids_to_note_ids([card2.id, card1.id, card2.id])
+    assert note_ids == [card2.nid, card1.nid, card2.nid]
+    assert item_id_cache.get_cache_size() == 2
 
 
 def test_get_note_id_by_card_id(td: Data, col: Collection, item_id_cache: ItemIdCache):
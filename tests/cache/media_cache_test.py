@@ -1,6 +1,10 @@
+import os
+import time
 import timeit
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+from anki.collection import Collection
 from anki.notes import Note
 
 from note_size.cache.media_cache import MediaCache
@@ -15,6 +19,38 @@ def test_get_file_size(td: Data, media_cache: MediaCache):
     assert act_file_size_1 == exp_file_size_1
 
 
+def test_get_file_sizes(td: Data, media_cache: MediaCache):
+    td.create_note_with_files()
+    media_files: set[MediaFile] = {MediaFiles.picture, MediaFiles.sound, MediaFiles.video}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        file_sizes: dict[MediaFile, FileSize] = media_cache.get_file_sizes(media_files, executor)
+    assert file_sizes == {MediaFiles.picture: FileSize(SizeBytes(len(FileContents.picture))),
+                          MediaFiles.sound: FileSize(SizeBytes(len(FileContents.sound))),
+                          MediaFiles.video: FileSize(SizeBytes(0), exists=False)}
+    assert media_cache.get_cache_size() == 3
+
+
+def test_take_snapshot(td: Data, media_cache: MediaCache):
+    td.create_note_with_files()
+    assert not media_cache.is_snapshot_taken()
+    media_cache.take_snapshot()
+    assert media_cache.is_snapshot_taken()
+    assert media_cache.get_cache_size() == 3
+    assert media_cache.get_file_size(MediaFiles.picture, use_cache=True) == FileSize(SizeBytes(7))
+    assert media_cache.get_file_size(MediaFiles.video, use_cache=True) == FileSize(SizeBytes(0), exists=False)
+    td.write_file(MediaFiles.video, "new video")
+    assert media_cache.get_file_size(MediaFiles.video, use_cache=True) == FileSize(SizeBytes(0), exists=False)
+    assert media_cache.get_file_size(MediaFiles.video, use_cache=False) == FileSize(SizeBytes(9))
+    td.write_file(MediaFiles.image, "new image")
+    assert media_cache.get_file_size(MediaFiles.image, use_cache=True) == FileSize(SizeBytes(9))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        td.write_file(MediaFiles.movie, "new movie")
+        assert media_cache.get_file_sizes({MediaFiles.picture, MediaFiles.movie}, executor) == {
+            MediaFiles.picture: FileSize(SizeBytes(7)), MediaFiles.movie: FileSize(SizeBytes(9))}
+    media_cache.invalidate_cache()
+    assert not media_cache.is_snapshot_taken()
+
+
 def test_get_missing_files_number(td: Data, media_cache: MediaCache):
     media_files: set[MediaFile] = {MediaFiles.picture, MediaFiles.sound, MediaFiles.animation, MediaFiles.video}
     assert media_cache.get_missing_files_number(media_files, use_cache=False) == (FilesNumber(0), FilesNumber(4))
@@ -64,3 +100,17 @@ def test_get_updated_files(media_cache: MediaCache, td: Data):
     assert media_cache.get_file_size(MediaFiles.animation, use_cache=True) == exp_size_2
     updated_files: set[MediaFile] = media_cache.get_updated_files()
     assert updated_files == {MediaFiles.sound, MediaFiles.animation}
+
+
+def test_get_updated_files_by_index(media_cache: MediaCache, td: Data, col: Collection):
+    td.create_note_with_files()
+    media_dir: str = col.media.dir()
+    old_mtime_ns: int = time.time_ns() - 10_000_000_000
+    os.utime(media_dir, ns=(old_mtime_ns, old_mtime_ns))
+    media_cache.take_snapshot()
+    td.write_file(MediaFiles.picture, "new content")
+    assert media_cache.get_updated_files() == set()
+    os.remove(os.path.join(media_dir, MediaFiles.sound))
+    td.write_file(MediaFiles.video, "video")
+    assert media_cache.get_updated_files() == {MediaFiles.picture, MediaFiles.sound, MediaFiles.video}
+    assert media_cache.get_updated_files() == set()
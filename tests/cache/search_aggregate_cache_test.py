@@ -0,0 +1,70 @@
+from anki.notes import Note
+
+from note_size.cache.search_aggregate_cache import SearchAggregateCache, SearchAggregate
+from note_size.common.types import SizeType, SizeBytes, MediaFile, FileContent, FileSize
+from tests.data import Data, MediaFiles
+
+
+def test_get_aggregate(td: Data, search_aggregate_cache: SearchAggregateCache):
+    note1: Note = td.create_note_with_files()
+    note2: Note = td.create_note_without_files()
+    aggregate: SearchAggregate = search_aggregate_cache.get_aggregate([note1.id, note2.id])
+    assert aggregate.notes_number == 2
+    assert aggregate.get_total_size() == SizeBytes(213)
+    assert aggregate.get_size(SizeType.TEXTS) == SizeBytes(192)
+    assert aggregate.get_size(SizeType.FILES) == SizeBytes(21)
+    assert aggregate.files_number == 3
+    assert aggregate.missing_files_number == 0
+    assert aggregate.get_existing_files_number() == 3
+    assert search_aggregate_cache.get_aggregate([note2.id, note1.id, note2.id]) is aggregate
+    assert search_aggregate_cache.get_cache_size() == 1
+
+
+def test_get_aggregate_with_file_sizes(td: Data, search_aggregate_cache: SearchAggregateCache):
+    note1: Note = td.create_note_with_files()
+    note2: Note = td.create_note_without_files()
+    aggregate: SearchAggregate = search_aggregate_cache.get_aggregate([note1.id, note2.id])
+    search_aggregate_cache.get_aggregate([note2.id])
+    aggregate_with_file_sizes: tuple[SearchAggregate, dict[MediaFile, FileSize]] = \
+        search_aggregate_cache.get_aggregate_with_file_sizes([note1.id, note2.id])
+    assert aggregate_with_file_sizes == (aggregate, {MediaFiles.picture: FileSize(SizeBytes(7)),
+                                                     MediaFiles.sound: FileSize(SizeBytes(5)),
+                                                     MediaFiles.animation: FileSize(SizeBytes(9))})
+    assert search_aggregate_cache.get_aggregate_with_file_sizes([note2.id]) == (
+        search_aggregate_cache.get_aggregate([note2.id]), {})
+    assert search_aggregate_cache.get_cache_size() == 2
+
+
+def test_missing_files(td: Data, search_aggregate_cache: SearchAggregateCache):
+    note: Note = td.create_note_with_given_files({"Front": {MediaFile("present.png"): FileContent("content")}})
+    td.append_front_field(note, '<img src="absent.png">')
+    aggregate: SearchAggregate = search_aggregate_cache.get_aggregate([note.id])
+    assert aggregate.files_number == 2
+    assert aggregate.missing_files_number == 1
+    assert aggregate.get_size(SizeType.FILES) == SizeBytes(7)
+
+
+def test_evict_note(td: Data, search_aggregate_cache: SearchAggregateCache):
+    note1: Note = td.create_note_with_files()
+    note2: Note = td.create_note_without_files()
+    aggregate_1: SearchAggregate = search_aggregate_cache.get_aggregate([note1.id])
+    search_aggregate_cache.get_aggregate([note2.id])
+    assert search_aggregate_cache.get_cache_size() == 2
+    search_aggregate_cache.evict_note(note2.id)
+    assert search_aggregate_cache.get_cache_size() == 0
+    assert search_aggregate_cache.get_aggregate([note1.id]) is not aggregate_1
+    search_aggregate_cache.invalidate()
+    assert search_aggregate_cache.get_cache_size() == 0
+
+
+def test_evict_least_recently_used(td: Data, search_aggregate_cache: SearchAggregateCache):
+    notes: list[Note] = [td.create_note_without_files() for _ in range(33)]
+    aggregate_0: SearchAggregate = search_aggregate_cache.get_aggregate([notes[0].id])
+    aggregate_1: SearchAggregate = search_aggregate_cache.get_aggregate([notes[1].id])
+    for note in notes[2:32]:
+        search_aggregate_cache.get_aggregate([note.id])
+    assert search_aggregate_cache.get_aggregate([notes[0].id]) is aggregate_0
+    search_aggregate_cache.get_aggregate([notes[32].id])
+    assert search_aggregate_cache.get_cache_size() == 32
+    assert search_aggregate_cache.get_aggregate([notes[0].id]) is aggregate_0
+    assert search_aggregate_cache.get_aggregate([notes[1].id]) is not aggregate_1
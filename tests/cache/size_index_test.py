@@ -0,0 +1,52 @@
+from anki.collection import Collection
+from anki.notes import Note, NoteId
+
+from note_size.cache.size_index import SizeIndex
+from note_size.calculator.size_calculator import SizeCalculator
+from note_size.common.types import SizeType, SizeBytes
+from tests.data import Data
+
+
+def test_find_note_ids(size_index: SizeIndex, td: Data):
+    note_small: Note = td.create_note_with_given_fields("small")
+    note_files: Note = td.create_note_with_files()
+    note_medium: Note = td.create_note_with_given_fields("medium")
+    assert __find(size_index, SizeType.TOTAL, ">", 18) == ([note_files.id], [note_small.id, note_medium.id])
+    assert __find(size_index, SizeType.TOTAL, ">=", 18) == ([note_medium.id, note_files.id], [note_small.id])
+    assert __find(size_index, SizeType.TOTAL, "<", 18) == ([note_small.id], [note_medium.id, note_files.id])
+    assert __find(size_index, SizeType.TOTAL, "<=", 18) == ([note_small.id, note_medium.id], [note_files.id])
+    assert __find(size_index, SizeType.TOTAL, "=", 18) == ([note_medium.id], [note_small.id, note_files.id])
+    assert __find(size_index, SizeType.TEXTS, ">", 100) == ([note_files.id], [note_small.id, note_medium.id])
+    assert __find(size_index, SizeType.FILES, "=", 0) == ([note_small.id, note_medium.id], [note_files.id])
+    assert __find(size_index, SizeType.FILES, ">", 1000) == ([], [note_small.id, note_medium.id, note_files.id])
+
+
+def test_evict_note(size_index: SizeIndex, td: Data):
+    note_small: Note = td.create_note_with_given_fields("small")
+    assert __find(size_index, SizeType.TOTAL, ">", 0) == ([note_small.id], [])
+    note_medium: Note = td.create_note_with_given_fields("medium")
+    assert __find(size_index, SizeType.TOTAL, ">", 0) == ([note_small.id], [])
+    size_index.evict_note(note_medium.id)
+    assert __find(size_index, SizeType.TOTAL, ">", 0) == ([note_small.id, note_medium.id], [])
+
+
+def test_evict_updated_and_removed_notes(size_index: SizeIndex, size_calculator: SizeCalculator, td: Data,
+                                         col: Collection):
+    note_small: Note = td.create_note_with_given_fields("small")
+    note_medium: Note = td.create_note_with_given_fields("medium")
+    note_files: Note = td.create_note_with_files()
+    assert __find(size_index, SizeType.TOTAL, ">", 0) == ([note_small.id, note_medium.id, note_files.id], [])
+    Data.update_front_field(note_small, "small content is the largest now" * 10)
+    size_calculator.evict_note(note_small.id)
+    size_index.evict_note(note_small.id)
+    col.remove_notes([note_medium.id])
+    size_calculator.evict_note(note_medium.id)
+    size_index.evict_note(note_medium.id)
+    assert __find(size_index, SizeType.TOTAL, ">", 0) == ([note_files.id, note_small.id], [])
+    assert __find(size_index, SizeType.TOTAL, "<", 200) == ([note_files.id], [note_small.id])
+
+
+def __find(size_index: SizeIndex, size_type: SizeType, operator: str,
+           size: int) -> tuple[list[NoteId], list[NoteId]]:
+    matching_note_ids, other_note_ids = size_index.find_note_ids(size_type, operator, SizeBytes(size))
+    return matching_note_ids.tolist(), other_note_ids.tolist()
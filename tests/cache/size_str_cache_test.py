@@ -82,6 +82,34 @@ def test_evict_note(td: Data, size_str_cache: SizeStrCache):
                                               SizeType.FILES: {note2.id: {Digits.one: '0 B'}}}]
 
 
+def test_get_note_size_strs(td: Data, size_str_cache: SizeStrCache):
+    note1: Note = td.create_note_with_files()
+    note2: Note = td.create_note_without_files()
+    assert size_str_cache.get_note_size_strs([note1.id, note2.id], SizeType.TOTAL, Digits.one,
+                                             use_cache=True) == ["143 B", "70 B"]
+    assert size_str_cache.get_note_size_strs([note2.id], SizeType.FILES, Digits.one, use_cache=True) == ["0 B"]
+    assert size_str_cache.get_note_size_strs([], SizeType.TEXTS, Digits.one, use_cache=True) == []
+
+
+def test_get_notes_size_str(td: Data, size_str_cache: SizeStrCache):
+    note1: Note = td.create_note_with_files()
+    note2: Note = td.create_note_without_files()
+    assert size_str_cache.get_notes_size_str([note1.id, note2.id], SizeType.TOTAL, Digits.one,
+                                             use_cache=True) == "213 B"
+    assert size_str_cache.get_notes_size_str([note1.id], SizeType.FILES, Digits.one, use_cache=True) == "21 B"
+    assert size_str_cache.get_notes_size_str([note2.id], SizeType.TEXTS, Digits.one, use_cache=False) == "70 B"
+    assert size_str_cache.get_notes_size_str([], SizeType.TOTAL, Digits.one, use_cache=True) == "0 B"
+
+
+def test_get_generation(td: Data, size_str_cache: SizeStrCache):
+    note: Note = td.create_note_with_files()
+    generation: int = size_str_cache.get_generation()
+    size_str_cache.get_note_size_str(note.id, SizeType.TOTAL, Digits.one, use_cache=True)
+    assert size_str_cache.get_generation() == generation
+    size_str_cache.evict_note(note.id)
+    assert size_str_cache.get_generation() > generation
+
+
 def test_absent_note(size_str_cache: SizeStrCache):
     with pytest.raises(NotFoundError):
         size_str_cache.get_note_size_str(NoteId(123), SizeType.TOTAL, Digits.one, use_cache=True)
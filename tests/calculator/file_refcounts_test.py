@@ -0,0 +1,57 @@
+from note_size.calculator.file_refcounts import FileRefcounts
+from note_size.common.types import SizeBytes, MediaFile, FileSize
+
+
+def test_add_and_remove_files():
+    file_refcounts: FileRefcounts = FileRefcounts()
+    assert file_refcounts.add_files({MediaFile("a.jpg"): FileSize(SizeBytes(4)),
+                                     MediaFile("b.jpg"): FileSize(SizeBytes(2))}) == {
+               MediaFile("a.jpg"): FileSize(SizeBytes(4)), MediaFile("b.jpg"): FileSize(SizeBytes(2))}
+    assert file_refcounts.add_files({MediaFile("a.jpg"): FileSize(SizeBytes(4))}) == {}
+    assert file_refcounts.get_total_size() == SizeBytes(6)
+    assert file_refcounts.get_files_number() == 2
+    assert file_refcounts.get_refcounts() == {MediaFile("a.jpg"): 2, MediaFile("b.jpg"): 1}
+    assert file_refcounts.get_missing_files_number() == 0
+
+    file_refcounts.remove_files([MediaFile("a.jpg"), MediaFile("b.jpg"), MediaFile("absent.jpg")])
+    assert file_refcounts.get_total_size() == SizeBytes(4)
+    assert file_refcounts.get_refcounts() == {MediaFile("a.jpg"): 1}
+    assert file_refcounts.get_file_sizes() == {MediaFile("a.jpg"): FileSize(SizeBytes(4))}
+
+    file_refcounts.remove_files([MediaFile("a.jpg")])
+    assert file_refcounts.get_total_size() == SizeBytes(0)
+    assert file_refcounts.get_files_number() == 0
+
+
+def test_missing_files():
+    file_refcounts: FileRefcounts = FileRefcounts()
+    file_refcounts.add_files({MediaFile("a.jpg"): FileSize(SizeBytes(4)),
+                              MediaFile("absent.jpg"): FileSize(SizeBytes(0), exists=False)})
+    file_refcounts.add_files({MediaFile("absent.jpg"): FileSize(SizeBytes(0), exists=False)})
+    assert file_refcounts.get_missing_files_number() == 1
+    file_refcounts.remove_files([MediaFile("absent.jpg")])
+    assert file_refcounts.get_missing_files_number() == 1
+    file_refcounts.remove_files([MediaFile("absent.jpg")])
+    assert file_refcounts.get_missing_files_number() == 0
+
+
+def test_update_file_size():
+    file_refcounts: FileRefcounts = FileRefcounts()
+    file_refcounts.add_files({MediaFile("a.jpg"): FileSize(SizeBytes(4)),
+                              MediaFile("b.jpg"): FileSize(SizeBytes(0), exists=False)})
+    assert not file_refcounts.update_file_size(MediaFile("a.jpg"), FileSize(SizeBytes(4)))
+    assert not file_refcounts.update_file_size(MediaFile("absent.jpg"), FileSize(SizeBytes(8)))
+    assert file_refcounts.update_file_size(MediaFile("a.jpg"), FileSize(SizeBytes(0), exists=False))
+    assert file_refcounts.update_file_size(MediaFile("b.jpg"), FileSize(SizeBytes(6)))
+    assert file_refcounts.get_total_size() == SizeBytes(6)
+    assert file_refcounts.get_missing_files_number() == 1
+    assert file_refcounts.get_file_sizes() == {MediaFile("a.jpg"): FileSize(SizeBytes(0), exists=False),
+                                               MediaFile("b.jpg"): FileSize(SizeBytes(6))}
+
+
+def test_clear():
+    file_refcounts: FileRefcounts = FileRefcounts()
+    file_refcounts.add_files({MediaFile("a.jpg"): FileSize(SizeBytes(4))})
+    file_refcounts.clear()
+    assert file_refcounts.get_total_size() == SizeBytes(0)
+    assert file_refcounts.get_refcounts() == {}
@@ -0,0 +1,57 @@
+from anki.notes import Note
+
+from note_size.calculator.largest_items_calculator import LargestItemsCalculator
+from note_size.calculator.size_calculator import SizeCalculator
+from note_size.common.types import SizeType, SizeBytes, FileSize, MediaFile, GroupType
+from tests.data import Data, MediaFiles
+
+
+def test_get_largest_notes(td: Data, largest_items_calculator: LargestItemsCalculator):
+    note_medium: Note = td.create_note_with_given_fields("medium")
+    note_files: Note = td.create_note_with_files()
+    note_small: Note = td.create_note_with_given_fields("small")
+    assert largest_items_calculator.get_largest_notes(SizeType.TOTAL, 2) == [
+        (note_files.id, SizeBytes(143)), (note_medium.id, SizeBytes(18))]
+    assert largest_items_calculator.get_largest_notes(SizeType.TEXTS, 10) == [
+        (note_files.id, SizeBytes(122)), (note_medium.id, SizeBytes(18)), (note_small.id, SizeBytes(17))]
+    assert largest_items_calculator.get_largest_notes(SizeType.FILES, 1) == [(note_files.id, SizeBytes(21))]
+    assert largest_items_calculator.get_largest_notes(SizeType.TOTAL, 0) == []
+
+
+def test_get_largest_notes_of_given_notes(td: Data, largest_items_calculator: LargestItemsCalculator):
+    note_medium: Note = td.create_note_with_given_fields("medium")
+    td.create_note_with_files()
+    note_small: Note = td.create_note_with_given_fields("small")
+    assert largest_items_calculator.get_largest_notes(SizeType.TOTAL, 5, [note_small.id, note_medium.id]) == [
+        (note_medium.id, SizeBytes(18)), (note_small.id, SizeBytes(17))]
+    assert largest_items_calculator.get_largest_notes(SizeType.TOTAL, 5, []) == []
+
+
+def test_get_largest_notes_from_cache(td: Data, largest_items_calculator: LargestItemsCalculator,
+                                      size_calculator: SizeCalculator):
+    note_medium: Note = td.create_note_with_given_fields("medium")
+    note_files: Note = td.create_note_with_files()
+    size_calculator.get_note_sizes([note_medium.id, note_files.id], SizeType.TOTAL, use_cache=True)
+    assert size_calculator.get_cached_note_sizes_number(SizeType.TOTAL) == 2
+    assert largest_items_calculator.get_largest_notes(SizeType.TOTAL, 5) == [
+        (note_files.id, SizeBytes(143)), (note_medium.id, SizeBytes(18))]
+
+
+def test_get_largest_files(td: Data, largest_items_calculator: LargestItemsCalculator):
+    note: Note = td.create_note_with_files()
+    td.create_note_with_given_files({"Front": {MediaFile("large.png"): "large file content"}})
+    assert largest_items_calculator.get_largest_files(2) == [
+        (MediaFile("large.png"), FileSize(SizeBytes(18))), (MediaFiles.animation, FileSize(SizeBytes(9)))]
+    assert largest_items_calculator.get_largest_files(5, [note.id]) == [
+        (MediaFiles.animation, FileSize(SizeBytes(9))), (MediaFiles.picture, FileSize(SizeBytes(7))),
+        (MediaFiles.sound, FileSize(SizeBytes(5)))]
+
+
+def test_get_largest_groups(td: Data, largest_items_calculator: LargestItemsCalculator):
+    note: Note = td.create_note_with_files()
+    td.create_note_with_given_fields("small")
+    assert [(group_key, group_size.get_total_size()) for group_key, group_size
+            in largest_items_calculator.get_largest_groups(GroupType.DECK, 5)] == [(td.deck_id, SizeBytes(160))]
+    assert [group_key for group_key, _ in largest_items_calculator.get_largest_groups(GroupType.NOTE_TYPE, 5)] == [
+        note.mid]
+    assert largest_items_calculator.get_largest_groups(GroupType.TAG, 5) == []
@@ -0,0 +1,64 @@
+from anki.notes import Note
+
+from note_size.calculator.note_fields_size import NoteFieldsSize
+from note_size.calculator.size_calculator import SizeCalculator
+from note_size.common.types import SizeBytes, SizeType, MediaFile
+from tests.data import Data, DefaultFields, MediaFiles, FileContents
+
+
+def test_update(td: Data, note_fields_size: NoteFieldsSize):
+    note: Note = td.create_note_with_files()
+    note_fields_size.update(note)
+    assert __get_sizes(note_fields_size) == [SizeBytes(143), SizeBytes(122), SizeBytes(21)]
+
+
+def test_update_changed_field(td: Data, note_fields_size: NoteFieldsSize, size_calculator: SizeCalculator):
+    note: Note = td.create_note_with_files()
+    note_fields_size.update(note)
+    note[DefaultFields.front_field_name] = "No files"
+    note_fields_size.update(note)
+    assert __get_sizes(note_fields_size) == [SizeBytes(87), SizeBytes(71), SizeBytes(16)]
+    assert __get_sizes(note_fields_size) == [size_calculator.calculate_note_size(note, size_type, use_cache=False)
+                                             for size_type in SizeType]
+    note[DefaultFields.back_field_name] = ""
+    note_fields_size.update(note)
+    assert __get_sizes(note_fields_size) == [SizeBytes(8), SizeBytes(8), SizeBytes(0)]
+
+
+def test_update_added_file(td: Data, note_fields_size: NoteFieldsSize):
+    note: Note = td.create_note_with_given_fields("Front", "Back", new_note=True)
+    note_fields_size.update(note)
+    assert __get_sizes(note_fields_size) == [SizeBytes(9), SizeBytes(9), SizeBytes(0)]
+    media_file: MediaFile = MediaFile("pasted.png")
+    td.write_file(media_file, "pasted image")
+    note[DefaultFields.front_field_name] = f'<img src="{media_file}">'
+    note_fields_size.update(note)
+    assert __get_sizes(note_fields_size) == [SizeBytes(38), SizeBytes(26), SizeBytes(12)]
+
+
+def test_update_other_note(td: Data, note_fields_size: NoteFieldsSize):
+    note_fields_size.update(td.create_note_with_files())
+    note: Note = td.create_note_with_given_fields("Front", "Back")
+    note_fields_size.update(note)
+    assert __get_sizes(note_fields_size) == [SizeBytes(9), SizeBytes(9), SizeBytes(0)]
+
+
+def test_update_file_sizes(td: Data, note_fields_size: NoteFieldsSize):
+    note: Note = td.create_note_with_files()
+    note_fields_size.update(note)
+    assert not note_fields_size.update_file_sizes(note.id)
+    td.write_file(MediaFiles.picture, f"{FileContents.picture} replaced")
+    assert not note_fields_size.update_file_sizes(td.create_note_without_files().id)
+    assert note_fields_size.update_file_sizes(note.id)
+    assert __get_sizes(note_fields_size) == [SizeBytes(152), SizeBytes(122), SizeBytes(30)]
+    assert not note_fields_size.update_file_sizes(note.id)
+
+
+def test_clear(td: Data, note_fields_size: NoteFieldsSize):
+    note_fields_size.update(td.create_note_with_files())
+    note_fields_size.clear()
+    assert __get_sizes(note_fields_size) == [SizeBytes(0), SizeBytes(0), SizeBytes(0)]
+
+
+def __get_sizes(note_fields_size: NoteFieldsSize) -> list[SizeBytes]:
+    return [note_fields_size.get_size(size_type) for size_type in SizeType]
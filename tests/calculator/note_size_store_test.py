@@ -0,0 +1,117 @@
+import timeit
+import tracemalloc
+
+import pytest
+from anki.notes import NoteId
+
+from note_size.calculator.note_size_store import NoteSizeStore
+from note_size.common.types import SizeBytes, SizeType
+
+
+def test_set_size():
+    store: NoteSizeStore = NoteSizeStore()
+    store.set_size(NoteId(2), SizeType.TEXTS, SizeBytes(10))
+    assert store.get_size(NoteId(2), SizeType.TEXTS) == SizeBytes(10)
+    assert store.get_size(NoteId(2), SizeType.FILES) is None
+    assert store.get_size(NoteId(2), SizeType.TOTAL) is None
+    store.set_size(NoteId(2), SizeType.FILES, SizeBytes(5))
+    assert store.get_size(NoteId(2), SizeType.TOTAL) == SizeBytes(15)
+    assert [store.get_notes_number(size_type) for size_type in SizeType] == [1, 1, 1]
+    with pytest.raises(ValueError):
+        store.set_size(NoteId(2), SizeType.TOTAL, SizeBytes(15))
+
+
+def test_get_sizes():
+    store: NoteSizeStore = NoteSizeStore()
+    store.set_sizes(NoteId(3), SizeBytes(30), SizeBytes(3))
+    store.set_sizes(NoteId(1), SizeBytes(10), SizeBytes(1))
+    store.set_size(NoteId(2), SizeType.TEXTS, SizeBytes(20))
+    note_ids: list[NoteId] = [NoteId(3), NoteId(4), NoteId(1), NoteId(2)]
+    assert list(store.get_sizes(note_ids, SizeType.TOTAL)) == [33, -1, 11, -1]
+    assert list(store.get_sizes(note_ids, SizeType.TEXTS)) == [30, -1, 10, 20]
+    assert list(store.get_sizes(note_ids, SizeType.FILES)) == [3, -1, 1, -1]
+    assert list(store.get_sizes([NoteId(1)], SizeType.FILES)) == [1]
+
+
+def test_remove():
+    store: NoteSizeStore = NoteSizeStore()
+    store.set_sizes(NoteId(1), SizeBytes(10), SizeBytes(1))
+    store.set_sizes(NoteId(2), SizeBytes(20), SizeBytes(2))
+    store.remove(NoteId(1))
+    store.remove(NoteId(5))
+    assert store.get_size(NoteId(1), SizeType.TEXTS) is None
+    assert store.as_dict(SizeType.TOTAL) == {NoteId(2): SizeBytes(22)}
+    assert [store.get_notes_number(size_type) for size_type in SizeType] == [1, 1, 1]
+    store.set_size(NoteId(1), SizeType.FILES, SizeBytes(7))
+    assert store.as_dict(SizeType.FILES) == {NoteId(1): SizeBytes(7), NoteId(2): SizeBytes(2)}
+
+
+def test_get_largest():
+    store: NoteSizeStore = NoteSizeStore()
+    for note_id in [5, 1, 4, 2, 3]:
+        store.set_sizes(NoteId(note_id), SizeBytes(note_id * 10), SizeBytes(100 - note_id))
+    store.set_size(NoteId(6), SizeType.TEXTS, SizeBytes(1000))
+    assert store.get_largest(SizeType.TEXTS, 2) == [(NoteId(6), SizeBytes(1000)), (NoteId(5), SizeBytes(50))]
+    assert store.get_largest(SizeType.FILES, 1) == [(NoteId(1), SizeBytes(99))]
+    assert store.get_largest(SizeType.TOTAL, 10) == [(NoteId(5), SizeBytes(145)), (NoteId(4), SizeBytes(136)),
+                                                     (NoteId(3), SizeBytes(127)), (NoteId(2), SizeBytes(118)),
+                                                     (NoteId(1), SizeBytes(109))]
+
+
+def test_load_and_clear():
+    store: NoteSizeStore = NoteSizeStore()
+    store.load({NoteId(2): SizeBytes(20), NoteId(1): SizeBytes(10)}, {NoteId(2): SizeBytes(2)})
+    assert store.as_dict(SizeType.TOTAL) == {NoteId(2): SizeBytes(22)}
+    assert store.as_dict(SizeType.TEXTS) == {NoteId(1): SizeBytes(10), NoteId(2): SizeBytes(20)}
+    assert [store.get_notes_number(size_type) for size_type in SizeType] == [1, 2, 1]
+    store.clear()
+    assert [store.get_notes_number(size_type) for size_type in SizeType] == [0, 0, 0]
+    assert store.as_dict(SizeType.TEXTS) == {}
+
+
+def test_many_notes_in_random_order():
+    store: NoteSizeStore = NoteSizeStore()
+    note_ids: list[NoteId] = [NoteId((note_id * 7919) % 5003) for note_id in range(1, 5003)]
+    for note_id in note_ids:
+        store.set_sizes(note_id, SizeBytes(note_id), SizeBytes(1))
+    for note_id in note_ids[::3]:
+        store.remove(note_id)
+    expected: dict[NoteId, SizeBytes] = {note_id: SizeBytes(note_id + 1) for note_id in note_ids
+                                         if note_id not in set(note_ids[::3])}
+    assert store.as_dict(SizeType.TOTAL) == expected
+    assert list(store.get_sizes(note_ids[:10], SizeType.TOTAL)) == [expected.get(note_id, -1)
+                                                                    for note_id in note_ids[:10]]
+
+
+@pytest.mark.performance
+def test_memory():
+    note_ids: list[NoteId] = [NoteId(1_600_000_000_000 + note_id * 1000) for note_id in range(100_000)]
+    tracemalloc.start()
+    size_dicts: dict[SizeType, dict[NoteId, SizeBytes]] = {size_type: {} for size_type in SizeType}
+    for note_id in note_ids:
+        size_dicts[SizeType.TEXTS][note_id] = SizeBytes(note_id % 100_000 + 1000)
+        size_dicts[SizeType.FILES][note_id] = SizeBytes(note_id % 1_000_000 + 1000)
+        size_dicts[SizeType.TOTAL][note_id] = SizeBytes(size_dicts[SizeType.TEXTS][note_id] +
+                                                        size_dicts[SizeType.FILES][note_id])
+    dicts_memory: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del size_dicts
+    tracemalloc.start()
+    store: NoteSizeStore = NoteSizeStore()
+    for note_id in note_ids:
+        store.set_sizes(note_id, SizeBytes(note_id % 100_000 + 1000), SizeBytes(note_id % 1_000_000 + 1000))
+    store_memory: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert dicts_memory / store_memory >= 5
+
+
+@pytest.mark.performance
+def test_get_largest_performance():
+    store: NoteSizeStore = NoteSizeStore()
+    for index in range(1_000_000):
+        note_id: NoteId = NoteId(1_600_000_000_000 + index * 1000)
+        store.set_sizes(note_id, SizeBytes(note_id % 100_000 + 1000), SizeBytes(0 if index % 3 else index))
+    for size_type in SizeType:
+        assert len(store.get_largest(size_type, 100)) == 100
+        duration_sec: float = min(timeit.repeat(lambda: store.get_largest(size_type, 100), number=1, repeat=3))
+        assert duration_sec < 0.1
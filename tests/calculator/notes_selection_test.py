@@ -0,0 +1,70 @@
+from anki.collection import Collection
+from anki.notes import Note, NoteId
+
+from note_size.calculator.notes_selection import NotesSelection
+from note_size.calculator.size_calculator import SizeCalculator
+from note_size.common.types import SizeType, SizeBytes, MediaFile, FileContent, FileSize
+from tests.data import Data, MediaFiles, FileContents
+
+
+def test_set_note_ids(td: Data, notes_selection: NotesSelection, size_calculator: SizeCalculator):
+    note_1: Note = td.create_note_with_files()
+    note_2: Note = __create_note_sharing_picture(td)
+    note_3: Note = td.create_note_with_given_fields("small")
+    for note_ids in [[note_1.id], [note_1.id, note_2.id], [note_2.id, note_3.id], [], [note_3.id, note_1.id]]:
+        notes_selection.set_note_ids(note_ids)
+        for size_type in SizeType:
+            assert notes_selection.get_size(size_type) == size_calculator.get_notes_size(
+                note_ids, size_type, use_cache=True)
+        assert notes_selection.get_notes_number() == len(note_ids)
+
+
+def test_add_and_remove_notes(td: Data, notes_selection: NotesSelection):
+    note_1: Note = td.create_note_with_files()
+    note_2: Note = __create_note_sharing_picture(td)
+    notes_selection.add_notes([note_1.id, note_2.id, note_1.id])
+    assert notes_selection.get_size(SizeType.FILES) == SizeBytes(39)
+    assert notes_selection.get_files_number() == 4
+    notes_selection.remove_notes([note_1.id, NoteId(123)])
+    assert notes_selection.get_size(SizeType.FILES) == SizeBytes(25)
+    assert notes_selection.get_files_number() == 2
+    notes_selection.clear()
+    assert notes_selection.get_size(SizeType.TOTAL) == SizeBytes(0)
+    assert notes_selection.get_notes_number() == 0
+
+
+def test_report_added_files(td: Data, notes_selection: NotesSelection, size_calculator: SizeCalculator):
+    note_1: Note = td.create_note_with_files()
+    note_2: Note = __create_note_sharing_picture(td)
+    note_1_file_sizes: dict[MediaFile, FileSize] = size_calculator.get_note_file_sizes(note_1.id, use_cache=True)
+    note_2_file_sizes: dict[MediaFile, FileSize] = size_calculator.get_note_file_sizes(note_2.id, use_cache=True)
+    added_file_sizes: list[dict[MediaFile, FileSize]] = []
+    notes_selection.set_note_ids([note_1.id], added_file_sizes.append)
+    assert added_file_sizes == [note_1_file_sizes]
+    added_file_sizes.clear()
+    notes_selection.set_note_ids([note_1.id, note_2.id], added_file_sizes.append)
+    assert added_file_sizes == [note_1_file_sizes,
+                                {MediaFile("large.png"): note_2_file_sizes[MediaFile("large.png")]}]
+
+
+def test_evict_note(col: Collection, td: Data, notes_selection: NotesSelection, size_calculator: SizeCalculator):
+    note_1: Note = td.create_note_with_files()
+    note_2: Note = __create_note_sharing_picture(td)
+    notes_selection.set_note_ids([note_1.id, note_2.id])
+    assert notes_selection.get_size(SizeType.FILES) == SizeBytes(39)
+
+    Data.replace_in_front_field(note_2, f'<img src="{MediaFile("large.png")}">', '')
+    size_calculator.evict_note(note_2.id)
+    notes_selection.evict_note(note_2.id)
+    assert notes_selection.get_size(SizeType.FILES) == SizeBytes(21)
+
+    col.remove_notes([note_1.id])
+    size_calculator.evict_note(note_1.id)
+    notes_selection.evict_note(note_1.id)
+    assert notes_selection.get_size(SizeType.FILES) == SizeBytes(7)
+    assert notes_selection.get_notes_number() == 1
+
+
+def __create_note_sharing_picture(td: Data) -> Note:
+    return td.create_note_with_given_files({"Front": {MediaFiles.picture: FileContents.picture,
+                                                      MediaFile("large.png"): FileContent("large file content")}})
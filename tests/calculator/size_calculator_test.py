@@ -146,6 +146,8 @@ def test_evict_note(size_calculator: SizeCalculator, td: Data):
                                                SizeType.TEXTS: {},
                                                SizeType.FILES: {}},
                                               {},
+                                              {},
+                                              {},
                                               {}]
     note1: Note = td.create_note_with_files()
     note2: Note = td.create_note_without_files()
@@ -161,13 +163,17 @@ def test_evict_note(size_calculator: SizeCalculator, td: Data):
                                               {nid1: {MediaFiles.animation, MediaFiles.sound, MediaFiles.picture}},
                                               {nid1: {MediaFiles.animation: FileSize(SizeBytes(9)),
                                                       MediaFiles.picture: FileSize(SizeBytes(7)),
-                                                      MediaFiles.sound: FileSize(SizeBytes(5))}}]
+                                                      MediaFiles.sound: FileSize(SizeBytes(5))}},
+                                              {nid1: note1.col.get_note(nid1).mod, nid2: note2.col.get_note(nid2).mod},
+                                              {}]
     size_calculator.evict_note(nid1)
     assert size_calculator.get_cache_size() == 1
     assert size_calculator.as_dict_list() == [{SizeType.TOTAL: {},
                                                SizeType.TEXTS: {nid2: 70},
                                                SizeType.FILES: {}},
                                               {},
+                                              {},
+                                              {nid2: note2.col.get_note(nid2).mod},
                                               {}]
 
 
@@ -194,6 +200,17 @@ def test_get_note_size(size_calculator: SizeCalculator, td: Data):
                                           len(FileContents.animation))
 
 
+def test_get_note_sizes(size_calculator: SizeCalculator, td: Data):
+    note1: Note = td.create_note_with_files()
+    note2: Note = td.create_note_without_files()
+    size_calculator.get_note_size(note2.id, SizeType.TOTAL, use_cache=True)
+    assert size_calculator.get_note_sizes([note1.id, note2.id, note1.id], SizeType.TOTAL, use_cache=True).tolist() == [
+        size_calculator.get_note_size(note1.id, SizeType.TOTAL, use_cache=True),
+        size_calculator.get_note_size(note2.id, SizeType.TOTAL, use_cache=True),
+        size_calculator.get_note_size(note1.id, SizeType.TOTAL, use_cache=True)]
+    assert size_calculator.get_note_sizes([], SizeType.FILES, use_cache=True).tolist() == []
+
+
 @pytest.mark.performance
 def test_get_note_size_performance(size_calculator: SizeCalculator, td: Data):
     note: Note = td.create_note_with_files()
@@ -203,6 +220,18 @@ def test_get_note_size_performance(size_calculator: SizeCalculator, td: Data):
     assert execution_time <= 1
 
 
+@pytest.mark.performance
+def test_get_largest_note_sizes_performance(size_calculator: SizeCalculator):
+    note_ids: range = range(1_600_000_000_000, 1_600_000_000_000 + 1_000_000_000, 1000)
+    texts_sizes: dict[NoteId, SizeBytes] = {NoteId(note_id): SizeBytes(note_id % 100_000) for note_id in note_ids}
+    files_sizes: dict[NoteId, SizeBytes] = {NoteId(note_id): SizeBytes(note_id % 7_919) for note_id in note_ids}
+    size_calculator.read_from_dict_list([{SizeType.TEXTS: texts_sizes, SizeType.FILES: files_sizes}, {}, {}, {}, {}])
+    for size_type in SizeType:
+        execution_time: float = min(timeit.repeat(
+            lambda: size_calculator.get_largest_note_sizes(size_type, 100), number=1, repeat=3))
+        assert execution_time < 0.1
+
+
 def test_get_note_files(size_calculator: SizeCalculator, td: Data):
     note: Note = td.create_note_with_files()
     note_id: NoteId = note.id
@@ -216,6 +245,33 @@ def test_get_note_files(size_calculator: SizeCalculator, td: Data):
     assert files_uncached == {MediaFiles.sound, MediaFiles.picture, MediaFiles.animation}
 
 
+def test_get_file_note_ids(size_calculator: SizeCalculator, td: Data):
+    note1: Note = td.create_note_with_files()
+    note2: Note = td.create_note_with_given_files({
+        DefaultFields.front_field_name: {MediaFiles.sound: FileContents.sound}})
+    assert size_calculator.get_file_note_ids(MediaFiles.sound) == set()
+    size_calculator.get_note_files(note1.id, use_cache=True)
+    size_calculator.get_note_files(note2.id, use_cache=True)
+    assert size_calculator.get_file_note_ids(MediaFiles.sound) == {note1.id, note2.id}
+    assert size_calculator.get_file_note_ids(MediaFiles.picture) == {note1.id}
+    assert size_calculator.get_file_note_ids(MediaFiles.video) == set()
+
+    Data.replace_in_front_field(note1, f'<img src="{MediaFiles.sound}">', '')
+    size_calculator.get_note_files(note1.id, use_cache=False)
+    assert size_calculator.get_file_note_ids(MediaFiles.sound) == {note2.id}
+
+    size_calculator.evict_note(note2.id)
+    assert size_calculator.get_file_note_ids(MediaFiles.sound) == set()
+    assert size_calculator.get_file_note_ids(MediaFiles.picture) == {note1.id}
+
+
+def test_get_file_note_ids_of_unsaved_note(size_calculator: SizeCalculator, td: Data):
+    note: Note = td.create_note_with_given_fields(f'<img src="{MediaFiles.picture}">', new_note=True)
+    assert size_calculator.calculate_note_files(note, use_cache=True) == {MediaFiles.picture}
+    assert size_calculator.get_file_note_ids(MediaFiles.picture) == set()
+    assert size_calculator.get_cached_files() == set()
+
+
 def test_get_note_files_absent(size_calculator: SizeCalculator, td: Data):
     with raises(NotFoundError):
         note_id: NoteId = NoteId(-1)
@@ -0,0 +1,35 @@
+import copy
+
+from note_size.config.color_levels import ColorLevels
+from note_size.config.config import Config
+from note_size.config.level_parser import LevelParser, LevelDict
+from note_size.common.types import SizeBytes, ColorName
+from tests.data import Colors
+
+
+def test_get_color(color_levels: ColorLevels):
+    assert color_levels.get_color(SizeBytes(0)) == Colors.pale_green
+    assert color_levels.get_color(SizeBytes(102_399)) == Colors.pale_green
+    assert color_levels.get_color(SizeBytes(102_400)) == Colors.orange
+    assert color_levels.get_color(SizeBytes(1_048_575)) == Colors.orange
+    assert color_levels.get_color(SizeBytes(1_048_576)) == Colors.light_coral
+    assert color_levels.get_color(SizeBytes(10_000_000_000)) == Colors.light_coral
+
+
+def test_get_color_config_not_changed(color_levels: ColorLevels, config: Config):
+    levels: list[LevelDict] = copy.deepcopy(config.get_size_button_color_levels())
+    color_levels.get_color(SizeBytes(1))
+    assert config.get_size_button_color_levels() == levels
+
+
+def test_on_config_changed(color_levels: ColorLevels, config: Config):
+    config.set_size_button_color_levels([
+        LevelDict({LevelParser.light_theme_color_key: Colors.red, LevelParser.max_size_key: "1 KB"}),
+        LevelDict({LevelParser.light_theme_color_key: Colors.green, LevelParser.max_size_key: None})])
+    assert color_levels.get_color(SizeBytes(2000)) == Colors.pale_green
+    config.fire_config_changed()
+    assert color_levels.get_color(SizeBytes(1023)) == Colors.red
+    assert color_levels.get_color(SizeBytes(2000)) == Colors.green
+    config.set_size_button_color_enabled(False)
+    config.fire_config_changed()
+    assert color_levels.get_color(SizeBytes(2000)) == ColorName("")
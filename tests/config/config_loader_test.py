@@ -26,8 +26,15 @@ def test_default_values(config_loader: ConfigLoader, module_dir: Path):
         'Browser': {'Show Found Notes Size': True,
                     'Significant Digits': 2},
         'Cache': {'Store Cache In File Enabled': True,
-                  'Warmup Enabled': True},
+                  'Warmup Enabled': True,
+                  'Warmup Chunk Size': 1000,
+                  'Warmup Workers': 4,
+                  'Store Cache In File Interval Minutes': 15,
+                  'Lazy Mode Enabled': False,
+                  'Lazy Fill Slice Millis': 100,
+                  'Lazy Fill Pause Millis': 400},
         'Deck Browser': {'Show Collection Size': True,
+                         'Show Deck Sizes': True,
                          'Significant Digits': 2},
         'Logging': {'Logger Level': 'DEBUG'},
         'Profiler': {'Enabled': False},
@@ -47,8 +54,15 @@ def test_actual_values_all(config_loader: ConfigLoader, module_dir: Path):
         'Browser': {'Show Found Notes Size': True,
                     'Significant Digits': 2},
         'Cache': {'Store Cache In File Enabled': True,
-                  'Warmup Enabled': False},
+                  'Warmup Enabled': False,
+                  'Warmup Chunk Size': 1000,
+                  'Warmup Workers': 4,
+                  'Store Cache In File Interval Minutes': 15,
+                  'Lazy Mode Enabled': False,
+                  'Lazy Fill Slice Millis': 100,
+                  'Lazy Fill Pause Millis': 400},
         'Deck Browser': {'Show Collection Size': True,
+                         'Show Deck Sizes': True,
                          'Significant Digits': 2},
         'Logging': {'Logger Level': 'DEBUG'},
         'Profiler': {'Enabled': False},
@@ -73,8 +87,15 @@ def test_actual_values_partial(module_dir: Path, config_loader: ConfigLoader):
         'Browser': {'Show Found Notes Size': True,
                     'Significant Digits': 2},
         'Cache': {'Store Cache In File Enabled': True,
-                  'Warmup Enabled': False},
+                  'Warmup Enabled': False,
+                  'Warmup Chunk Size': 1000,
+                  'Warmup Workers': 4,
+                  'Store Cache In File Interval Minutes': 15,
+                  'Lazy Mode Enabled': False,
+                  'Lazy Fill Slice Millis': 100,
+                  'Lazy Fill Pause Millis': 400},
         'Deck Browser': {'Show Collection Size': True,
+                         'Show Deck Sizes': True,
                          'Significant Digits': 2},
         'Logging': {'Logger Level': 'DEBUG'},
         'Profiler': {'Enabled': False},
@@ -110,8 +131,15 @@ def test_delete_unused_properties(module_dir: Path, config_loader: ConfigLoader)
         'Browser': {'Show Found Notes Size': True,
                     'Significant Digits': 2},
         'Cache': {'Store Cache In File Enabled': True,
-                  'Warmup Enabled': True},
+                  'Warmup Enabled': True,
+                  'Warmup Chunk Size': 1000,
+                  'Warmup Workers': 4,
+                  'Store Cache In File Interval Minutes': 15,
+                  'Lazy Mode Enabled': False,
+                  'Lazy Fill Slice Millis': 100,
+                  'Lazy Fill Pause Millis': 400},
         'Deck Browser': {'Show Collection Size': True,
+                         'Show Deck Sizes': True,
                          'Significant Digits': 2},
         'Logging': {'Logger Level': 'DEBUG'},
         'Profiler': {'Enabled': False},
@@ -148,8 +176,15 @@ def test_save_loaded_config(addon_manager: AddonManager, config_loader: ConfigLo
         'Browser': {'Show Found Notes Size': True,
                     'Significant Digits': 2},
         'Cache': {'Store Cache In File Enabled': True,
-                  'Warmup Enabled': True},
+                  'Warmup Enabled': True,
+                  'Warmup Chunk Size': 1000,
+                  'Warmup Workers': 4,
+                  'Store Cache In File Interval Minutes': 15,
+                  'Lazy Mode Enabled': False,
+                  'Lazy Fill Slice Millis': 100,
+                  'Lazy Fill Pause Millis': 400},
         'Deck Browser': {'Show Collection Size': True,
+                         'Show Deck Sizes': True,
                          'Significant Digits': 0},
         'Logging': {'Logger Level': 'DEBUG'},
         'Profiler': {'Enabled': False},
@@ -167,8 +202,15 @@ def test_save_loaded_config(addon_manager: AddonManager, config_loader: ConfigLo
         'Browser': {'Show Found Notes Size': True,
                     'Significant Digits': 2},
         'Cache': {'Store Cache In File Enabled': True,
-                  'Warmup Enabled': True},
+                  'Warmup Enabled': True,
+                  'Warmup Chunk Size': 1000,
+                  'Warmup Workers': 4,
+                  'Store Cache In File Interval Minutes': 15,
+                  'Lazy Mode Enabled': False,
+                  'Lazy Fill Slice Millis': 100,
+                  'Lazy Fill Pause Millis': 400},
         'Deck Browser': {'Show Collection Size': True,
+                         'Show Deck Sizes': True,
                          'Significant Digits': 0},
         'Logging': {'Logger Level': 'DEBUG'},
         'Profiler': {'Enabled': False},
@@ -185,8 +227,15 @@ def test_save_loaded_config(addon_manager: AddonManager, config_loader: ConfigLo
         'Browser': {'Show Found Notes Size': True,
                     'Significant Digits': 2},
         'Cache': {'Store Cache In File Enabled': True,
-                  'Warmup Enabled': True},
+                  'Warmup Enabled': True,
+                  'Warmup Chunk Size': 1000,
+                  'Warmup Workers': 4,
+                  'Store Cache In File Interval Minutes': 15,
+                  'Lazy Mode Enabled': False,
+                  'Lazy Fill Slice Millis': 100,
+                  'Lazy Fill Pause Millis': 400},
         'Deck Browser': {'Show Collection Size': True,
+                         'Show Deck Sizes': True,
                          'Significant Digits': 0},
         'Logging': {'Logger Level': 'DEBUG'},
         'Profiler': {'Enabled': False},
@@ -206,8 +255,15 @@ def test_write_config(config_loader: ConfigLoader, module_dir: Path) -> None:
         'Browser': {'Show Found Notes Size': True,
                     'Significant Digits': 2},
         'Cache': {'Store Cache In File Enabled': True,
-                  'Warmup Enabled': True},
+                  'Warmup Enabled': True,
+                  'Warmup Chunk Size': 1000,
+                  'Warmup Workers': 4,
+                  'Store Cache In File Interval Minutes': 15,
+                  'Lazy Mode Enabled': False,
+                  'Lazy Fill Slice Millis': 100,
+                  'Lazy Fill Pause Millis': 400},
         'Deck Browser': {'Show Collection Size': True,
+                         'Show Deck Sizes': True,
                          'Significant Digits': 2},
         'Logging': {'Logger Level': 'DEBUG'},
         'Profiler': {'Enabled': False},
@@ -237,8 +293,15 @@ def test_write_config(config_loader: ConfigLoader, module_dir: Path) -> None:
         'Browser': {'Show Found Notes Size': True,
                     'Significant Digits': 4},
         'Cache': {'Store Cache In File Enabled': True,
-                  'Warmup Enabled': False},
+                  'Warmup Enabled': False,
+                  'Warmup Chunk Size': 1000,
+                  'Warmup Workers': 4,
+                  'Store Cache In File Interval Minutes': 15,
+                  'Lazy Mode Enabled': False,
+                  'Lazy Fill Slice Millis': 100,
+                  'Lazy Fill Pause Millis': 400},
         'Deck Browser': {'Show Collection Size': False,
+                         'Show Deck Sizes': True,
                          'Significant Digits': 2},
         'Logging': {'Logger Level': 'INFO'},
         'Profiler': {'Enabled': False},
@@ -19,8 +19,15 @@ def test_setters(td: Data):
         'Browser': {'Show Found Notes Size': True,
                     'Significant Digits': 2},
         'Cache': {'Store Cache In File Enabled': True,
-                  'Warmup Enabled': True},
+                  'Warmup Enabled': True,
+                  'Warmup Chunk Size': 1000,
+                  'Warmup Workers': 4,
+                  'Store Cache In File Interval Minutes': 15,
+                  'Lazy Mode Enabled': False,
+                  'Lazy Fill Slice Millis': 100,
+                  'Lazy Fill Pause Millis': 400},
         'Deck Browser': {'Show Collection Size': True,
+                         'Show Deck Sizes': True,
                          'Significant Digits': 2},
         'Logging': {'Logger Level': 'DEBUG'},
         'Profiler': {'Enabled': False},
@@ -39,7 +46,14 @@ def test_setters(td: Data):
         LevelDict({LevelParser.light_theme_color_key: Colors.red, "Max Size": "100 GB"})]
     config.set_cache_warmup_enabled(False)
     config.set_store_cache_in_file_enabled(False)
+    config.set_cache_warmup_chunk_size(500)
+    config.set_cache_warmup_workers(2)
+    config.set_store_cache_in_file_interval_minutes(5)
+    config.set_cache_lazy_mode_enabled(True)
+    config.set_cache_lazy_fill_slice_millis(50)
+    config.set_cache_lazy_fill_pause_millis(200)
     config.set_deck_browser_show_collection_size(False)
+    config.set_deck_browser_show_deck_sizes(False)
     config.set_deck_browser_significant_digits(SignificantDigits(6))
     config.set_browser_show_found_notes_size(False)
     config.set_browser_significant_digits(SignificantDigits(4))
@@ -53,8 +67,15 @@ def test_setters(td: Data):
         'Browser': {'Show Found Notes Size': False,
                     'Significant Digits': 4},
         'Cache': {'Store Cache In File Enabled': False,
-                  'Warmup Enabled': False},
+                  'Warmup Enabled': False,
+                  'Warmup Chunk Size': 500,
+                  'Warmup Workers': 2,
+                  'Store Cache In File Interval Minutes': 5,
+                  'Lazy Mode Enabled': True,
+                  'Lazy Fill Slice Millis': 50,
+                  'Lazy Fill Pause Millis': 200},
         'Deck Browser': {'Show Collection Size': False,
+                         'Show Deck Sizes': False,
                          'Significant Digits': 6},
         'Logging': {'Logger Level': 'INFO'},
         'Profiler': {'Enabled': True},
@@ -67,6 +88,8 @@ def test_setters(td: Data):
 
     assert config.get_cache_warmup_enabled() == False
     assert config.get_store_cache_in_file_enabled() == False
+    assert config.get_cache_warmup_chunk_size() == 500
+    assert config.get_cache_warmup_workers() == 2
     assert config.get_deck_browser_show_collection_size() == False
     assert config.get_deck_browser_significant_digits() == SignificantDigits(6)
     assert config.get_browser_show_found_notes_size() == False
@@ -14,9 +14,11 @@ def test_get_all_urls(url_manager: UrlManager):
         UrlType.CONFIGURATION_BROWSER_SHOW_FOUND_NOTES_SIZE: 'https://github.com/Aleks-Ya/note-size-anki-addon/blob/main/docs/configuration.md#show-size-of-notes-found-in-browser',
         UrlType.CONFIGURATION_CACHE_WARM_UP_ENABLED: 'https://github.com/Aleks-Ya/note-size-anki-addon/blob/main/docs/configuration.md#enable-cache-warm-up',
         UrlType.CONFIGURATION_CACHE_STORE_ON_DISK: 'https://github.com/Aleks-Ya/note-size-anki-addon/blob/main/docs/configuration.md#store-cache-in-file-on-exit',
+        UrlType.CONFIGURATION_CACHE_LAZY_MODE_ENABLED: 'https://github.com/Aleks-Ya/note-size-anki-addon/blob/main/docs/configuration.md#lazy-cache-mode',
         UrlType.CONFIGURATION_LOGGING_LEVEL: 'https://github.com/Aleks-Ya/note-size-anki-addon/blob/main/docs/configuration.md#logging',
         UrlType.CONFIGURATION_EDITOR_SIZE_BUTTON_ENABLED: 'https://github.com/Aleks-Ya/note-size-anki-addon/blob/main/docs/configuration.md#enabled',
         UrlType.CONFIGURATION_DECK_BROWSER_SHOW_COLLECTION_SIZE: 'https://github.com/Aleks-Ya/note-size-anki-addon/blob/main/docs/configuration.md#show-collection-size',
+        UrlType.CONFIGURATION_DECK_BROWSER_SHOW_DECK_SIZES: 'https://github.com/Aleks-Ya/note-size-anki-addon/blob/main/docs/configuration.md#show-deck-sizes',
         UrlType.CONFIGURATION_EDITOR_SIZE_BUTTON_COLOR_LEVELS: 'https://github.com/Aleks-Ya/note-size-anki-addon/blob/main/docs/configuration.md#color---levels',
         UrlType.CONFIGURATION_EDITOR_SIZE_BUTTON_COLOR_ENABLED: 'https://github.com/Aleks-Ya/note-size-anki-addon/blob/main/docs/configuration.md#color---enabled',
         UrlType.INFO_USER_MANUAL: 'https://github.com/Aleks-Ya/note-size-anki-addon/blob/main/docs/user-manual.md',
@@ -17,6 +17,9 @@ from mock.mock import MagicMock
 from pytestqt.qtbot import QtBot
 
 from note_size.calculator.db_size_calculator import DbSizeCalculator
+from note_size.calculator.largest_items_calculator import LargestItemsCalculator
+from note_size.calculator.notes_selection import NotesSelection
+from note_size.calculator.note_fields_size import NoteFieldsSize
 from note_size.common.collection_holder import CollectionHolder
 
 utils.tr = MagicMock()
@@ -24,9 +27,12 @@ from aqt.deckbrowser import DeckBrowser
 from note_size.cache.cache_initializer import CacheInitializer
 from note_size.cache.cache_manager import CacheManager
 from note_size.cache.cache_storage import CacheStorage
+from note_size.cache.group_size_cache import GroupSizeCache
 from note_size.cache.item_id_cache import ItemIdCache
 from note_size.cache.media_cache import MediaCache
+from note_size.cache.search_aggregate_cache import SearchAggregateCache
 from note_size.cache.size_str_cache import SizeStrCache
+from note_size.cache.size_index import SizeIndex
 from note_size.calculator.size_calculator import SizeCalculator
 from note_size.calculator.size_formatter import SizeFormatter
 from note_size.calculator.updated_files_calculator import UpdatedFilesCalculator
@@ -34,6 +40,7 @@ from note_size.calculator.used_files_calculator import UsedFilesCalculator
 from note_size.config.config import Config
 from note_size.config.config_loader import ConfigLoader
 from note_size.config.level_parser import LevelParser
+from note_size.config.color_levels import ColorLevels
 from note_size.config.settings import Settings
 from note_size.config.url_manager import UrlManager
 from note_size.log.logs import Logs
@@ -49,6 +56,7 @@ from note_size.ui.deck_browser.deck_browser_updater import DeckBrowserUpdater
 from note_size.ui.details_dialog.details_dialog import DetailsDialog
 from note_size.ui.details_dialog.details_model_filler import DetailsModelFiller
 from note_size.ui.details_dialog.file_type_helper import FileTypeHelper
+from note_size.ui.largest_items_dialog.largest_items_dialog import LargestItemsDialog
 from note_size.ui.editor.button.editor_button_creator import EditorButtonCreator
 from note_size.ui.editor.button.editor_button_formatter import EditorButtonFormatter
 from note_size.ui.editor.button.editor_button_js import EditorButtonJs
@@ -59,6 +67,7 @@ from note_size.config.config_hooks import ConfigHooks
 from note_size.ui.deck_browser.deck_browser_hooks import DeckBrowserHooks
 from note_size.ui.browser.column.column_hooks import ColumnHooks
 from note_size.ui.browser.button.browser_hooks import BrowserHooks
+from note_size.ui.browser.search.size_search_hooks import SizeSearchHooks
 from note_size.ui.theme.theme_hooks import ThemeHooks
 from tests.data import Data
 
@@ -201,10 +210,14 @@ def item_id_sorter(item_id_cache: ItemIdCache, size_calculator: SizeCalculator)
 
 
 @pytest.fixture
-def editor_button_formatter(config: Config, size_calculator: SizeCalculator, size_formatter: SizeFormatter,
-                            size_str_cache: SizeStrCache, level_parser: LevelParser,
-                            theme_manager: ThemeManager) -> EditorButtonFormatter:
-    return EditorButtonFormatter(size_str_cache, size_calculator, size_formatter, level_parser, theme_manager, config)
+def note_fields_size(collection_holder: CollectionHolder, media_cache: MediaCache) -> NoteFieldsSize:
+    return NoteFieldsSize(collection_holder, media_cache)
+
+
+@pytest.fixture
+def editor_button_formatter(config: Config, note_fields_size: NoteFieldsSize, size_formatter: SizeFormatter,
+                            color_levels: ColorLevels) -> EditorButtonFormatter:
+    return EditorButtonFormatter(note_fields_size, size_formatter, color_levels, config)
 
 
 @pytest.fixture
@@ -213,14 +226,15 @@ def size_formatter() -> SizeFormatter:
 
 
 @pytest.fixture
-def deck_browser_js(config: Config, config_ui: ConfigUi) -> DeckBrowserJs:
-    return DeckBrowserJs(config, config_ui)
+def deck_browser_js(config: Config, config_ui: ConfigUi, largest_items_dialog: LargestItemsDialog) -> DeckBrowserJs:
+    return DeckBrowserJs(config, config_ui, largest_items_dialog)
 
 
 @pytest.fixture
 def deck_browser_updater(deck_browser: DeckBrowser, deck_browser_formatter: DeckBrowserFormatter,
+                         group_size_cache: GroupSizeCache, task_manager: TaskManager,
                          config: Config) -> DeckBrowserUpdater:
-    return DeckBrowserUpdater(deck_browser, deck_browser_formatter, config)
+    return DeckBrowserUpdater(deck_browser, deck_browser_formatter, group_size_cache, task_manager, config)
 
 
 @pytest.fixture
@@ -234,12 +248,14 @@ def db_size_calculator(collection_holder: CollectionHolder) -> DbSizeCalculator:
 
 
 @pytest.fixture
-def deck_browser_formatter(collection_holder: CollectionHolder, item_id_cache: ItemIdCache, media_cache: MediaCache,
-                           size_formatter: SizeFormatter, used_files_calculator: UsedFilesCalculator,
-                           db_size_calculator: DbSizeCalculator, trash: Trash, theme_manager: ThemeManager,
-                           config: Config, settings: Settings) -> DeckBrowserFormatter:
-    return DeckBrowserFormatter(collection_holder, item_id_cache, media_cache, trash, size_formatter,
-                                used_files_calculator, db_size_calculator, theme_manager, config, settings)
+def deck_browser_formatter(collection_holder: CollectionHolder, item_id_cache: ItemIdCache,
+                           size_calculator: SizeCalculator, media_cache: MediaCache, size_formatter: SizeFormatter,
+                           used_files_calculator: UsedFilesCalculator, db_size_calculator: DbSizeCalculator,
+                           group_size_cache: GroupSizeCache, trash: Trash, theme_manager: ThemeManager, config: Config,
+                           settings: Settings) -> DeckBrowserFormatter:
+    return DeckBrowserFormatter(collection_holder, item_id_cache, size_calculator, media_cache, trash, size_formatter,
+                                used_files_calculator, db_size_calculator, group_size_cache, theme_manager, config,
+                                settings)
 
 
 @pytest.fixture
@@ -273,9 +289,10 @@ def config_ui(config: Config, config_loader: ConfigLoader, logs: Logs, cache_ini
 
 
 @pytest.fixture
-def mw(profile_manager: ProfileManager, qapp: QApplication) -> AnkiQt:
+def mw(profile_manager: ProfileManager, qapp: QApplication, col: Collection) -> AnkiQt:
     mw_mock: MagicMock = MagicMock()
     mw_mock.pm = profile_manager
+    mw_mock.col = col
     mw_mock.app = qapp
     mw_mock.taskman = TaskManager(mw_mock)
     mw_mock.progress = ProgressManager(mw_mock)
@@ -312,10 +329,12 @@ def ui_model() -> UiModel:
 @pytest.fixture
 def details_dialog(qtbot: QtBot, size_calculator: SizeCalculator, size_formatter: SizeFormatter, config_ui: ConfigUi,
                    config: Config, settings: Settings, ui_model: UiModel, theme_manager: ThemeManager,
-                   file_type_helper: FileTypeHelper, details_model_filler: DetailsModelFiller) -> DetailsDialog:
+                   file_type_helper: FileTypeHelper, details_model_filler: DetailsModelFiller,
+                   largest_items_dialog: LargestItemsDialog, task_manager: TaskManager) -> DetailsDialog:
     ModelConverter.apply_config_to_model(ui_model, config)
     details_dialog: DetailsDialog = DetailsDialog(size_calculator, size_formatter, file_type_helper,
-                                                  details_model_filler, theme_manager, config_ui, config, settings)
+                                                  details_model_filler, largest_items_dialog, task_manager,
+                                                  theme_manager, config_ui, config, settings)
     theme_manager.apply_style()
     qtbot.addWidget(details_dialog)
     return details_dialog
@@ -337,9 +356,14 @@ def level_parser(size_formatter: SizeFormatter) -> LevelParser:
 
 
 @pytest.fixture
-def details_model_filler(size_calculator: SizeCalculator, size_formatter: SizeFormatter,
-                         media_cache: MediaCache, config: Config) -> DetailsModelFiller:
-    return DetailsModelFiller(size_calculator, size_formatter, media_cache, config)
+def color_levels(level_parser: LevelParser, theme_manager: ThemeManager, config: Config) -> ColorLevels:
+    return ColorLevels(level_parser, theme_manager, config)
+
+
+@pytest.fixture
+def details_model_filler(size_calculator: SizeCalculator, size_formatter: SizeFormatter, media_cache: MediaCache,
+                         search_aggregate_cache: SearchAggregateCache, config: Config) -> DetailsModelFiller:
+    return DetailsModelFiller(size_calculator, size_formatter, media_cache, search_aggregate_cache, config)
 
 
 @pytest.fixture
@@ -354,9 +378,10 @@ def editor_button_creator(editor_button_formatter: EditorButtonFormatter,
 
 
 @pytest.fixture
-def browser_button_manager(item_id_cache: ItemIdCache, size_str_cache: SizeStrCache, details_dialog: DetailsDialog,
-                           progress_manager: ProgressManager, config: Config) -> BrowserButtonManager:
-    return BrowserButtonManager(item_id_cache, size_str_cache, details_dialog, progress_manager, config)
+def browser_button_manager(item_id_cache: ItemIdCache, search_aggregate_cache: SearchAggregateCache,
+                           size_formatter: SizeFormatter, details_dialog: DetailsDialog,
+                           config: Config) -> BrowserButtonManager:
+    return BrowserButtonManager(item_id_cache, search_aggregate_cache, size_formatter, details_dialog, config)
 
 
 @pytest.fixture
@@ -367,9 +392,26 @@ def browser() -> Browser:
 @pytest.fixture
 def cache_manager(media_cache: MediaCache, item_id_cache: ItemIdCache, size_calculator: SizeCalculator,
                   size_formatter: SizeFormatter, file_type_helper: FileTypeHelper,
-                  size_str_cache: SizeStrCache, updated_files_calculator: UpdatedFilesCalculator) -> CacheManager:
+                  size_str_cache: SizeStrCache, updated_files_calculator: UpdatedFilesCalculator,
+                  size_index: SizeIndex, group_size_cache: GroupSizeCache,
+                  search_aggregate_cache: SearchAggregateCache) -> CacheManager:
     return CacheManager(media_cache, item_id_cache, size_calculator, size_formatter, file_type_helper, size_str_cache,
-                        updated_files_calculator)
+                        updated_files_calculator, size_index, group_size_cache, search_aggregate_cache)
+
+
+@pytest.fixture
+def size_index(collection_holder: CollectionHolder, size_calculator: SizeCalculator) -> SizeIndex:
+    return SizeIndex(collection_holder, size_calculator)
+
+
+@pytest.fixture
+def group_size_cache(collection_holder: CollectionHolder, size_calculator: SizeCalculator) -> GroupSizeCache:
+    return GroupSizeCache(collection_holder, size_calculator)
+
+
+@pytest.fixture
+def notes_selection(collection_holder: CollectionHolder, size_calculator: SizeCalculator) -> NotesSelection:
+    return NotesSelection(collection_holder, size_calculator)
 
 
 @pytest.fixture
@@ -377,6 +419,11 @@ def size_str_cache(size_calculator: SizeCalculator, size_formatter: SizeFormatte
     return SizeStrCache(size_calculator, size_formatter)
 
 
+@pytest.fixture
+def search_aggregate_cache(notes_selection: NotesSelection) -> SearchAggregateCache:
+    return SearchAggregateCache(notes_selection)
+
+
 @pytest.fixture
 def used_files_calculator(collection_holder: CollectionHolder, size_calculator: SizeCalculator,
                           media_cache: MediaCache) -> UsedFilesCalculator:
@@ -384,9 +431,24 @@ def used_files_calculator(collection_holder: CollectionHolder, size_calculator:
 
 
 @pytest.fixture
-def updated_files_calculator(collection_holder: CollectionHolder, size_calculator: SizeCalculator,
-                             media_cache: MediaCache) -> UpdatedFilesCalculator:
-    return UpdatedFilesCalculator(collection_holder, size_calculator, media_cache)
+def largest_items_calculator(collection_holder: CollectionHolder, size_calculator: SizeCalculator,
+                             media_cache: MediaCache, group_size_cache: GroupSizeCache) -> LargestItemsCalculator:
+    return LargestItemsCalculator(collection_holder, size_calculator, media_cache, group_size_cache)
+
+
+@pytest.fixture
+def largest_items_dialog(qtbot: QtBot, largest_items_calculator: LargestItemsCalculator,
+                         size_calculator: SizeCalculator, size_formatter: SizeFormatter,
+                         config: Config) -> LargestItemsDialog:
+    largest_items_dialog: LargestItemsDialog = LargestItemsDialog(
+        largest_items_calculator, size_calculator, size_formatter, config)
+    qtbot.addWidget(largest_items_dialog)
+    return largest_items_dialog
+
+
+@pytest.fixture
+def updated_files_calculator(size_calculator: SizeCalculator, media_cache: MediaCache) -> UpdatedFilesCalculator:
+    return UpdatedFilesCalculator(size_calculator, media_cache)
 
 
 @pytest.fixture
@@ -401,9 +463,10 @@ def url_manager() -> UrlManager:
 
 @pytest.fixture
 def editor_button_hooks(editor_button_creator: EditorButtonCreator, editor_button_js: EditorButtonJs,
-                        settings: Settings, config: Config) -> Generator[EditorButtonHooks, None, None]:
+                        note_fields_size: NoteFieldsSize, theme_manager: ThemeManager, settings: Settings,
+                        config: Config) -> Generator[EditorButtonHooks, None, None]:
     editor_button_hooks: EditorButtonHooks = EditorButtonHooks(
-        editor_button_creator, editor_button_js, settings, config)
+        editor_button_creator, editor_button_js, note_fields_size, theme_manager, settings, config)
     yield editor_button_hooks
     editor_button_hooks.remove_hooks()
 
@@ -440,6 +503,13 @@ def column_hooks(item_id_cache: ItemIdCache, size_str_cache: SizeStrCache, item_
     column_hooks.remove_hooks()
 
 
+@pytest.fixture
+def size_search_hooks(size_index: SizeIndex, item_id_cache: ItemIdCache) -> Generator[SizeSearchHooks, None, None]:
+    size_search_hooks: SizeSearchHooks = SizeSearchHooks(size_index, item_id_cache)
+    yield size_search_hooks
+    size_search_hooks.remove_hooks()
+
+
 @pytest.fixture
 def browser_hooks(browser_button_manager: BrowserButtonManager, config: Config) -> Generator[BrowserHooks, None, None]:
     browser_hooks: BrowserHooks = BrowserHooks(browser_button_manager, config)
@@ -476,6 +546,7 @@ def assert_no_hooks() -> None:
     assert gui_hooks.deck_browser_will_render_content.count() == 0
     assert gui_hooks.webview_did_receive_js_message.count() == 0
     assert gui_hooks.collection_did_load.count() == 1
+    assert gui_hooks.operation_did_execute.count() == 0
 
     from anki import hooks
     assert hooks.notes_will_be_deleted.count() == 0
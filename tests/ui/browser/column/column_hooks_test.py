@@ -6,6 +6,7 @@ from aqt import gui_hooks
 from aqt.browser import Column, ItemId, CellRow, SearchContext
 from mock.mock import MagicMock
 
+from note_size.cache.cache_manager import CacheManager
 from note_size.common.collection_holder import CollectionHolder
 from note_size.ui.browser.column.column_hooks import ColumnHooks
 from tests.conftest import assert_no_hooks
@@ -99,3 +100,29 @@ def test_sort_rows_by_column(td: Data, column_hooks: ColumnHooks, collection_hol
                             note_medium[DefaultFields.front_field_name],
                             note_small[DefaultFields.front_field_name]]
     assert act_notes == exp_notes
+
+
+def test_modify_rows_after_search(td: Data, column_hooks: ColumnHooks, cache_manager: CacheManager):
+    column_hooks.setup_hooks()
+    note_1: Note = td.create_note_with_files()
+    note_2: Note = td.create_note_with_given_fields("small")
+    browser: MagicMock = MagicMock()
+    browser._switch.isChecked.return_value = True
+    search_context: SearchContext = SearchContext("", browser, True, False, ids=[note_1.id, note_2.id])
+    gui_hooks.browser_did_search(search_context)
+    columns: Sequence[str] = ["note-size-files", "English", "note-size-total"]
+    assert __fetch_row(note_1.id, columns) == ["21 B", "init text", "143 B"]
+    assert __fetch_row(note_2.id, columns) == ["0 B", "init text", "17 B"]
+
+    Data.update_front_field(note_2, "updated")
+    cache_manager.evict_note(note_2.id)
+    assert __fetch_row(note_2.id, columns) == ["0 B", "init text", "19 B"]
+
+    columns.remove("note-size-files")
+    assert __fetch_row(note_1.id, columns) == ["init text", "143 B"]
+
+
+def __fetch_row(item_id: ItemId, columns: Sequence[str]) -> list[str]:
+    row: CellRow = CellRow.generic(len(columns), "init text")
+    gui_hooks.browser_did_fetch_row(item_id, True, row, columns)
+    return [cell.text for cell in row.cells]
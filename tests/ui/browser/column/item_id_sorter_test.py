@@ -1,5 +1,6 @@
 from typing import Sequence
 
+from anki.cards import Card
 from anki.notes import Note
 from aqt.browser import ItemId
 
@@ -17,3 +18,24 @@ def test_sort_item_ids(td: Data, item_id_sorter: ItemIdSorter):
     act_item_ids: Sequence[ItemId] = item_id_sorter.sort_item_ids(item_ids, SizeType.TOTAL, True)
     exp_item_ids: Sequence[ItemId] = [note3.id, note2.id, note1.id]
     assert act_item_ids == exp_item_ids
+
+
+def test_sort_item_ids_cards(td: Data, item_id_sorter: ItemIdSorter):
+    card1: Card = td.create_card_without_files()
+    card2: Card = td.create_card_with_files()
+    card3: Card = td.create_card_without_files()
+    td.update_front_field(card3.note(), "abc")
+    item_ids: Sequence[ItemId] = [card1.id, card2.id, card3.id]
+    act_item_ids: Sequence[ItemId] = item_id_sorter.sort_item_ids(item_ids, SizeType.TOTAL, False)
+    exp_item_ids: Sequence[ItemId] = [card2.id, card1.id, card3.id]
+    assert act_item_ids == exp_item_ids
+
+
+def test_sort_item_ids_equal_sizes(td: Data, item_id_sorter: ItemIdSorter):
+    note1: Note = td.create_note_without_files()
+    note2: Note = td.create_note_without_files()
+    note3: Note = td.create_note_with_files()
+    item_ids: Sequence[ItemId] = [note2.id, note1.id, note3.id]
+    act_item_ids: Sequence[ItemId] = item_id_sorter.sort_item_ids(item_ids, SizeType.TOTAL, True)
+    exp_item_ids: Sequence[ItemId] = [note3.id, note2.id, note1.id]
+    assert act_item_ids == exp_item_ids
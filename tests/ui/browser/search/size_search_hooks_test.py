@@ -0,0 +1,109 @@
+from typing import Sequence
+
+import pytest
+from anki.cards import Card
+from anki.collection import Collection
+from anki.notes import Note
+from aqt import gui_hooks
+from aqt.browser import SearchContext, ItemId
+from aqt.qt import QWidget
+from mock.mock import MagicMock
+from pytestqt.qtbot import QtBot
+
+from note_size.cache.size_index import SizeIndex
+from note_size.common.types import SizeType
+from note_size.ui.browser.search.size_search_hooks import SizeSearchHooks
+from tests.conftest import assert_no_hooks
+from tests.data import Data
+
+
+class _Browser(QWidget):
+    def __init__(self) -> None:
+        super().__init__()
+        self.searches: int = 0
+
+    def search(self) -> None:
+        self.searches += 1
+
+
+def test_setup_hooks(size_search_hooks: SizeSearchHooks):
+    assert_no_hooks()
+    size_search_hooks.setup_hooks()
+    assert gui_hooks.browser_will_search.count() == 1
+    assert gui_hooks.browser_did_search.count() == 1
+    size_search_hooks.remove_hooks()
+    assert_no_hooks()
+
+
+def test_search_by_size(size_search_hooks: SizeSearchHooks, size_index: SizeIndex, td: Data, col: Collection):
+    size_search_hooks.setup_hooks()
+    note_small: Note = td.create_note_with_given_fields("small")
+    note_medium: Note = td.create_note_with_given_fields("medium")
+    note_files: Note = td.create_note_with_files()
+    __build_size_index(size_index)
+    browser: MagicMock = MagicMock()
+    browser._switch.isChecked.return_value = True  # notes mode
+    assert __search(col, browser, "notesize:>18") == [note_files.id]
+    assert __search(col, browser, "notesize:>=18B") == [note_medium.id, note_files.id]
+    assert __search(col, browser, "notesize:<0.1kb") == [note_small.id, note_medium.id]
+    assert __search(col, browser, "-notesize:<18") == [note_medium.id, note_files.id]
+    assert __search(col, browser, "notesize:texts>=100B") == [note_files.id]
+    assert __search(col, browser, "notesize:files>0") == [note_files.id]
+    assert __search(col, browser, "notesize:>=18 -notesize:files>=1KB") == [note_medium.id, note_files.id]
+    assert __search(col, browser, "notesize:>1GB") == []
+    assert __search(col, browser, "small notesize:<1MB") == [note_small.id]
+
+
+def test_search_cards_by_size(size_search_hooks: SizeSearchHooks, size_index: SizeIndex, td: Data,
+                              col: Collection):
+    size_search_hooks.setup_hooks()
+    card_without_files: Card = td.create_card_without_files()
+    card_with_files: Card = td.create_card_with_files()
+    __build_size_index(size_index)
+    browser: MagicMock = MagicMock()
+    browser._switch.isChecked.return_value = False  # cards mode
+    assert __search(col, browser, "notesize:files>0") == [card_with_files.id]
+    assert __search(col, browser, "notesize:files=0") == [card_without_files.id]
+
+
+def test_search_by_size_with_or(size_search_hooks: SizeSearchHooks):
+    size_search_hooks.setup_hooks()
+    search_context: SearchContext = SearchContext("notesize:>1KB OR notesize:files=0", MagicMock())
+    with pytest.raises(ValueError, match="cannot be combined with OR"):
+        gui_hooks.browser_will_search(search_context)
+
+
+def test_build_size_index_in_background(size_search_hooks: SizeSearchHooks, size_index: SizeIndex, td: Data,
+                                        qtbot: QtBot):
+    size_search_hooks.setup_hooks()
+    td.create_note_with_files()
+    browser: _Browser = _Browser()
+    qtbot.addWidget(browser)
+    search_context: SearchContext = SearchContext("notesize:files>0", browser)
+    gui_hooks.browser_will_search(search_context)
+    assert search_context.search == "nid:0"
+    qtbot.waitUntil(lambda: browser.searches == 1)
+    assert size_index.is_built(SizeType.FILES)
+    assert not size_index.is_built(SizeType.TOTAL)
+
+
+def test_search_without_size_terms(size_search_hooks: SizeSearchHooks):
+    size_search_hooks.setup_hooks()
+    search: str = "front:notesize:>1KB"
+    search_context: SearchContext = SearchContext(search, MagicMock())
+    gui_hooks.browser_will_search(search_context)
+    assert search_context.search == search
+
+
+def __build_size_index(size_index: SizeIndex) -> None:
+    for size_type in SizeType:
+        size_index.build(size_type)
+
+
+def __search(col: Collection, browser: MagicMock, search: str) -> Sequence[ItemId]:
+    search_context: SearchContext = SearchContext(search, browser)
+    gui_hooks.browser_will_search(search_context)
+    search_context.ids = col.find_notes(search_context.search) if browser._switch.isChecked() \
+        else col.find_cards(search_context.search)
+    gui_hooks.browser_did_search(search_context)
+    return sorted(search_context.ids)
@@ -32,12 +32,19 @@ def enable_warmup_checkbox(cache_tab: CacheTab) -> CheckboxWithInfo:
 
 
 @pytest.fixture
-def store_cache_to_file_checkbox(cache_tab: CacheTab) -> CheckboxWithInfo:
+def lazy_mode_checkbox(cache_tab: CacheTab) -> CheckboxWithInfo:
     return cache_tab.findChildren(CheckboxWithInfo)[1]
 
 
-def test_default_state(enable_warmup_checkbox: CheckboxWithInfo, store_cache_to_file_checkbox: CheckboxWithInfo):
+@pytest.fixture
+def store_cache_to_file_checkbox(cache_tab: CacheTab) -> CheckboxWithInfo:
+    return cache_tab.findChildren(CheckboxWithInfo)[2]
+
+
+def test_default_state(enable_warmup_checkbox: CheckboxWithInfo, lazy_mode_checkbox: CheckboxWithInfo,
+                       store_cache_to_file_checkbox: CheckboxWithInfo):
     assert enable_warmup_checkbox.is_checked()
+    assert not lazy_mode_checkbox.is_checked()
     assert store_cache_to_file_checkbox.is_checked()
 
 
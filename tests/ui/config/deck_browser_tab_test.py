@@ -28,5 +28,11 @@ def show_collection_size_checkbox(deck_browser_tab: DeckBrowserTab) -> CheckboxW
     return deck_browser_tab.findChildren(CheckboxWithInfo)[0]
 
 
-def test_default_state(show_collection_size_checkbox: CheckboxWithInfo):
+@pytest.fixture
+def show_deck_sizes_checkbox(deck_browser_tab: DeckBrowserTab) -> CheckboxWithInfo:
+    return deck_browser_tab.findChildren(CheckboxWithInfo)[1]
+
+
+def test_default_state(show_collection_size_checkbox: CheckboxWithInfo, show_deck_sizes_checkbox: CheckboxWithInfo):
     assert show_collection_size_checkbox.is_checked()
+    assert show_deck_sizes_checkbox.is_checked()
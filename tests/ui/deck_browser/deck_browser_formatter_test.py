@@ -4,14 +4,17 @@ from pathlib import Path
 
 import pytest
 from anki.collection import Collection
+from anki.notes import Note
 from aqt.theme import ThemeManager
 from bs4 import BeautifulSoup
 
+from note_size.cache.group_size_cache import GroupSizeCache
 from note_size.cache.item_id_cache import ItemIdCache
+from note_size.calculator.size_calculator import SizeCalculator
 from note_size.calculator.size_formatter import SizeFormatter
 from note_size.ui.deck_browser.deck_browser_formatter import DeckBrowserFormatter
 from note_size.ui.deck_browser.trash import Trash
-from note_size.common.types import MediaFile, SizeBytes
+from note_size.common.types import MediaFile, SizeBytes, SizeType
 from tests.data import Data, Digits
 
 web_path: str = os.path.join("_addons", "1188705668", "ui", "web")
@@ -64,6 +67,9 @@ def test_format_note_detailed_text(col: Collection, td: Data, deck_browser_forma
             Total:&nbsp;
             <span style='font-family:Consolas,monospace;display: inline-block;'>4.0</span>
             <span style="font-family:Consolas,monospace;display: inline-block;">KB</span>
+        <img height="12" onclick="pycmd(\'open-largest-items-action\')"
+         src="{info_black_png_path}" style="margin-right: 0.2em;"
+         title="Click to show largest notes and files"/>
         </span>
         <img height="12" onclick="pycmd('open-config-action')" 
         src="{settings_black_png_path}" title="Open Configuration"/>
@@ -113,6 +119,56 @@ def test_item_id_cache_not_initialized(col: Collection, td: Data, deck_browser_f
     assert exp.prettify() == act.prettify()
 
 
+def test_partially_filled_cache(col: Collection, td: Data, deck_browser_formatter: DeckBrowserFormatter,
+                                item_id_cache: ItemIdCache, size_calculator: SizeCalculator, media_trash_dir: Path):
+    item_id_cache.set_initialized(False)
+    td.write_file(MediaFile("unused_file.jpg"), "abc")
+    note: Note = td.create_note_with_files()
+    td.create_note_without_files()
+    size_calculator.get_note_size(note.id, SizeType.TOTAL, use_cache=True)
+    exp_html: str = f"""
+    <div>
+        <span style='margin-right: 0.5em;' title='Size of 2 notes in file "{col.path}"\nRevision log size: 4.0 KB (0 rows)'>
+            Collection:&nbsp;
+            <span style='font-family:Consolas,monospace;display: inline-block;'>4.0</span>&nbsp;&nbsp;&nbsp;
+            <span style="font-family:Consolas,monospace;display: inline-block;">KB</span>
+        </span>
+        <span style='margin-right: 0.5em;' 
+            title='Size of 3 media files (3 existing and 0 missing) used in 1 notes (not include Unused and Trash)\nFolder "{col.media.dir()}"\nCache is being filled: 50% of notes processed'>
+            Media:&nbsp;
+            <span style='font-family:Consolas,monospace;display: inline-block;'>21</span>&nbsp;&nbsp;&nbsp;
+            <span style="font-family:Consolas,monospace;display: inline-block;">B</span>
+            <span style='font-size: 80%'>⏳50%</span>
+        </span>
+        <span style='margin-right: 0.5em;' title='Size of ⏳ media files not used in any notes (can be moved to Trash)'>
+            Unused:&nbsp;
+            <span style='font-size: 80%'>⏳</span>&nbsp;&nbsp;&nbsp;
+         </span>
+        <span style='margin-right: 0.5em;' 
+            title='Size of 0 media files in the Trash (can be emptied)\nFolder "{media_trash_dir}"'>
+            Trash:&nbsp;
+            <span style='font-family:Consolas,monospace;display: inline-block;'>0</span>&nbsp;&nbsp;&nbsp;
+            <span style="font-family:Consolas,monospace;display: inline-block;">B</span>
+        <img height="12" onclick="pycmd(\'open-check-media-action\')"
+         src="{info_black_png_path}" style="margin-right: 0.2em;" 
+         title="Click to show details"/>
+         </span>
+        <span style='margin-right: 0.5em;' 
+            title='Total size of collection, media files, unused files and trash files\nCache is being filled: 50% of notes processed'>
+            Total:&nbsp;
+            <span style='font-family:Consolas,monospace;display: inline-block;'>4.0</span>
+            <span style="font-family:Consolas,monospace;display: inline-block;">KB</span>
+            <span style='font-size: 80%'>⏳50%</span>
+        </span>
+        <img height="12" onclick="pycmd('open-config-action')" 
+        src="{settings_black_png_path}" title="Open Configuration"/>
+    </div>
+    """
+    exp: BeautifulSoup = BeautifulSoup(exp_html, 'html.parser')
+    act: BeautifulSoup = BeautifulSoup(deck_browser_formatter.format_collection_size_html(), 'html.parser')
+    assert exp.prettify() == act.prettify()
+
+
 def test_empty_unused_and_trash(col: Collection, td: Data, deck_browser_formatter: DeckBrowserFormatter,
                                 item_id_cache: ItemIdCache, media_trash_dir: Path, trash: Trash):
     item_id_cache.set_initialized(True)
@@ -152,6 +208,9 @@ def test_empty_unused_and_trash(col: Collection, td: Data, deck_browser_formatte
             Total:&nbsp;
             <span style='font-family:Consolas,monospace;display: inline-block;'>4.0</span>
             <span style="font-family:Consolas,monospace;display: inline-block;">KB</span>
+        <img height="12" onclick="pycmd(\'open-largest-items-action\')"
+         src="{info_black_png_path}" style="margin-right: 0.2em;"
+         title="Click to show largest notes and files"/>
         </span>
         <img height="12" onclick="pycmd('open-config-action')" 
         src="{settings_black_png_path}" title="Open Configuration"/>
@@ -208,6 +267,9 @@ def test_format_note_detailed_text_night_mode(col: Collection, td: Data, deck_br
             Total:&nbsp;
             <span style='font-family:Consolas,monospace;display: inline-block;'>4.0</span>
             <span style="font-family:Consolas,monospace;display: inline-block;">KB</span>
+        <img height="12" onclick="pycmd(\'open-largest-items-action\')"
+         src="{info_white_png_path}" style="margin-right: 0.2em;"
+         title="Click to show largest notes and files"/>
         </span>
         <img height="12" onclick="pycmd('open-config-action')" 
         src="{settings_white_png_path}" title="Open Configuration"/>
@@ -218,6 +280,31 @@ def test_format_note_detailed_text_night_mode(col: Collection, td: Data, deck_br
     assert act_soup.prettify() == exp_soup.prettify()
 
 
+def test_format_deck_tree_html(col: Collection, td: Data, deck_browser_formatter: DeckBrowserFormatter,
+                               item_id_cache: ItemIdCache, group_size_cache: GroupSizeCache):
+    td.create_note_with_files()
+    deck_id: int = td.deck_id
+    tree_html: str = f"""<table><tr class='deck current' id='{deck_id}'><td class=decktd colspan=5>
+        <a class="deck " href=# onclick="return pycmd('open:{deck_id}')">Default</a></td></tr>
+        <tr class='deck' id='123'><td class=decktd colspan=5><a class="deck " href=#>Empty</a></td></tr></table>"""
+    item_id_cache.set_initialized(False)
+    assert deck_browser_formatter.format_deck_tree_html(tree_html) == tree_html
+    assert not deck_browser_formatter.is_deck_sizes_outdated()
+    item_id_cache.set_initialized(True)
+    assert deck_browser_formatter.format_deck_tree_html(tree_html) == tree_html
+    assert deck_browser_formatter.is_deck_sizes_outdated()
+    assert group_size_cache.refresh()
+    assert not deck_browser_formatter.is_deck_sizes_outdated()
+    exp_html: str = f"""<table><tr class='deck current' id='{deck_id}'><td class=decktd colspan=5>
+        <a class="deck " href=# onclick="return pycmd('open:{deck_id}')">Default</a><span 
+        style="font-size: 80%; margin-left: 0.5em; opacity: 0.7;" 
+        title="Size of 1 notes (including subdecks)\nTexts: 122 B, 3 files: 21 B">143 B</span></td></tr>
+        <tr class='deck' id='123'><td class=decktd colspan=5><a class="deck " href=#>Empty</a></td></tr></table>"""
+    exp_soup: BeautifulSoup = BeautifulSoup(exp_html, 'html.parser')
+    act_soup: BeautifulSoup = BeautifulSoup(deck_browser_formatter.format_deck_tree_html(tree_html), 'html.parser')
+    assert act_soup.prettify() == exp_soup.prettify()
+
+
 @pytest.mark.performance
 def test_bytes_to_str_performance(size_formatter: SizeFormatter):
     size_bytes: SizeBytes = SizeBytes(123_456_789)
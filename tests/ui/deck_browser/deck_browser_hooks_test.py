@@ -9,5 +9,6 @@ def test_setup_hooks(deck_browser_hooks: DeckBrowserHooks):
     deck_browser_hooks.setup_hooks()
     assert gui_hooks.deck_browser_will_render_content.count() == 1
     assert gui_hooks.webview_did_receive_js_message.count() == 1
+    assert gui_hooks.operation_did_execute.count() == 1
     deck_browser_hooks.remove_hooks()
     assert_no_hooks()
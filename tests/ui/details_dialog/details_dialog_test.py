@@ -1,8 +1,10 @@
-from anki.notes import Note
+from anki.notes import Note, NoteId
 from aqt.qt import QLabel
 from PyQtPath.path_chain_pyqt6 import path
+from pytestqt.qtbot import QtBot
 
 from note_size.ui.details_dialog.details_dialog import DetailsDialog
+from note_size.ui.details_dialog.details_model import DetailsModel
 from note_size.ui.details_dialog.files_table import FilesTable
 from tests.data import Data
 
@@ -20,8 +22,8 @@ def test_show_note_without_files(details_dialog: DetailsDialog, td: Data):
     assert path(details_dialog).label(0).get().text() == 'Total note size: 70 B'
     assert path(details_dialog).label(1).get().text() == 'Texts size: 70 B'
     assert path(details_dialog).label(2).get().text() == 'Size of 0 files (0 existing and 0 missing): 0 B'
-    files_table: FilesTable = path(details_dialog).table().get()
-    assert files_table.rowCount() == 0
+    files_table: FilesTable = path(details_dialog).child(FilesTable).get()
+    assert files_table.model().rowCount() == 0
     assert files_table.isHidden()
 
     note_with_file: Note = td.create_note_with_files()
@@ -29,14 +31,41 @@ def test_show_note_without_files(details_dialog: DetailsDialog, td: Data):
     assert path(details_dialog).label(0).get().text() == 'Total note size: 143 B'
     assert path(details_dialog).label(1).get().text() == 'Texts size: 122 B'
     assert path(details_dialog).label(2).get().text() == 'Size of 3 files (3 existing and 0 missing): 21 B'
-    files_table: FilesTable = path(details_dialog).table().get()
-    assert files_table.rowCount() == 3
+    files_table: FilesTable = path(details_dialog).child(FilesTable).get()
+    assert files_table.model().rowCount() == 3
     assert not files_table.isHidden()
 
     details_dialog.show_note(note_without_file)
     assert path(details_dialog).label(0).get().text() == 'Total note size: 70 B'
     assert path(details_dialog).label(1).get().text() == 'Texts size: 70 B'
     assert path(details_dialog).label(2).get().text() == 'Size of 0 files (0 existing and 0 missing): 0 B'
-    files_table: FilesTable = path(details_dialog).table().get()
-    assert files_table.rowCount() == 0
+    files_table: FilesTable = path(details_dialog).child(FilesTable).get()
+    assert files_table.model().rowCount() == 0
     assert files_table.isHidden()
+
+
+def test_show_notes(details_dialog: DetailsDialog, td: Data, qtbot: QtBot):
+    note_with_files: Note = td.create_note_with_files()
+    note_without_files: Note = td.create_note_without_files()
+    note_ids: list[NoteId] = [note_with_files.id, note_without_files.id]
+    generation: int = details_dialog.show_notes(note_ids)
+    assert path(details_dialog).label(0).get().text() == 'Calculating size of 2 notes...'
+    files_table: FilesTable = path(details_dialog).child(FilesTable).get()
+    assert files_table.model().rowCount() == 0
+    model: DetailsModel = details_dialog.prepare_show_notes(generation, note_ids)
+    qtbot.waitUntil(lambda: files_table.model().rowCount() == 3)
+    assert not files_table.isHidden()
+    details_dialog.show_notes_model(generation, model)
+    assert path(details_dialog).label(0).get().text() == 'Total size of 2 notes: 213 B'
+
+
+def test_skip_files_of_outdated_notes(details_dialog: DetailsDialog, td: Data, qtbot: QtBot):
+    note_with_files: Note = td.create_note_with_files()
+    outdated_generation: int = details_dialog.show_notes([note_with_files.id])
+    details_dialog.show_notes([])
+    model: DetailsModel = details_dialog.prepare_show_notes(outdated_generation, [note_with_files.id])
+    details_dialog.show_notes_model(outdated_generation, model)
+    qtbot.wait(100)
+    files_table: FilesTable = path(details_dialog).child(FilesTable).get()
+    assert files_table.model().rowCount() == 0
+    assert path(details_dialog).label(0).get().text() == 'Calculating size of 0 notes...'
@@ -1,4 +1,4 @@
-from anki.notes import Note
+from anki.notes import Note, NoteId
 
 from note_size.common.types import SizeBytes, FileSize
 from note_size.ui.details_dialog.details_model import DetailsModel
@@ -15,3 +15,17 @@ def test_prepare_note_model(details_model_filler: DetailsModelFiller, td: Data):
     assert model.file_sizes == {MediaFiles.animation: FileSize(SizeBytes(9)),
                                 MediaFiles.picture: FileSize(SizeBytes(7)),
                                 MediaFiles.sound: FileSize(SizeBytes(5))}
+
+
+
+def test_prepare_notes_model(details_model_filler: DetailsModelFiller, td: Data):
+    note_with_files: Note = td.create_note_with_files()
+    note_without_files: Note = td.create_note_without_files()
+    note_ids: list[NoteId] = [note_with_files.id, note_without_files.id]
+    model: DetailsModel = details_model_filler.prepare_notes_model(note_ids)
+    assert model.total_note_size_text == 'Total size of 2 notes: 213 B'
+    assert model.texts_note_size_text == 'Texts size of 2 notes: 192 B'
+    assert model.files_note_size_text == 'Size of 3 files (3 existing and 0 missing) in 2 notes: 21 B'
+    assert model.file_sizes == {MediaFiles.animation: FileSize(SizeBytes(9)),
+                                MediaFiles.picture: FileSize(SizeBytes(7)),
+                                MediaFiles.sound: FileSize(SizeBytes(5))}
@@ -0,0 +1,57 @@
+from aqt.qt import Qt, QIcon
+from pytestqt.qtbot import QtBot
+
+from note_size.calculator.size_formatter import SizeFormatter
+from note_size.config.config import Config
+from note_size.common.types import MediaFile, FileSize, SizeBytes, FileType
+from note_size.ui.details_dialog.file_type_helper import FileTypeHelper
+from note_size.ui.details_dialog.files_table_model import FilesTableModel
+
+
+def test_add_files(qtbot: QtBot, file_type_helper: FileTypeHelper, size_formatter: SizeFormatter, config: Config):
+    model: FilesTableModel = __create_model(file_type_helper, size_formatter, config)
+    model.add_files({MediaFile("a.png"): FileSize(SizeBytes(2000)), MediaFile("b.mp3"): FileSize(SizeBytes(10))})
+    model.add_files({MediaFile("c.mp4"): FileSize(SizeBytes(300)),
+                     MediaFile("d.txt"): FileSize(SizeBytes(0), exists=False)})
+    assert model.rowCount() == 4
+    assert __column(model, FilesTableModel.filename_column) == ["a.png", "c.mp4", "b.mp3", "d.txt"]
+    assert __column(model, FilesTableModel.size_column) == ["2.0 KB", "300 B", "10 B", "❌"]
+    assert model.data(model.index(3, FilesTableModel.size_column), Qt.ItemDataRole.ToolTipRole) is not None
+    assert model.data(model.index(0, FilesTableModel.size_column), Qt.ItemDataRole.ToolTipRole) is None
+    assert model.headerData(1, Qt.Orientation.Vertical) == "2"
+
+
+def test_sort(qtbot: QtBot, file_type_helper: FileTypeHelper, size_formatter: SizeFormatter, config: Config):
+    model: FilesTableModel = __create_model(file_type_helper, size_formatter, config)
+    model.add_files({MediaFile("b.mp3"): FileSize(SizeBytes(10)), MediaFile("a.png"): FileSize(SizeBytes(2000)),
+                     MediaFile("y.txt"): FileSize(SizeBytes(0), exists=False),
+                     MediaFile("x.txt"): FileSize(SizeBytes(0), exists=False)})
+    model.sort(FilesTableModel.filename_column, Qt.SortOrder.AscendingOrder)
+    assert __column(model, FilesTableModel.filename_column) == ["a.png", "b.mp3", "x.txt", "y.txt"]
+    model.sort(FilesTableModel.size_column, Qt.SortOrder.AscendingOrder)
+    assert __column(model, FilesTableModel.filename_column) == ["y.txt", "x.txt", "b.mp3", "a.png"]
+    model.sort(FilesTableModel.size_column, Qt.SortOrder.DescendingOrder)
+    assert __column(model, FilesTableModel.filename_column) == ["a.png", "b.mp3", "x.txt", "y.txt"]
+    model.sort(FilesTableModel.icon_column, Qt.SortOrder.AscendingOrder)
+    assert __column(model, FilesTableModel.filename_column)[:2] == ["x.txt", "y.txt"]
+    model.add_files({MediaFile("c.mp4"): FileSize(SizeBytes(300))})
+    assert __column(model, FilesTableModel.filename_column)[2:] == ["a.png", "b.mp3", "c.mp4"]
+
+
+def test_clear(qtbot: QtBot, file_type_helper: FileTypeHelper, size_formatter: SizeFormatter, config: Config):
+    model: FilesTableModel = __create_model(file_type_helper, size_formatter, config)
+    model.add_files({MediaFile("a.png"): FileSize(SizeBytes(2000))})
+    model.clear()
+    assert model.rowCount() == 0
+    model.add_files({MediaFile("b.mp3"): FileSize(SizeBytes(10))})
+    assert __column(model, FilesTableModel.filename_column) == ["b.mp3"]
+
+
+def __create_model(file_type_helper: FileTypeHelper, size_formatter: SizeFormatter,
+                   config: Config) -> FilesTableModel:
+    icons: dict[FileType, QIcon] = {file_type: QIcon() for file_type in FileType}
+    return FilesTableModel(file_type_helper, size_formatter, icons, config)
+
+
+def __column(model: FilesTableModel, column: int) -> list[str]:
+    return [model.data(model.index(row, column)) for row in range(model.rowCount())]
@@ -1,7 +1,25 @@
+from typing import Any, Callable
+
+from anki.notes import Note
 from aqt import gui_hooks
+from aqt.qt import QWidget
+from aqt.theme import ThemeManager
+from mock.mock import MagicMock
+from pytestqt.qtbot import QtBot
 
+from note_size.config.config import Config
 from note_size.ui.editor.button.editor_button_hooks import EditorButtonHooks
 from tests.conftest import assert_no_hooks
+from tests.data import Data, DefaultFields, Colors, MediaFiles, FileContents
+
+
+class _WebView(QWidget):
+    def __init__(self) -> None:
+        super().__init__()
+        self.scripts: list[str] = []
+
+    def evalWithCallback(self, js: str, _: Callable[[Any], None]) -> None:
+        self.scripts.append(js)
 
 
 def test_setup_hooks_enabled(editor_button_hooks: EditorButtonHooks):
@@ -16,3 +34,89 @@ def test_setup_hooks_enabled(editor_button_hooks: EditorButtonHooks):
     assert gui_hooks.focus_did_change.count() == 1
     editor_button_hooks.remove_hooks()
     assert_no_hooks()
+
+
+def test_refresh_size_button_coalesced(qtbot: QtBot, editor_button_hooks: EditorButtonHooks, td: Data):
+    editor_button_hooks.setup_hooks()
+    web: _WebView = _WebView()
+    qtbot.addWidget(web)
+    web.show()
+    note: Note = td.create_note_with_files()
+    editor: MagicMock = MagicMock()
+    editor.web = web
+    editor.addMode = False
+    editor.note = note
+    gui_hooks.editor_did_init(editor)
+    gui_hooks.editor_did_fire_typing_timer(note)
+    gui_hooks.editor_did_unfocus_field(False, note, 0)
+    qtbot.waitUntil(lambda: len(web.scripts) == 1)
+    assert "143 B" in web.scripts[0]
+    gui_hooks.editor_did_fire_typing_timer(note)
+    qtbot.wait(100)
+    assert len(web.scripts) == 1
+    note[DefaultFields.front_field_name] = "Changed"
+    gui_hooks.editor_did_fire_typing_timer(note)
+    qtbot.waitUntil(lambda: len(web.scripts) == 2)
+    assert "86 B" in web.scripts[1]
+
+
+def test_refresh_size_button_on_config_changed(qtbot: QtBot, editor_button_hooks: EditorButtonHooks, td: Data,
+                                               config: Config):
+    editor_button_hooks.setup_hooks()
+    web: _WebView = _WebView()
+    qtbot.addWidget(web)
+    web.show()
+    note: Note = td.create_note_with_files()
+    editor: MagicMock = MagicMock()
+    editor.web = web
+    editor.addMode = False
+    editor.note = note
+    gui_hooks.editor_did_init(editor)
+    qtbot.waitUntil(lambda: len(web.scripts) == 1)
+    assert "143 B" in web.scripts[0]
+    assert Colors.pale_green in web.scripts[0]
+    config.set_size_button_color_enabled(False)
+    config.fire_config_changed()
+    qtbot.waitUntil(lambda: len(web.scripts) == 2)
+    assert "143 B" in web.scripts[1]
+    assert Colors.pale_green not in web.scripts[1]
+
+
+def test_refresh_size_button_on_night_mode_changed(qtbot: QtBot, editor_button_hooks: EditorButtonHooks, td: Data,
+                                                   theme_manager: ThemeManager):
+    editor_button_hooks.setup_hooks()
+    web: _WebView = _WebView()
+    qtbot.addWidget(web)
+    web.show()
+    note: Note = td.create_note_with_files()
+    editor: MagicMock = MagicMock()
+    editor.web = web
+    editor.addMode = False
+    editor.note = note
+    gui_hooks.editor_did_init(editor)
+    qtbot.waitUntil(lambda: len(web.scripts) == 1)
+    assert Colors.pale_green in web.scripts[0]
+    theme_manager.set_night_mode(True)
+    gui_hooks.editor_did_fire_typing_timer(note)
+    qtbot.waitUntil(lambda: len(web.scripts) == 2)
+    assert "143 B" in web.scripts[1]
+    assert Colors.dark_green in web.scripts[1]
+
+
+def test_refresh_size_button_on_file_replaced(qtbot: QtBot, editor_button_hooks: EditorButtonHooks, td: Data):
+    editor_button_hooks.setup_hooks()
+    web: _WebView = _WebView()
+    qtbot.addWidget(web)
+    web.show()
+    note: Note = td.create_note_with_files()
+    editor: MagicMock = MagicMock()
+    editor.web = web
+    editor.addMode = False
+    editor.note = note
+    gui_hooks.editor_did_init(editor)
+    qtbot.waitUntil(lambda: len(web.scripts) == 1)
+    assert "143 B" in web.scripts[0]
+    td.write_file(MediaFiles.picture, f"{FileContents.picture} replaced")
+    gui_hooks.focus_did_change(None, None)
+    qtbot.waitUntil(lambda: len(web.scripts) == 2)
+    assert "152 B" in web.scripts[1]